@@ -1,52 +1,95 @@
-from collections import ChainMap
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from functools import wraps
+from string import Formatter
 from typing import Any
 
 from fastapi import HTTPException, Request
 from starlette.datastructures import State
 
-from amt.api.utils import SafeDict
+from amt.core.authorization import verbs_mask
 from amt.core.exceptions import AMTPermissionDenied
+from amt.repositories.organizations import organization_slug_cache
 from amt.services.organizations import OrganizationsService
 from amt.services.services_provider import ServicesProvider
 
+TemplateParts = tuple[tuple[str, str | None], ...]
 
-def permission(permissions: dict[str, list[str]]) -> Callable[[Callable[..., Any]], Callable[..., Any]]:  # noqa C901
-    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:  # noqa C901
+
+class CompiledPermission:
+    """
+    A permission template with its required verbs, parsed once when a route is defined.
+
+    The template is split into literal text and field names, so the resource of a request is built by
+    joining strings, and the required verbs are a bitmask that is compared with the granted verbs.
+    Templates using the organization slug also get a variant using the organization id, as permissions
+    are granted on the organization id.
+    """
+
+    def __init__(self, template: str, verbs: list[str]) -> None:
+        self.parts = self._parse(template)
+        self.uses_slug = "organization_slug" in template
+        self.id_parts = self._parse(template.replace("organization_slug", "organization_id"))
+        self.mask = verbs_mask(verbs, required=True)
+
+    @staticmethod
+    def _parse(template: str) -> TemplateParts:
+        return tuple((literal, field) for literal, field, _, _ in Formatter().parse(template))
+
+    def resource(self, values: Mapping[str, Any], by_id: bool = False) -> str:
+        """
+        Returns the resource for the given values. Fields without a value are kept as a replacement field.
+        """
+        parts = self.id_parts if by_id else self.parts
+        return "".join(
+            literal + ("" if field is None else str(values[field]) if field in values else "{" + field + "}")
+            for literal, field in parts
+        )
+
+    def is_granted(self, permissions: Mapping[str, list[str]], resource: str) -> bool:
+        if resource not in permissions:
+            return False
+        return not self.mask & ~verbs_mask(permissions[resource])
+
+
+def permission(permissions: dict[str, list[str]]) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    compiled_permissions = [CompiledPermission(template, verbs) for template, verbs in permissions.items()]
+    uses_slug = any(compiled_permission.uses_slug for compiled_permission in compiled_permissions)
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401 C901
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
             if not isinstance(kwargs.get("request"), Request):  # todo:  change exception to custom exception
                 raise HTTPException(status_code=400, detail="Request object is missing")
             request: Request[State] = kwargs["request"]
 
-            organization_slug_resolved = False
-            extra_arguments: dict[str, Any] = {}
-            for permission, verbs in permissions.items():
-                # convert organization_slug to id if required
-                if "organization_slug" in kwargs and "organization_slug" in permission:
-                    if "organization_id" in kwargs:
-                        permission = permission.replace("organization_slug", "organization_id")
-                    else:
-                        if not organization_slug_resolved:
-                            service_provider = ServicesProvider()
-                            async with service_provider.session_scope():
-                                organization_service = await service_provider.get(OrganizationsService)
-                                organization = await organization_service.find_by_slug(kwargs["organization_slug"])
-                                extra_arguments["organization_id"] = organization.id
-                                organization_slug_resolved = True
-                        permission = permission.replace("organization_slug", "organization_id")
-
-                permission = permission.format_map(SafeDict(ChainMap(kwargs, extra_arguments)))
-                request_permissions: dict[str, list[str]] = getattr(request.state, "permissions", {})
-                if permission not in request_permissions:
+            values: Mapping[str, Any] = kwargs
+            # convert organization_slug to id if required
+            by_id = uses_slug and "organization_slug" in kwargs
+            if by_id and "organization_id" not in kwargs:
+                values = {**kwargs, "organization_id": await resolve_organization_id(kwargs["organization_slug"])}
+
+            request_permissions: dict[str, list[str]] = getattr(request.state, "permissions", {})
+            for compiled_permission in compiled_permissions:
+                resource = compiled_permission.resource(values, by_id and compiled_permission.uses_slug)
+                if not compiled_permission.is_granted(request_permissions, resource):
                     raise AMTPermissionDenied()
-                for verb in verbs:
-                    if verb not in request_permissions[permission]:
-                        raise AMTPermissionDenied()
 
             return await func(*args, **kwargs)
 
         return wrapper
 
     return decorator
+
+
+async def resolve_organization_id(organization_slug: str) -> int:
+    """
+    Returns the id of the organization with the given slug, only opening a database session if the slug
+    is not in the slug cache. Within a request this uses the session of the request.
+    """
+    organization_id = organization_slug_cache.get(organization_slug)
+    if organization_id is not None:
+        return organization_id
+    service_provider = ServicesProvider()
+    async with service_provider.session_scope():
+        organization_service = await service_provider.get(OrganizationsService)
+        return await organization_service.find_id_by_slug(organization_slug)
@@ -24,7 +24,7 @@ from amt.api.editable_classes import EditModes, ResolvedEditable
 from amt.api.editable_enforcers import EditableEnforcerMustHaveMaintainer
 from amt.api.editable_route_utils import create_editable_for_role, get_user_id_or_error, update_handler
 from amt.api.forms.algorithm import get_algorithm_members_form
-from amt.api.forms.measure import MeasureStatusOptions, get_measure_form
+from amt.api.forms.measure import get_measure_form
 from amt.api.lifecycles import Lifecycles, get_localized_lifecycles
 from amt.api.navigation import (
     BaseNavigationItem,
@@ -33,7 +33,7 @@ from amt.api.navigation import (
     resolve_base_navigation_items,
     resolve_navigation_items,
 )
-from amt.api.routes.shared import get_filters_and_sort_by, replace_none_with_empty_string_inplace
+from amt.api.routes.shared import PAGE_SIZE, get_filters_and_sort_by, replace_none_with_empty_string_inplace
 from amt.core.authorization import AuthorizationResource, AuthorizationType, AuthorizationVerb
 from amt.core.exceptions import AMTError, AMTNotFound, AMTPermissionDenied, AMTRepositoryError
 from amt.core.internationalization import get_current_translation
@@ -49,10 +49,10 @@ from amt.schema.task import DisplayTask, MovedTask
 from amt.schema.user import User as UserSchema
 from amt.services.algorithms import AlgorithmsService
 from amt.services.authorization import AuthorizationsService
-from amt.services.instruments_and_requirements_state import InstrumentStateService, RequirementsStateService
 from amt.services.measures import measures_service
 from amt.services.object_storage import ObjectStorageService, create_object_storage_service
 from amt.services.organizations import OrganizationsService
+from amt.services.requirement_states import RequirementStates, get_requirement_graph
 from amt.services.requirements import requirements_service
 from amt.services.services_provider import ServicesProvider, get_service_provider
 from amt.services.tasks import TasksService
@@ -62,27 +62,30 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-async def get_instrument_state(system_card: SystemCard) -> dict[str, Any]:
-    instrument_state = InstrumentStateService(system_card)
-    instrument_states = await instrument_state.get_state_per_instrument()
-    return {
-        "instrument_states": instrument_states,
-        "count_0": instrument_state.get_amount_completed_instruments(),
-        "count_1": instrument_state.get_amount_total_instruments(),
-    }
-
-
-async def get_requirements_state(system_card: SystemCard) -> dict[str, Any]:
-    requirements = await requirements_service.fetch_requirements(
-        [requirement.urn for requirement in system_card.requirements]
+async def get_requirements_state(algorithm: Algorithm, limit: int | None = None) -> dict[str, Any]:
+    """
+    Returns the progress of the requirements from the progress counters of the algorithm, with the names and
+    states of the first requirements. Only the names of these requirements are fetched from the task registry.
+    :param algorithm: the algorithm
+    :param limit: the number of requirements to include, all requirements if None
+    """
+    requirement_tasks = algorithm.system_card.requirements[:limit]
+    requirements = (
+        await requirements_service.fetch_requirements([requirement_task.urn for requirement_task in requirement_tasks])
+        if requirement_tasks
+        else []
     )
-    requirements_state_service = RequirementsStateService(system_card)
-    requirements_state = requirements_state_service.get_requirements_state(requirements)
+    names = {requirement.urn: requirement.name for requirement in requirements}
+    progress = algorithm.progress
 
     return {
-        "states": requirements_state,
-        "count_0": requirements_state_service.get_amount_completed_requirements(),
-        "count_1": requirements_state_service.get_amount_total_requirements(),
+        "states": [
+            {"name": names[requirement_task.urn], "state": requirement_task.state, "urn": requirement_task.urn}
+            for requirement_task in requirement_tasks
+            if requirement_task.urn in names
+        ],
+        "count_0": progress.requirements_completed,
+        "count_1": progress.requirements_total,
     }
 
 
@@ -266,16 +269,23 @@ async def resolve_and_enrich_measures(
     """
     enriched_resolved_measures: dict[str, DisplayMeasureTask] = {}
     resolved_measures = await measures_service.fetch_measures(list(urns))
+    system_measures = {
+        resolved_measure.urn: system_measure
+        for resolved_measure in resolved_measures
+        if (system_measure := find_measure_task(algorithm.system_card, resolved_measure.urn)) is not None
+    }
+    # all persons of all measures are found with one query
+    users = await users_service.find_by_ids(
+        person.uuid for system_measure in system_measures.values() for person in get_measure_persons(system_measure)
+    )
     for resolved_measure in resolved_measures:
-        system_measure = find_measure_task(algorithm.system_card, resolved_measure.urn)
+        system_measure = system_measures.get(resolved_measure.urn)
         if system_measure is not None and system_measure.urn not in enriched_resolved_measures:
             all_users: list[UserSchema] = []
-            for person_type in ["responsible_persons", "reviewer_persons", "accountable_persons"]:
-                persons = getattr(system_measure, person_type, [])
-                for person in persons if persons is not None else []:
-                    user = UserSchema.create_from_model(await users_service.find_by_id(person.uuid))
-                    if user is not None:
-                        all_users.append(user)
+            for person in get_measure_persons(system_measure):
+                user = UserSchema.create_from_model(users.get(UUID(person.uuid)))
+                if user is not None:
+                    all_users.append(user)
             measure_task_display = DisplayMeasureTask(
                 name=resolved_measure.name,
                 description=resolved_measure.description,
@@ -290,73 +300,134 @@ async def resolve_and_enrich_measures(
     return enriched_resolved_measures
 
 
-@router.patch("/{algorithm_id}/move_task")
-@permission({AuthorizationResource.ALGORITHM_SYSTEMCARD: [AuthorizationVerb.UPDATE]})
-async def move_task(
-    request: Request,
-    algorithm_id: int,
-    moved_task: MovedTask,
-    services_provider: Annotated[ServicesProvider, Depends(get_service_provider)],
-) -> HTMLResponse:
-    algorithms_service = await services_provider.get(AlgorithmsService)
-    users_service = await services_provider.get(UsersService)
-    tasks_service = await services_provider.get(TasksService)
+def clear_empty_siblings(moved_task: MovedTask) -> MovedTask:
     # because htmx form always sends a value and siblings are optional, we use -1 for None and convert it here
-
     if moved_task.next_sibling_id == -1:
         moved_task.next_sibling_id = None
     if moved_task.previous_sibling_id == -1:
         moved_task.previous_sibling_id = None
+    return moved_task
 
-    task = await tasks_service.move_task(
-        moved_task.id,
-        moved_task.status_id,
-        moved_task.previous_sibling_id,
-        moved_task.next_sibling_id,
+
+async def move_and_display_tasks(
+    request: Request,
+    algorithm_id: int,
+    moved_tasks: Sequence[MovedTask],
+    services_provider: ServicesProvider,
+) -> list[DisplayTask]:
+    """
+    Moves the given tasks of the algorithm and returns them for display. The states of moved measures are
+    updated in the system card, which is only loaded when measures were moved.
+    """
+    tasks_service = await services_provider.get(TasksService)
+    tasks = await tasks_service.move_tasks(
+        [clear_empty_siblings(moved_task) for moved_task in moved_tasks], algorithm_id=algorithm_id
     )
 
+    measure_urns = {task.type_id for task in tasks if task.type == TaskType.MEASURE and task.type_id is not None}
+    if not measure_urns:
+        return [DisplayTask.create_from_model(task) for task in tasks]
+
+    algorithms_service = await services_provider.get(AlgorithmsService)
     algorithm = await get_algorithm_or_error(algorithm_id, algorithms_service, request)
+    states = {moved_task.id: status_mapper[Status(moved_task.status_id)] for moved_task in moved_tasks}
+    await update_moved_measures(algorithm, tasks, states, algorithms_service)
 
-    if task.type == TaskType.MEASURE and task.type_id is not None:
-        measure_task = get_measure_task_or_error(algorithm.system_card, task.type_id)
-        measure_task.update(state=status_mapper[Status(moved_task.status_id)])
+    resolved_measures = await resolve_and_enrich_measures(
+        algorithm, measure_urns, await services_provider.get(UsersService)
+    )
+    return get_display_tasks(tasks, resolved_measures)
 
-        await update_requirements_state(algorithm, measure_task.urn)
 
+async def update_moved_measures(
+    algorithm: Algorithm, tasks: Sequence[Task], states: dict[int, str], algorithms_service: AlgorithmsService
+) -> None:
+    """
+    Sets the state of the measures of the moved tasks and updates their requirements. The algorithm is
+    only saved when the state of a measure changed.
+    :param states: the new measure state by task id
+    """
+    changed_measure_urns: list[str] = []
+    for task in tasks:
+        if task.type == TaskType.MEASURE and task.type_id is not None:
+            measure_task = get_measure_task_or_error(algorithm.system_card, task.type_id)
+            if measure_task.state != states[task.id]:
+                measure_task.update(state=states[task.id])
+                changed_measure_urns.append(measure_task.urn)
+
+    if changed_measure_urns:
+        requirement_states = RequirementStates(await get_requirement_graph(changed_measure_urns), algorithm.system_card)
+        for measure_urn in changed_measure_urns:
+            await update_requirements_state(algorithm, measure_urn, requirement_states)
         await algorithms_service.update(algorithm)
 
-        unique_resolved_measures: dict[str, DisplayMeasureTask] = await resolve_and_enrich_measures(
-            algorithm, {measure_task.urn}, users_service
-        )
-        resolved_measure: DisplayMeasureTask | None = unique_resolved_measures.get(measure_task.urn)
-        if resolved_measure is None:
-            raise AMTError(f"No measure found for {measure_task.urn}")
 
-        display_task: DisplayTask = DisplayTask.create_from_model(task, resolved_measure)
-    else:
-        display_task: DisplayTask = DisplayTask.create_from_model(task)
+def get_display_tasks(tasks: Sequence[Task], resolved_measures: dict[str, DisplayMeasureTask]) -> list[DisplayTask]:
+    display_tasks: list[DisplayTask] = []
+    for task in tasks:
+        if task.type == TaskType.MEASURE and task.type_id is not None:
+            resolved_measure = resolved_measures.get(task.type_id)
+            if resolved_measure is None:
+                raise AMTError(f"No measure found for {task.type_id}")
+            display_tasks.append(DisplayTask.create_from_model(task, resolved_measure))
+        else:
+            display_tasks.append(DisplayTask.create_from_model(task))
+    return display_tasks
+
+
+@router.patch("/{algorithm_id}/move_task")
+@permission({AuthorizationResource.ALGORITHM_SYSTEMCARD: [AuthorizationVerb.UPDATE]})
+async def move_task(
+    request: Request,
+    algorithm_id: int,
+    moved_task: MovedTask,
+    services_provider: Annotated[ServicesProvider, Depends(get_service_provider)],
+) -> HTMLResponse:
+    display_tasks = await move_and_display_tasks(request, algorithm_id, [moved_task], services_provider)
 
     context: dict[str, Any] = {
         "algorithm_id": algorithm_id,
         "permission_path": AuthorizationResource.ALGORITHM_SYSTEMCARD.format_map({"algorithm_id": algorithm_id}),
-        "task": display_task,
+        "task": display_tasks[0],
         "request": request,
     }
 
     return templates.TemplateResponse(request, "parts/task.html.j2", context=context)
 
 
+@router.patch("/{algorithm_id}/move_tasks")
+@permission({AuthorizationResource.ALGORITHM_SYSTEMCARD: [AuthorizationVerb.UPDATE]})
+async def move_tasks(
+    request: Request,
+    algorithm_id: int,
+    moved_tasks: list[MovedTask],
+    services_provider: Annotated[ServicesProvider, Depends(get_service_provider)],
+) -> HTMLResponse:
+    """
+    Moves several tasks at once, in the given order, and returns the content of their cards.
+    """
+    display_tasks = await move_and_display_tasks(request, algorithm_id, moved_tasks, services_provider)
+
+    context: dict[str, Any] = {
+        "algorithm_id": algorithm_id,
+        "permission_path": AuthorizationResource.ALGORITHM_SYSTEMCARD.format_map({"algorithm_id": algorithm_id}),
+        "tasks": display_tasks,
+        "request": request,
+    }
+
+    return templates.TemplateResponse(request, "parts/tasks.html.j2", context=context)
+
+
 async def get_algorithm_context(
     algorithm_id: int, algorithms_service: AlgorithmsService, request: Request
 ) -> tuple[Algorithm, dict[str, Any]]:
     algorithm = await get_algorithm_or_error(algorithm_id, algorithms_service, request)
-    instrument_state = await get_instrument_state(algorithm.system_card)
-    requirements_state = await get_requirements_state(algorithm.system_card)
+    # the details page shows the first 3 requirements
+    requirements_state = await get_requirements_state(algorithm, limit=3)
     tab_items = get_algorithm_details_tabs(request)
     return algorithm, {
         "last_edited": algorithm.last_edited,
         "system_card": algorithm.system_card,
-        "instrument_state": instrument_state,
         "requirements_state": requirements_state,
         "algorithm": algorithm,
         "algorithm_id": algorithm.id,
@@ -492,8 +563,6 @@ async def get_system_card(
 ) -> HTMLResponse:
     algorithms_service = await services_provider.get(AlgorithmsService)
     algorithm = await get_algorithm_or_error(algorithm_id, algorithms_service, request)
-    instrument_state = await get_instrument_state(algorithm.system_card)
-    requirements_state = await get_requirements_state(algorithm.system_card)
 
     editables = get_resolved_editables(context_variables={"algorithm_id": algorithm_id})
 
@@ -514,8 +583,6 @@ async def get_system_card(
     context = {
         "system_card": system_card,
         "permission_path": AuthorizationResource.ALGORITHM_SYSTEMCARD.format_map({"algorithm_id": algorithm.id}),
-        "instrument_state": instrument_state,
-        "requirements_state": requirements_state,
         "last_edited": algorithm.last_edited,
         "algorithm": algorithm,
         "algorithm_id": algorithm.id,
@@ -540,8 +607,6 @@ async def get_system_card_requirements(
     algorithms_service = await services_provider.get(AlgorithmsService)
 
     algorithm = await get_algorithm_or_error(algorithm_id, algorithms_service, request)
-    instrument_state = await get_instrument_state(algorithm.system_card)
-    requirements_state = await get_requirements_state(algorithm.system_card)
     tab_items = get_algorithm_details_tabs(request)
     filters, _, _, _ = await get_filters_and_sort_by(request, users_service)
     organization = await organizations_service.get_by_id(algorithm.organization_id)  # pyright: ignore [reportUnknownMemberType]
@@ -589,8 +654,6 @@ async def get_system_card_requirements(
 
     context = {
         "permission_path": AuthorizationResource.ALGORITHM_SYSTEMCARD.format_map({"algorithm_id": algorithm.id}),
-        "instrument_state": instrument_state,
-        "requirements_state": requirements_state,
         "algorithm": algorithm,
         "algorithm_id": algorithm.id,
         "tab_items": tab_items,
@@ -602,53 +665,54 @@ async def get_system_card_requirements(
     return templates.TemplateResponse(request, "algorithms/details_compliance.html.j2", context)
 
 
+def get_measure_persons(measure_task: MeasureTask, first_only: bool = False) -> list[Person]:
+    """
+    Returns the responsible, reviewer and accountable persons of the measure task, in that order.
+    :param measure_task: the measure task
+    :param first_only: only return the first person of each type
+    :return: the persons of the measure task
+    """
+    persons: list[Person] = []
+    for person_type in ["responsible_persons", "reviewer_persons", "accountable_persons"]:
+        person_list: list[Person] | None = getattr(measure_task, person_type, None)
+        if person_list:
+            persons.extend(person_list[:1] if first_only else person_list)
+    return persons
+
+
 async def get_measure_task_functions(
     measure_tasks: list[MeasureTask],
     users_service: Annotated[UsersService, Depends(UsersService)],
 ) -> dict[str, list[User]]:
     measure_task_functions: dict[str, list[User]] = defaultdict(list)
-
-    for measure_task in measure_tasks:
-        person_types = ["responsible_persons", "reviewer_persons", "accountable_persons"]
-        for person_type in person_types:
-            person_list = getattr(measure_task, person_type)
-            if person_list:
-                member = await users_service.find_by_id(person_list[0].uuid)
-                if member:
-                    measure_task_functions[measure_task.urn].append(member)
+    persons = {measure_task.urn: get_measure_persons(measure_task, first_only=True) for measure_task in measure_tasks}
+    # all persons of all measure tasks are found with one query
+    users = await users_service.find_by_ids(person.uuid for person_list in persons.values() for person in person_list)
+
+    for urn, person_list in persons.items():
+        for person in person_list:
+            member = users.get(UUID(person.uuid))
+            if member:
+                measure_task_functions[urn].append(member)
     return measure_task_functions
 
 
 def find_measure_task(system_card: SystemCard, urn: str) -> MeasureTask | None:
-    for measure in system_card.measures:
-        if measure.urn == urn:
-            return measure
-    return None
+    return system_card.find_measure(urn)
 
 
 def find_requirement_task(system_card: SystemCard, requirement_urn: str) -> RequirementTask | None:
-    for requirement in system_card.requirements:
-        if requirement.urn == requirement_urn:
-            return requirement
-    return None
+    return system_card.find_requirement(requirement_urn)
 
 
 async def find_requirement_tasks_by_measure_urn(system_card: SystemCard, measure_urn: str) -> list[RequirementTask]:
-    requirement_mapper: dict[str, RequirementTask] = {}
-    for requirement_task in system_card.requirements:
-        requirement_mapper[requirement_task.urn] = requirement_task
-
-    requirement_tasks: list[RequirementTask] = []
-    measure = await measures_service.fetch_measures(measure_urn)
-    for requirement_urn in measure[0].links:
+    graph = await get_requirement_graph([measure_urn])
+    return [
+        requirement_task
+        for requirement_urn in graph.requirements_of(measure_urn)
         # TODO: This is because measure are linked to too many requirement not applicable in our use case
-        if requirement_urn not in requirement_mapper:
-            continue
-
-        if len(await requirements_service.fetch_requirements(requirement_urn)) > 0:
-            requirement_tasks.append(requirement_mapper[requirement_urn])
-
-    return requirement_tasks
+        if (requirement_task := system_card.find_requirement(requirement_urn)) is not None
+    ]
 
 
 @router.delete("/{algorithm_id}")
@@ -810,39 +874,20 @@ async def update_measure_value(
     )
 
 
-async def update_requirements_state(algorithm: Algorithm, measure_urn: str) -> Algorithm:
+async def update_requirements_state(
+    algorithm: Algorithm, measure_urn: str, requirement_states: RequirementStates | None = None
+) -> Algorithm:
     """
     Update the state of requirements depending on the given measure. Note this method does not save the algorithm
     but returns the updated algorithm.
     :param algorithm: the algorithm to update
     :param measure_urn: the measure urn
+    :param requirement_states: the requirement states of the algorithm, to reuse when several measures change
     :return: the updated algorithm
     """
-    # update for the linked requirements the state based on all it's measures
-    requirement_tasks = await find_requirement_tasks_by_measure_urn(algorithm.system_card, measure_urn)
-    requirement_urns = [requirement_task.urn for requirement_task in requirement_tasks]
-    requirements = await requirements_service.fetch_requirements(requirement_urns)
-    state_order_list = set(MeasureStatusOptions)
-    for requirement in requirements:
-        state_count: dict[str, int] = {}
-        for link_measure_urn in requirement.links:
-            link_measure_task = find_measure_task(algorithm.system_card, link_measure_urn)
-            if link_measure_task:
-                state_count[link_measure_task.state] = state_count.get(link_measure_task.state, 0) + 1
-        requirement_task = find_requirement_task(algorithm.system_card, requirement.urn)
-        full_match = False
-        for state in state_order_list:
-            # if all measures are in the same state, the requirement is set to that state
-            if requirement_task and state_count.get(state, 0) == len(requirement.links):
-                requirement_task.state = state
-                full_match = True
-                break
-        # a requirement is considered 'in progress' if any measure is of any state other than todo
-        if requirement_task and not full_match:
-            if len([key for key in state_count if key != MeasureStatusOptions.TODO]) > 0:
-                requirement_task.state = MeasureStatusOptions.IN_PROGRESS
-            else:
-                requirement_task.state = MeasureStatusOptions.TODO
+    if requirement_states is None:
+        requirement_states = RequirementStates(await get_requirement_graph([measure_urn]), algorithm.system_card)
+    requirement_states.measure_changed(measure_urn)
     return algorithm
 
 
@@ -873,8 +918,6 @@ async def get_assessment_card(
 ) -> HTMLResponse:
     algorithms_service = await services_provider.get(AlgorithmsService)
     algorithm = await get_algorithm_or_error(algorithm_id, algorithms_service, request)
-    instrument_state = await get_instrument_state(algorithm.system_card)
-    requirements_state = await get_requirements_state(algorithm.system_card)
 
     request.state.path_variables.update({"assessment_card": assessment_card})
 
@@ -905,8 +948,6 @@ async def get_assessment_card(
     editables = get_resolved_editables(context_variables={"algorithm_id": algorithm_id})
 
     context = {
-        "instrument_state": instrument_state,
-        "requirements_state": requirements_state,
         "assessment_card": assessment_card_data,
         "last_edited": algorithm.last_edited,
         "sub_menu_items": sub_menu_items,
@@ -929,8 +970,6 @@ async def get_model_card(
     algorithms_service = await services_provider.get(AlgorithmsService)
     algorithm = await get_algorithm_or_error(algorithm_id, algorithms_service, request)
     request.state.path_variables.update({"model_card": model_card})
-    instrument_state = await get_instrument_state(algorithm.system_card)
-    requirements_state = await get_requirements_state(algorithm.system_card)
 
     tab_items = get_algorithm_details_tabs(request)
 
@@ -960,8 +999,6 @@ async def get_model_card(
 
     context = {
         "base_href": f"/algorithm/{algorithm_id}",
-        "instrument_state": instrument_state,
-        "requirements_state": requirements_state,
         "model_card": model_card_data,
         "last_edited": algorithm.last_edited,
         "breadcrumbs": breadcrumbs,
@@ -1048,8 +1085,8 @@ async def get_members(
     request: Request,
     algorithm_id: int,
     services_provider: Annotated[ServicesProvider, Depends(get_service_provider)],
-    skip: int = Query(0, ge=0),
-    limit: int = Query(5000, ge=1),  # todo: fix infinite scroll
+    limit: int = Query(PAGE_SIZE, ge=1),
+    cursor: str | None = Query(None),
     search: str = Query(""),
 ) -> HTMLResponse:
     request.state.services_provider = services_provider
@@ -1071,7 +1108,10 @@ async def get_members(
         sort_by["name"] = "ascending"
 
     filters: dict[str, int | str | list[str | int]] = {"type": AuthorizationType.ALGORITHM, "type_id": algorithm.id}
-    members = await authorizations_service.find_all(search, sort_by, filters, skip, limit)
+    page = await authorizations_service.page_all(limit, search, sort_by, filters, cursor)
+    members = page.items
+    # the total is only shown with the first page, the next pages only render rows
+    members_length = await authorizations_service.count_all(search, filters) if cursor is None else len(members)
 
     context: dict[str, Any] = {
         "base_href": f"/algorithm/{algorithm.id}",
@@ -1079,12 +1119,11 @@ async def get_members(
         "breadcrumbs": breadcrumbs,
         "tab_items": tab_items,
         "members": members,
-        "next": next,
-        "limit": limit,
-        "start": skip,
+        "cursor": cursor,
+        "next_cursor": page.next_cursor,
         "search": search,
         "sort_by": sort_by,
-        "members_length": len(members),
+        "members_length": members_length,
         "filters": localized_filters,
         "include_filters": False,
         "algorithm": algorithm,
@@ -1136,7 +1175,7 @@ async def get_users(
         "type": AuthorizationType.ORGANIZATION,
         "type_id": algorithm.organization_id,
     }
-    search_results = await authorizations_service.find_all(search=query, filters=filters, limit=25)
+    search_results = (await authorizations_service.page_all(limit=25, search=query, filters=filters)).items
 
     match return_type:
         case "search_select_field":
@@ -1,6 +1,5 @@
 import logging
-from copy import deepcopy
-from typing import Annotated, Any, cast
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import HTMLResponse
@@ -16,11 +15,10 @@ from amt.api.navigation import Navigation, resolve_base_navigation_items, resolv
 from amt.api.risk_group import (
     get_localized_risk_groups,
 )
-from amt.api.routes.shared import get_filters_and_sort_by
+from amt.api.routes.shared import PAGE_SIZE, get_filters_and_sort_by
 from amt.core.authorization import AuthorizationResource, AuthorizationVerb, get_user
 from amt.core.internationalization import get_current_translation
-from amt.models import Algorithm
-from amt.schema.algorithm import AlgorithmNew
+from amt.schema.algorithm import AlgorithmNew, AlgorithmSummary, LifecycleGroup
 from amt.schema.webform import WebForm
 from amt.services.algorithms import AlgorithmsService, get_template_files
 from amt.services.organizations import OrganizationsService
@@ -36,8 +34,9 @@ logger = logging.getLogger(__name__)
 async def get_root(
     request: Request,
     services_provider: Annotated[ServicesProvider, Depends(get_service_provider)],
-    skip: int = Query(0, ge=0),
-    limit: int = Query(5000, ge=1),  # todo: fix infinite scroll
+    limit: int | None = Query(None, ge=1),
+    cursor: str | None = Query(None),
+    group: str | None = Query(None),
     search: str = Query(""),
     display_type: str = Query(""),
 ) -> HTMLResponse:
@@ -47,10 +46,9 @@ async def get_root(
 
     filters["user_id"] = get_user_id_or_error(request)
 
-    algorithms, amount_algorithm_systems = await get_algorithms(
-        algorithms_service, display_type, filters, limit, request, search, skip, sort_by
+    algorithms, amount_algorithm_systems, next_cursor = await get_algorithms(
+        algorithms_service, display_type, filters, limit, request, search, sort_by, cursor, group
     )
-    next = skip + limit
 
     sub_menu_items = resolve_navigation_items([Navigation.ALGORITHMS_OVERVIEW], request)  # pyright: ignore [reportUnusedVariable] # noqa
     breadcrumbs = resolve_base_navigation_items([Navigation.ALGORITHMS_ROOT, Navigation.ALGORITHMS_OVERVIEW], request)
@@ -61,9 +59,9 @@ async def get_root(
         "algorithms": algorithms,
         "amount_algorithm_systems": amount_algorithm_systems,
         "permission_path": AuthorizationResource.ALGORITHMS,
-        "next": next,
-        "limit": limit,
-        "start": skip,
+        "cursor": cursor,
+        "next_cursor": next_cursor,
+        "group": group,
         "search": search,
         "lifecycles": get_localized_lifecycles(request),
         "risk_groups": get_localized_risk_groups(request),
@@ -86,43 +84,43 @@ async def get_algorithms(
     algorithms_service: AlgorithmsService,
     display_type: str,
     filters: dict[str, Any],
-    limit: int,
+    limit: int | None,
     request: Request,
     search: str,
-    skip: int,
     sort_by: dict[str, str],
-) -> tuple[dict[str, list[Algorithm]], int | Any]:
-    amount_algorithm_systems: int = 0
+    cursor: str | None = None,
+    group: str | None = None,
+) -> tuple[dict[str, LifecycleGroup] | list[AlgorithmSummary], int, str | None]:
+    """
+    Returns the algorithms to show, the total number of matching algorithms and the cursor of the next page.
+    The list and each lifecycle group are paged by cursor, the next page of a lifecycle group is the list
+    filtered on that lifecycle.
+    """
+    if display_type == "LIFECYCLE" and group is None:
+        # the first page of all lifecycles is fetched in a single query, with the lifecycle filter only that one
+        pages, counts = await algorithms_service.find_summaries_by_lifecycle(
+            limit=limit or PAGE_SIZE, search=search, filters=filters, sort=sort_by
+        )
+        algorithms = {
+            lifecycle.name: LifecycleGroup(page.items, page.next_cursor, counts[lifecycle.name])
+            if (page := pages.get(lifecycle.name))
+            else LifecycleGroup()
+            for lifecycle in Lifecycles
+        }
+        return algorithms, sum(counts.values()), None
 
     if display_type == "LIFECYCLE":
-        algorithms: dict[str, list[Algorithm]] = {}
-
-        # When the lifecycle filter is active, only show these algorithms
-        if "lifecycle" in filters:
-            for lifecycle in Lifecycles:
-                algorithms[lifecycle.name] = []
-            algorithms[cast(str, filters["lifecycle"])] = await algorithms_service.paginate(
-                skip=skip, limit=limit, search=search, filters=filters, sort=sort_by
-            )
-            amount_algorithm_systems += len(algorithms[cast(str, filters["lifecycle"])])
-        else:
-            for lifecycle in Lifecycles:
-                filters["lifecycle"] = lifecycle.name
-                algorithms[lifecycle.name] = await algorithms_service.paginate(
-                    skip=skip, limit=limit, search=search, filters=filters, sort=sort_by
-                )
-                amount_algorithm_systems += len(algorithms[lifecycle.name])
-    else:
-        algorithms = await algorithms_service.paginate(
-            skip=skip, limit=limit, search=search, filters=filters, sort=sort_by
-        )  # pyright: ignore [reportAssignmentType]
-        # todo: the lifecycle has to be 'localized', maybe for display 'Algorithm' should become a different object
-        # fixme: detach algorithms from the database to prevent commits back by the auto-commit
-        algorithms = deepcopy(algorithms)
-        for algorithm in algorithms:
-            algorithm.lifecycle = get_localized_lifecycle(algorithm.lifecycle, request)  # pyright: ignore [reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownArgumentType]
-        amount_algorithm_systems += len(algorithms)
-    return algorithms, amount_algorithm_systems
+        filters = {**filters, "lifecycle": group}
+    page = await algorithms_service.page_summaries(
+        limit=limit or PAGE_SIZE, search=search, filters=filters, sort=sort_by, cursor=cursor
+    )
+    # the summaries are detached from the database, so they can be localized in place
+    for summary in page.items:
+        if isinstance(summary.lifecycle, Lifecycles):
+            summary.lifecycle = get_localized_lifecycle(summary.lifecycle, request)
+    # the total is only shown with the first page, the next pages only render rows
+    amount = await algorithms_service.count(search=search, filters=filters) if cursor is None else len(page.items)
+    return page.items, amount, page.next_cursor
 
 
 @router.get("/new")
@@ -30,7 +30,7 @@ from amt.api.navigation import (
 from amt.api.organization_filter_options import OrganizationFilterOptions, get_localized_organization_filters
 from amt.api.risk_group import get_localized_risk_groups
 from amt.api.routes.algorithms import get_algorithms
-from amt.api.routes.shared import get_filters_and_sort_by
+from amt.api.routes.shared import PAGE_SIZE, get_filters_and_sort_by
 from amt.core.authorization import AuthorizationResource, AuthorizationType, AuthorizationVerb, get_user
 from amt.core.exceptions import AMTAuthorizationError, AMTNotFound, AMTRepositoryError
 from amt.core.internationalization import get_current_translation
@@ -142,8 +142,8 @@ async def get_new(
 async def root(
     request: Request,
     services_provider: Annotated[ServicesProvider, Depends(get_service_provider)],
-    skip: int = Query(0, ge=0),
-    limit: int = Query(5000, ge=1),  # todo: fix infinite scroll
+    limit: int = Query(PAGE_SIZE, ge=1),
+    cursor: str | None = Query(None),
     search: str = Query(""),
 ) -> HTMLResponse:
     organizations_repository = await services_provider.get_repository(OrganizationsRepository)
@@ -157,8 +157,16 @@ async def root(
         [Navigation.ORGANIZATIONS_ROOT, Navigation.ORGANIZATIONS_OVERVIEW], request
     )
     filters = {"organization-type": OrganizationFilterOptions.MY_ORGANIZATIONS.value}
-    organizations: Sequence[Organization] = await organizations_repository.find_by(
-        search=search, sort=sort_by, filters=filters, user_id=user["sub"] if user else None
+    user_id = user["sub"] if user else None
+    page = await organizations_repository.page_by(
+        limit=limit, search=search, sort=sort_by, filters=filters, user_id=user_id, cursor=cursor
+    )
+    organizations: Sequence[Organization] = page.items
+    # the total is only shown with the first page, the next pages only render rows
+    organizations_length = (
+        await organizations_repository.find_by_as_count(search=search, filters=filters, user_id=user_id)
+        if cursor is None
+        else len(organizations)
     )
     # TODO this is probably not the most efficient way to do this..
     #  also, we add an unknown attribute to organizations; this should/could be become a DTO
@@ -176,12 +184,11 @@ async def root(
     context: dict[str, Any] = {
         "breadcrumbs": breadcrumbs,
         "organizations": organizations,
-        "next": next,
-        "limit": limit,
-        "start": skip,
+        "cursor": cursor,
+        "next_cursor": page.next_cursor,
         "search": search,
         "sort_by": sort_by,
-        "organizations_length": len(organizations),
+        "organizations_length": organizations_length,
         "filters": localized_filters,
         "include_filters": False,
         "organization_filters": organization_filters,
@@ -369,8 +376,9 @@ async def show_algorithms(
     request: Request,
     services_provider: Annotated[ServicesProvider, Depends(get_service_provider)],
     organization_slug: str,
-    skip: int = Query(0, ge=0),
-    limit: int = Query(5000, ge=1),  # todo: fix infinite scroll
+    limit: int | None = Query(None, ge=1),
+    cursor: str | None = Query(None),
+    group: str | None = Query(None),
     search: str = Query(""),
     display_type: str = Query(""),
 ) -> HTMLResponse:
@@ -381,10 +389,9 @@ async def show_algorithms(
     filters, drop_filters, localized_filters, sort_by = await get_filters_and_sort_by(request, users_service)
 
     filters["organization-id"] = str(organization.id)
-    algorithms, amount_algorithm_systems = await get_algorithms(
-        algorithms_service, display_type, filters, limit, request, search, skip, sort_by
+    algorithms, amount_algorithm_systems, next_cursor = await get_algorithms(
+        algorithms_service, display_type, filters, limit, request, search, sort_by, cursor, group
     )
-    next = skip + limit
 
     tab_items = get_organization_tabs(request, organization_slug=organization_slug)
 
@@ -406,9 +413,9 @@ async def show_algorithms(
         "sub_menu_items": {},
         "algorithms": algorithms,
         "amount_algorithm_systems": amount_algorithm_systems,
-        "next": next,
-        "limit": limit,
-        "start": skip,
+        "cursor": cursor,
+        "next_cursor": next_cursor,
+        "group": group,
         "search": search,
         "lifecycles": get_localized_lifecycles(request),
         "risk_groups": get_localized_risk_groups(request),
@@ -548,8 +555,8 @@ async def get_members(
     request: Request,
     organization_slug: str,
     services_provider: Annotated[ServicesProvider, Depends(get_service_provider)],
-    skip: int = Query(0, ge=0),
-    limit: int = Query(5000, ge=1),  # todo: fix infinite scroll
+    limit: int = Query(PAGE_SIZE, ge=1),
+    cursor: str | None = Query(None),
     search: str = Query(""),
 ) -> HTMLResponse:
     request.state.services_provider = services_provider
@@ -575,7 +582,10 @@ async def get_members(
         "type": AuthorizationType.ORGANIZATION,
         "type_id": organization.id,
     }
-    members = await authorizations_service.find_all(search, sort_by, filters, skip, limit)
+    page = await authorizations_service.page_all(limit, search, sort_by, filters, cursor)
+    members = page.items
+    # the total is only shown with the first page, the next pages only render rows
+    members_length = await authorizations_service.count_all(search, filters) if cursor is None else len(members)
 
     context: dict[str, Any] = {
         "base_href": f"/organizations/{organization_slug}",
@@ -584,12 +594,11 @@ async def get_members(
         "breadcrumbs": breadcrumbs,
         "tab_items": tab_items,
         "members": members,
-        "next": next,
-        "limit": limit,
-        "start": skip,
+        "cursor": cursor,
+        "next_cursor": page.next_cursor,
         "search": search,
         "sort_by": sort_by,
-        "members_length": len(members),
+        "members_length": members_length,
         "filters": localized_filters,
         "include_filters": False,
         "organization_filters": get_localized_organization_filters(request),
@@ -27,6 +27,9 @@ from amt.schema.shared import IterMixin
 from amt.schema.webform_classes import WebFormOption
 from amt.services.users import UsersService
 
+# the number of rows per page of the overviews with infinite scroll
+PAGE_SIZE = 50
+
 
 async def get_filters_and_sort_by(
     request: Request, users_service: UsersService
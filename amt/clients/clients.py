@@ -1,16 +1,26 @@
+import asyncio
 import logging
 import sys
+import time
 from enum import StrEnum
-from typing import Any
+from typing import Any, cast
 
 import httpx
 from amt.core.config import get_settings
 from amt.core.exceptions import AMTInstrumentError, AMTNotFound
 from amt.schema.github import RepositoryContent
 from async_lru import alru_cache
+from prometheus_client import Gauge, Histogram  # pyright: ignore[reportMissingImports]
 
 logger = logging.getLogger(__name__)
 
+_api_request_duration = Histogram(  # pyright: ignore[reportUnknownVariableType]
+    "api_client_request_duration_seconds", "Duration of outgoing API client requests", ["client"]
+)
+_api_requests_in_flight = Gauge(  # pyright: ignore[reportUnknownVariableType]
+    "api_client_requests_in_flight", "Outgoing API client requests currently in flight", ["client"]
+)
+
 
 class TaskType(StrEnum):
     INSTRUMENTS = "instruments"
@@ -21,20 +31,76 @@ class TaskType(StrEnum):
 class APIClient:
     """
     Base API client with common HTTP functionality.
+
+    All requests share a long-lived, pooled client. It is created by `open` (called in the lifespan of the app),
+    or by the first request if the client was not opened yet.
     """
 
-    def __init__(self, base_url: str, max_retries: int = 3, timeout: int = 5) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        max_retries: int = 3,
+        timeout: int = 5,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        max_concurrency: int = 10,
+        http2: bool = True,
+    ) -> None:
         self.base_url = base_url
         self.max_retries = max_retries
         self.timeout = timeout
+        # all requests of a client go to the same host, so the pool limits are effectively per-host limits
+        self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections)
+        self.max_concurrency = max_concurrency
+        self.http2 = http2
+        self._client: httpx.AsyncClient | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._in_use = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self._client is not None
+
+    async def open(self) -> None:
+        if self._client is not None:
+            return
+        transport = httpx.AsyncHTTPTransport(retries=self.max_retries, limits=self.limits, http2=self.http2)
+        self._client = httpx.AsyncClient(timeout=self.timeout, transport=transport)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._semaphore = None
+
+    def pool_stats(self) -> dict[str, int]:
+        """
+        Returns the number of requests that currently use the connection pool and the maximum number of
+        connections of the pool. The requests are counted by the client itself.
+        """
+        return {"in_use": self._in_use, "max_connections": self.limits.max_connections or 0}
 
     async def _make_request(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        transport = httpx.AsyncHTTPTransport(retries=self.max_retries)
-        async with httpx.AsyncClient(timeout=self.timeout, transport=transport) as client:
-            response = await client.get(f"{self.base_url}/{endpoint}", params=params)
-            if response.status_code != 200:
-                raise AMTNotFound()
-            return response.json()
+        client_name = self.__class__.__name__
+        _api_requests_in_flight.labels(client_name).inc()  # pyright: ignore[reportUnknownMemberType]
+        start = time.perf_counter()
+        try:
+            if self._client is None:
+                await self.open()
+            client, semaphore = cast(httpx.AsyncClient, self._client), cast(asyncio.Semaphore, self._semaphore)
+            async with semaphore:
+                self._in_use += 1
+                try:
+                    response = await client.get(f"{self.base_url}/{endpoint}", params=params)
+                finally:
+                    self._in_use -= 1
+        finally:
+            _api_requests_in_flight.labels(client_name).dec()  # pyright: ignore[reportUnknownMemberType]
+            _api_request_duration.labels(client_name).observe(time.perf_counter() - start)  # pyright: ignore[reportUnknownMemberType]
+        if response.status_code != 200:
+            raise AMTNotFound()
+        return response.json()
 
 
 class TaskRegistryAPIClient(APIClient):
@@ -43,7 +109,16 @@ class TaskRegistryAPIClient(APIClient):
     """
 
     def __init__(self, max_retries: int = 3, timeout: int = 5) -> None:
-        super().__init__(base_url=get_settings().TASK_REGISTRY_URL, max_retries=max_retries, timeout=timeout)
+        settings = get_settings()
+        super().__init__(
+            base_url=settings.TASK_REGISTRY_URL,
+            max_retries=max_retries,
+            timeout=timeout,
+            max_connections=settings.TASK_REGISTRY_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.TASK_REGISTRY_MAX_KEEPALIVE_CONNECTIONS,
+            max_concurrency=settings.TASK_REGISTRY_MAX_CONCURRENCY,
+            http2=settings.TASK_REGISTRY_HTTP2,
+        )
 
     async def get_list_of_task(self, task: TaskType = TaskType.INSTRUMENTS) -> RepositoryContent:
         response_data = await self._make_request(f"{task.value}/")
@@ -15,6 +15,21 @@ class AuthorizationVerb(StrEnum):
     DELETE = "Delete"
 
 
+VERB_BITS: dict[str, int] = {verb: 1 << position for position, verb in enumerate(AuthorizationVerb)}
+# the bit of verbs that are not an AuthorizationVerb, which are never granted
+UNKNOWN_VERB_BIT = 1 << len(VERB_BITS)
+
+
+def verbs_mask(verbs: Iterable[str], required: bool = False) -> int:
+    """
+    Returns the bitmask of the given verbs. Unknown verbs are ignored, or can never be granted if required.
+    """
+    mask = 0
+    for verb in verbs:
+        mask |= VERB_BITS.get(verb, UNKNOWN_VERB_BIT if required else 0)
+    return mask
+
+
 class AuthorizationType(StrEnum):
     ALGORITHM = "Algorithm"
     ORGANIZATION = "Organization"
@@ -12,7 +12,13 @@ from pydantic_core import MultiHostUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from amt.core.exceptions import AMTSettingsError
-from amt.core.types import DatabaseSchemaType, EnvironmentType, LoggingLevelType
+from amt.core.types import (
+    DatabaseSchemaType,
+    EnvironmentType,
+    LoggingLevelType,
+    PermissionCacheBackendType,
+    SessionStoreBackendType,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +40,7 @@ class Settings(BaseSettings):
     LOGGING_CONFIG: dict[str, Any] | None = None
     LOG_TO_FILE: bool = False
     LOGFILE_LOCATION: Path = Path(tempfile.gettempdir())
+    REQUEST_LOG_SAMPLE_RATE: float = 1.0  # fraction of requests logged at DEBUG level
 
     DEBUG: bool = False
     AUTO_CREATE_SCHEMA: bool = False
@@ -57,6 +64,13 @@ class Settings(BaseSettings):
 
     APP_DATABASE_FILE: str = "/database.sqlite3"
 
+    APP_DATABASE_POOL_SIZE: int = 10
+    APP_DATABASE_MAX_OVERFLOW: int = 10
+    APP_DATABASE_POOL_RECYCLE_SECONDS: int = 30 * 60  # -1 disables recycling
+    APP_DATABASE_POOL_PRE_PING: bool = True
+    APP_DATABASE_POOL_TIMEOUT_SECONDS: float = 30
+    APP_DATABASE_SLOW_QUERY_SECONDS: float = 0.5
+
     model_config = SettingsConfigDict(extra="ignore", env_file=".env")
 
     # FastAPI CSRF Protect Settings
@@ -66,6 +80,13 @@ class Settings(BaseSettings):
     CSRF_COOKIE_SAMESITE: str = "strict"
 
     TASK_REGISTRY_URL: str = "https://task-registry.rijksapp.nl"
+    TASK_REGISTRY_MAX_CONNECTIONS: int = 20
+    TASK_REGISTRY_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    TASK_REGISTRY_MAX_CONCURRENCY: int = 10
+    TASK_REGISTRY_HTTP2: bool = True
+    TASK_REGISTRY_MIRROR_FILE: Path = Path(tempfile.gettempdir()) / "amt_task_registry_mirror.json"
+    TASK_REGISTRY_SYNC_INTERVAL_SECONDS: int = 60 * 60  # 0 disables the background synchronization
+    TASK_REGISTRY_PRECOMPUTE_PROFILES: bool = False
 
     ALGORITMEREGISTER_URL: str = "https://deployment-1-algor-dev.kind"
     ALGORITMEREGISTER_TOKEN_URL: str = "https://keycloak.kind/realms/algor-dev-local/protocol/openid-connect/token"  # noqa: S105
@@ -89,8 +110,17 @@ class Settings(BaseSettings):
 
     SESSION_COOKIE_NAME: str = "session_id"
     SESSION_TTL_SECONDS: int = 60 * 60  # 1 hour
+    SESSION_REFRESH_INTERVAL_SECONDS: int = 5 * 60  # unmodified sessions extend their TTL at most this often
     SESSION_CLEANUP_INTERVAL_SECONDS: int = 60
     SESSION_COOKIE_SECURE: bool = False
+    SESSION_STORE_BACKEND: SessionStoreBackendType = "memory"  # use redis to share sessions between workers
+    SESSION_STORE_REDIS_URL: str = "redis://localhost:6379/0"
+    SESSION_STORE_REDIS_MAX_CONNECTIONS: int = 20
+
+    PERMISSION_CACHE_BACKEND: PermissionCacheBackendType = "memory"  # shared is shared by all workers on a host
+    PERMISSION_CACHE_TTL_SECONDS: int = 60
+    PERMISSION_CACHE_MAX_SIZE: int = 1000  # 0 disables the in memory cache
+    PERMISSION_CACHE_FILE: Path = Path(tempfile.gettempdir()) / "amt_permission_cache.sqlite3"
 
     @computed_field
     def SQLALCHEMY_ECHO(self) -> bool:
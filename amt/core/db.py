@@ -1,15 +1,59 @@
 import logging
+import time
+from typing import Any
 
-from sqlalchemy import select
+from prometheus_client import Histogram  # pyright: ignore[reportMissingImports]
+from sqlalchemy import Connection, event, select
+from sqlalchemy.engine.interfaces import DBAPICursor, ExceptionContext, ExecutionContext
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
 
-from amt.core.config import get_settings
+from amt.core.config import Settings, get_settings
 from amt.models.base import Base
 
 logger = logging.getLogger(__name__)
 
 _engine: AsyncEngine | None = None
 
+_db_pool_checkout_wait = Histogram(  # pyright: ignore[reportUnknownVariableType]
+    "db_pool_checkout_wait_seconds",
+    "Time waited to check out a DB connection from the pool",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+_db_query_duration = Histogram(  # pyright: ignore[reportUnknownVariableType]
+    "db_query_duration_seconds",
+    "Duration of DB queries",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    A queue pool that records how long it takes to check out a connection, including waiting for a
+    connection to be returned to a full pool.
+    """
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            _db_pool_checkout_wait.observe(time.perf_counter() - start)  # pyright: ignore[reportUnknownMemberType]
+
+
+def get_pool_kwargs(settings: Settings) -> dict[str, Any]:
+    if settings.APP_DATABASE_SCHEME == "sqlite" and settings.APP_DATABASE_FILE.endswith(":memory:"):
+        # an in memory database only exists within a single connection, so it can not use a queue pool
+        return {}
+    return {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.APP_DATABASE_POOL_SIZE,
+        "max_overflow": settings.APP_DATABASE_MAX_OVERFLOW,
+        "pool_recycle": settings.APP_DATABASE_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.APP_DATABASE_POOL_PRE_PING,
+        "pool_timeout": settings.APP_DATABASE_POOL_TIMEOUT_SECONDS,
+    }
+
 
 def get_engine() -> AsyncEngine:
     global _engine
@@ -17,17 +61,53 @@ def get_engine() -> AsyncEngine:
         settings = get_settings()
         connect_args = {"check_same_thread": False} if settings.APP_DATABASE_SCHEME == "sqlite" else {}
 
-        pool_kwargs = {} if settings.APP_DATABASE_SCHEME == "sqlite" else {"pool_size": 2, "max_overflow": 2}
-
         _engine = create_async_engine(
             settings.SQLALCHEMY_DATABASE_URI,  # pyright: ignore [reportArgumentType]
             connect_args=connect_args,
             echo=settings.SQLALCHEMY_ECHO,
-            **pool_kwargs,
+            **get_pool_kwargs(settings),
         )
+        instrument_queries(_engine, settings.APP_DATABASE_SLOW_QUERY_SECONDS)
     return _engine
 
 
+def instrument_queries(engine: AsyncEngine, slow_query_seconds: float) -> None:
+    """
+    Records the duration of all queries of the engine and logs the queries that take longer than the given time.
+    """
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(  # pyright: ignore[reportUnusedFunction]
+        conn: Connection,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(  # pyright: ignore[reportUnusedFunction]
+        conn: Connection,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        duration = time.perf_counter() - conn.info["query_start_time"].pop()
+        _db_query_duration.observe(duration)  # pyright: ignore[reportUnknownMemberType]
+        if duration > slow_query_seconds:
+            logger.warning(f"Slow query ({duration:.3f}s): {statement[:500]}")
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def handle_error(exception_context: ExceptionContext) -> None:  # pyright: ignore[reportUnusedFunction]
+        # after_cursor_execute is not called for failed queries
+        if exception_context.connection is not None and exception_context.connection.info.get("query_start_time"):
+            exception_context.connection.info["query_start_time"].pop()
+
+
 def reset_engine() -> None:
     global _engine
     _engine = None
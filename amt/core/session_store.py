@@ -1,20 +1,30 @@
-import asyncio
+import heapq
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterator, Mapping, MutableMapping
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, cast
+
+import orjson
+from redis.asyncio import Redis
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from amt.core.config import Settings
 
 
 class SessionStore(ABC):
     """Abstract interface for session storage backends."""
 
     @abstractmethod
-    async def get(self, session_id: str) -> dict[str, Any] | None:
+    async def get(self, session_id: str) -> MutableMapping[str, Any] | None:
         """Retrieve session data by ID. Returns None if not found or expired."""
         ...
 
     @abstractmethod
-    async def set(self, session_id: str, data: dict[str, Any], ttl_seconds: int | None = None) -> None:
+    async def set(self, session_id: str, data: Mapping[str, Any], ttl_seconds: int | None = None) -> None:
         """Store session data with optional TTL."""
         ...
 
@@ -28,6 +38,13 @@ class SessionStore(ABC):
         """Extend session TTL. Returns False if session does not exist."""
         ...
 
+    async def get_and_touch(self, session_id: str, ttl_seconds: int | None = None) -> MutableMapping[str, Any] | None:
+        """Retrieve session data by ID and extend its TTL. Returns None if not found or expired."""
+        data = await self.get(session_id)
+        if data is not None:
+            await self.touch(session_id, ttl_seconds)
+        return data
+
     @abstractmethod
     async def cleanup_expired(self) -> int:
         """Remove all expired sessions. Returns count of removed sessions."""
@@ -39,11 +56,63 @@ class SessionStore(ABC):
         ...
 
     @abstractmethod
-    async def count(self) -> int:
-        """Return the number of active sessions."""
+    async def count(self) -> int | None:
+        """Return the number of active sessions, or None if the backend does not keep track of it."""
         ...
 
 
+class CopyOnWriteDict(MutableMapping[str, Any]):
+    """
+    Session data that shares the data of the store until it is first modified, so reading a session
+    does not copy it. Only the top level is copied, like dict.copy.
+    """
+
+    __slots__ = ("_data", "_modified")
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._data = data
+        self._modified = False
+
+    @property
+    def modified(self) -> bool:
+        """Whether the data was modified, and no longer shared with the store"""
+        return self._modified
+
+    def _writable(self) -> dict[str, Any]:
+        if not self._modified:
+            self._data = self._data.copy()
+            self._modified = True
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:  # noqa: ANN401
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:  # noqa: ANN401
+        self._writable()[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._writable()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def clear(self) -> None:
+        self._data = {}
+        self._modified = True
+
+    def copy(self) -> dict[str, Any]:
+        return self._data.copy()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._data!r})"
+
+
 @dataclass
 class SessionEntry:
     data: dict[str, Any]
@@ -51,51 +120,156 @@ class SessionEntry:
 
 
 class InMemorySessionStore(SessionStore):
+    """
+    Stores sessions in the memory of a single worker.
+
+    All methods run on the event loop without awaiting while they read or change the sessions, so no
+    lock is needed. Expiry times are kept in a min-heap, so cleaning up only visits expired sessions.
+    A touch or set pushes a new expiry time; the outdated heap items are skipped when they are popped
+    and dropped when the heap is compacted.
+    """
+
     def __init__(self, default_ttl_seconds: int = 60 * 60) -> None:
         self._sessions: dict[str, SessionEntry] = {}
+        self._expiry_heap: list[tuple[float, str]] = []
         self._default_ttl = default_ttl_seconds
-        self._lock = asyncio.Lock()
 
-    async def get(self, session_id: str) -> dict[str, Any] | None:
-        async with self._lock:
+    def _schedule(self, session_id: str, expires_at: float) -> None:
+        heapq.heappush(self._expiry_heap, (expires_at, session_id))
+        if len(self._expiry_heap) > 2 * len(self._sessions) + 64:
+            self._expiry_heap = [(entry.expires_at, sid) for sid, entry in self._sessions.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def _get_entry(self, session_id: str) -> SessionEntry | None:
+        entry = self._sessions.get(session_id)
+        if entry is not None and time.monotonic() > entry.expires_at:
+            del self._sessions[session_id]
+            return None
+        return entry
+
+    async def get(self, session_id: str) -> CopyOnWriteDict | None:
+        entry = self._get_entry(session_id)
+        if entry is None:
+            return None
+        return CopyOnWriteDict(entry.data)
+
+    async def set(self, session_id: str, data: Mapping[str, Any], ttl_seconds: int | None = None) -> None:
+        ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
+        expires_at = time.monotonic() + ttl
+        # the stored data is never modified, a CopyOnWriteDict copies it before it is changed
+        self._sessions[session_id] = SessionEntry(data=dict(data), expires_at=expires_at)
+        self._schedule(session_id, expires_at)
+
+    async def delete(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+    async def touch(self, session_id: str, ttl_seconds: int | None = None) -> bool:
+        ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
+        entry = self._get_entry(session_id)
+        if entry is None:
+            return False
+        entry.expires_at = time.monotonic() + ttl
+        self._schedule(session_id, entry.expires_at)
+        return True
+
+    async def cleanup_expired(self) -> int:
+        now = time.monotonic()
+        removed = 0
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, session_id = heapq.heappop(self._expiry_heap)
             entry = self._sessions.get(session_id)
-            if entry is None:
-                return None
-            if time.time() > entry.expires_at:
+            # skip heap items of sessions that were deleted, touched or set again since
+            if entry is not None and entry.expires_at == expires_at:
                 del self._sessions[session_id]
-                return None
-            return entry.data.copy()
+                removed += 1
+        return removed
+
+    async def close(self) -> None:
+        self._sessions.clear()
+        self._expiry_heap.clear()
+
+    async def count(self) -> int:
+        return len(self._sessions)
+
 
-    async def set(self, session_id: str, data: dict[str, Any], ttl_seconds: int | None = None) -> None:
+class RedisSessionStore(SessionStore):
+    """
+    Stores sessions in Redis (or a compatible server), so sessions are shared by all workers and
+    survive restarts. Sessions expire through the TTL of their key, there is nothing to clean up.
+    """
+
+    KEY_PREFIX = "amt:session:"
+
+    def __init__(self, client: Redis, default_ttl_seconds: int = 60 * 60) -> None:
+        self._client = client
+        self._default_ttl = default_ttl_seconds
+
+    def _key(self, session_id: str) -> str:
+        return self.KEY_PREFIX + session_id
+
+    @staticmethod
+    def _decode(value: Any) -> dict[str, Any] | None:  # noqa: ANN401
+        if not isinstance(value, bytes):
+            return None
+        return cast(dict[str, Any], orjson.loads(value))
+
+    async def get(self, session_id: str) -> dict[str, Any] | None:
+        return self._decode(await self._client.get(self._key(session_id)))
+
+    async def get_and_touch(self, session_id: str, ttl_seconds: int | None = None) -> dict[str, Any] | None:
+        ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
+        key = self._key(session_id)
+        # a single round trip for both commands
+        async with self._client.pipeline(transaction=False) as pipeline:
+            pipeline.get(key)
+            pipeline.expire(key, ttl)
+            data, _ = await pipeline.execute()
+        return self._decode(data)
+
+    async def set(self, session_id: str, data: Mapping[str, Any], ttl_seconds: int | None = None) -> None:
         ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
-        async with self._lock:
-            self._sessions[session_id] = SessionEntry(data=data.copy(), expires_at=time.time() + ttl)
+        value = orjson.dumps(data if isinstance(data, dict) else dict(data), default=str)
+        await self._client.set(self._key(session_id), value, ex=ttl)
 
     async def delete(self, session_id: str) -> None:
-        async with self._lock:
-            self._sessions.pop(session_id, None)
+        await self._client.delete(self._key(session_id))
 
     async def touch(self, session_id: str, ttl_seconds: int | None = None) -> bool:
         ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
-        async with self._lock:
-            entry = self._sessions.get(session_id)
-            if entry is None or time.time() > entry.expires_at:
-                return False
-            entry.expires_at = time.time() + ttl
-            return True
+        return bool(await self._client.expire(self._key(session_id), ttl))
 
     async def cleanup_expired(self) -> int:
-        now = time.time()
-        async with self._lock:
-            expired = [sid for sid, entry in self._sessions.items() if now > entry.expires_at]
-            for sid in expired:
-                del self._sessions[sid]
-            return len(expired)
+        return 0
 
     async def close(self) -> None:
-        async with self._lock:
-            self._sessions.clear()
+        await self._client.aclose()
 
-    async def count(self) -> int:
-        async with self._lock:
-            return len(self._sessions)
+    async def count(self) -> int | None:
+        # counting would scan the keys of all sessions, which is too expensive to do periodically
+        return None
+
+
+def create_redis_client(url: str, max_connections: int) -> Redis:
+    """
+    Returns a client with a pool of connections. Idle connections are checked with a PING before they are
+    used again, and commands are retried on a new connection when the server closed the old one.
+    """
+    return Redis.from_url(  # pyright: ignore[reportUnknownMemberType]
+        url,
+        # RESP2 is spoken by all Redis compatible servers
+        protocol=2,
+        max_connections=max_connections,
+        health_check_interval=30,
+        socket_timeout=5,
+        socket_connect_timeout=5,
+        socket_keepalive=True,
+        retry=Retry(ExponentialBackoff(cap=1, base=0.05), retries=3),
+        retry_on_error=[RedisConnectionError, RedisTimeoutError],
+    )
+
+
+def create_session_store(settings: Settings) -> SessionStore:
+    if settings.SESSION_STORE_BACKEND == "redis":
+        client = create_redis_client(settings.SESSION_STORE_REDIS_URL, settings.SESSION_STORE_REDIS_MAX_CONNECTIONS)
+        return RedisSessionStore(client, default_ttl_seconds=settings.SESSION_TTL_SECONDS)
+    return InMemorySessionStore(default_ttl_seconds=settings.SESSION_TTL_SECONDS)
@@ -4,3 +4,5 @@ from typing import Literal
 EnvironmentType = Literal["local", "production"]
 LoggingLevelType = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 DatabaseSchemaType = Literal["sqlite", "postgresql", "mysql", "oracle"]
+PermissionCacheBackendType = Literal["memory", "shared"]
+SessionStoreBackendType = Literal["memory", "redis"]
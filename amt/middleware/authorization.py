@@ -1,67 +1,90 @@
 import logging
 import os
-import typing
+from typing import Any
 from uuid import UUID
 
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import RedirectResponse, Response
+from starlette.responses import RedirectResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from amt.core.authorization import get_user
+from amt.core.authorization import AuthorizationVerb, get_user
+from amt.core.permission_cache import permission_cache
 from amt.models import User
 from amt.services.authorization import AuthorizationsService
 from amt.services.services_provider import ServicesProvider
 
 logger = logging.getLogger(__name__)
 
-RequestResponseEndpoint = typing.Callable[[Request], typing.Awaitable[Response]]
+PUBLIC_PATHS = frozenset(
+    {
+        "/auth/login",
+        "/auth/logout",
+        "/auth/callback",
+        "/health/live",
+        "/health/ready",
+        "/metrics",
+        "/",
+    }
+)
 
 
-class AuthorizationMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if request.url.path in [
-            "/auth/login",
-            "/auth/logout",
-            "/auth/callback",
-            "/health/live",
-            "/health/ready",
-            "/metrics",
-            "/",
-        ]:
-            return await call_next(request)
+class AuthorizationMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        if request.url.path.startswith("/static/"):
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in PUBLIC_PATHS or scope["path"].startswith("/static/"):
+            await self.app(scope, receive, send)
+            return
 
-        services_provider = ServicesProvider()
-        async with services_provider.session_scope():
-            authorization_service = await services_provider.get(AuthorizationsService)
-            disable_auth_str = os.environ.get("DISABLE_AUTH")
-            auth_disable = False if disable_auth_str is None else disable_auth_str.lower() == "true"
-            if auth_disable:
-                auto_login_uuid: str | None = os.environ.get("AUTO_LOGIN_UUID", None)
-                if auto_login_uuid:
-                    user_object: User | None = await authorization_service.get_user(UUID(auto_login_uuid))
-                    if user_object:
-                        request.session["user"] = {
-                            "sub": str(user_object.id),
-                            "email": user_object.email,
-                            "name": user_object.name,
-                            "email_hash": user_object.email_hash,
-                            "name_encoded": user_object.name_encoded,
-                        }
-                    else:
-                        request.session["user"] = {"sub": auto_login_uuid}
+        request = Request(scope)
+        disable_auth_str = os.environ.get("DISABLE_AUTH")
+        auth_disable = False if disable_auth_str is None else disable_auth_str.lower() == "true"
+        if auth_disable:
+            auto_login_uuid: str | None = os.environ.get("AUTO_LOGIN_UUID", None)
+            if auto_login_uuid:
+                await self.auto_login(request, auto_login_uuid)
 
-            user = get_user(request)
-            request.state.permissions = await authorization_service.find_by_user(user)
+        user = get_user(request)
+        request.state.permissions = await self.get_permissions(user)
 
-        if user:  # pragma: no cover
-            return await call_next(request)
+        if user or auth_disable:
+            await self.app(scope, receive, send)
+            return
 
-        response = await call_next(request)
+        response = RedirectResponse(url="/")
+        await response(scope, receive, send)
 
-        if auth_disable:
-            return response
+    @staticmethod
+    async def auto_login(request: Request, auto_login_uuid: str) -> None:
+        services_provider = ServicesProvider()
+        async with services_provider.session_scope():
+            authorization_service = await services_provider.get(AuthorizationsService)
+            user_object: User | None = await authorization_service.get_user(UUID(auto_login_uuid))
+        if user_object:
+            request.session["user"] = {
+                "sub": str(user_object.id),
+                "email": user_object.email,
+                "name": user_object.name,
+                "email_hash": user_object.email_hash,
+                "name_encoded": user_object.name_encoded,
+            }
+        else:
+            request.session["user"] = {"sub": auto_login_uuid}
 
-        return RedirectResponse(url="/")
+    @staticmethod
+    async def get_permissions(user: dict[str, Any] | None) -> dict[str, list[AuthorizationVerb]]:
+        """
+        Returns the permissions of the user from the permission cache, only opening a database session
+        to compute them on a cache miss.
+        """
+        if not user:
+            return {}
+        permissions = await permission_cache.get(user["sub"])
+        if permissions is None:
+            services_provider = ServicesProvider()
+            async with services_provider.session_scope():
+                authorization_service = await services_provider.get(AuthorizationsService)
+                permissions = await authorization_service.find_by_user(user)
+            await permission_cache.set(user["sub"], permissions)
+        return permissions
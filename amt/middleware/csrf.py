@@ -1,21 +1,17 @@
 import logging
-import typing
 
 from fastapi_csrf_protect import CsrfProtect  # type: ignore
 from fastapi_csrf_protect.exceptions import CsrfProtectError, MissingTokenError, TokenValidationError  # type: ignore
 from itsdangerous import BadData, SignatureExpired, URLSafeTimedSerializer
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 from starlette.requests import Request
 from starlette.responses import Response
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from amt.core.csrf import get_csrf_config  # type: ignore # noqa
 from amt.core.exception_handlers import general_exception_handler
 from amt.core.exceptions import AMTCSRFProtectError
 
-RequestResponseEndpoint = typing.Callable[[Request], typing.Awaitable[Response]]
-
-
 logger = logging.getLogger(__name__)
 
 
@@ -53,13 +49,13 @@ class CookieOnlyCsrfProtect(CsrfProtect):
             raise TokenValidationError("The CSRF token is invalid.") from e
 
 
-class CSRFMiddleware(BaseHTTPMiddleware):
+class CSRFMiddleware:
     """
     This middleware implements CSRF protection through FastAPI CSRF Protect.
     """
 
     def __init__(self, app: ASGIApp) -> None:
-        super().__init__(app)
+        self.app = app
         self.csrf_protect = CookieOnlyCsrfProtect()
         self.safe_methods = ("GET", "HEAD", "OPTIONS", "TRACE")
 
@@ -71,10 +67,27 @@ class CSRFMiddleware(BaseHTTPMiddleware):
         is_not_htmx: bool = request.state.htmx == "False"
         return is_not_static_and_asset or is_not_htmx  # or is_not_assets
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+    def _set_csrf_cookie(self, signed_token: str, message: Message) -> None:
+        """
+        Adds the CSRF cookie to the headers of the response start message.
+        """
+        response = Response()
+        self.csrf_protect.set_csrf_cookie(signed_token, response)
+        headers = MutableHeaders(scope=message)
+        for key, value in response.raw_headers:
+            if key == b"set-cookie":
+                headers.append("set-cookie", value.decode("latin-1"))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         signed_token = ""
+        include_request = self._include_request(request)
 
-        if self._include_request(request):
+        if include_request:
             request.state.csrftoken = ""
 
             if request.method in self.safe_methods:
@@ -86,29 +99,37 @@ class CSRFMiddleware(BaseHTTPMiddleware):
                 logger.debug(f"validating tokens: csrf_token={csrf_token}")
                 await self.csrf_protect.validate_csrf(request)
 
-        response = await call_next(request)
+        # TODO FIXME (Robbert) we always set the cookie, this causes CSRF problems
+        set_cookie = include_request and request.method in self.safe_methods
+        if not set_cookie or request.url.path == "/organizations/users":
+            await self.app(scope, receive, send)
+            return
 
-        if self._include_request(request) and request.method in self.safe_methods:  # noqa
-            # TODO FIXME (Robbert) we always set the cookie, this causes CSRF problems
-            if request.url.path != "/organizations/users":
-                self.csrf_protect.set_csrf_cookie(signed_token, response)
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                self._set_csrf_cookie(signed_token, message)
                 logger.debug(f"set csrf_cookie: signed_token={signed_token}")
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_wrapper)
 
 
-class CSRFMiddlewareExceptionHandler(BaseHTTPMiddleware):
+class CSRFMiddlewareExceptionHandler:
     """
     This middleware is necessary to propagate CsrfProtectErrors to the csrf_protection_handler.
     """
 
     def __init__(self, app: ASGIApp) -> None:
-        super().__init__(app)
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send)
         except CsrfProtectError:
             # middleware exceptions are not handled by the fastapi error handlers, so we call the function ourselves
-            return await general_exception_handler(request, AMTCSRFProtectError())
-        return response
+            response = await general_exception_handler(Request(scope), AMTCSRFProtectError())
+            await response(scope, receive, send)
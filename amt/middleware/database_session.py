@@ -0,0 +1,29 @@
+import logging
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from amt.repositories.deps import request_session_scope
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseSessionMiddleware:
+    """
+    Creates the database session of a request, which is stored on the request state and reused by all
+    middleware, dependencies and routes that handle the request.
+
+    This is a pure ASGI middleware, so the session is only closed after the response is sent and the
+    dependencies of the route are cleaned up.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with request_session_scope() as request_session:
+            scope.setdefault("state", {})["request_session"] = request_session
+            await self.app(scope, receive, send)
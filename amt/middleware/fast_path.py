@@ -0,0 +1,40 @@
+from fastapi.middleware.asyncexitstack import AsyncExitStackMiddleware
+from starlette.middleware.exceptions import ExceptionMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from amt.middleware.security import SecurityMiddleware
+
+FAST_PATH_PREFIXES = ("/static/", "/health/")
+FAST_PATHS = frozenset({"/metrics"})
+
+
+class FastPathMiddleware:
+    """
+    Sends requests for static files, health checks and metrics directly to the router, only adding the
+    security headers. These requests need no session, authorization, CSRF token or request logging, so
+    they skip the rest of the middleware stack.
+
+    HTTP exceptions of these requests, like a missing static file, get the plain responses of Starlette
+    instead of the error pages of AMT, as those need the skipped middleware.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        router: ASGIApp,
+        prefixes: tuple[str, ...] = FAST_PATH_PREFIXES,
+        paths: frozenset[str] = FAST_PATHS,
+    ) -> None:
+        self.app = app
+        self.fast_app = SecurityMiddleware(ExceptionMiddleware(AsyncExitStackMiddleware(router)))
+        self.prefixes = prefixes
+        self.paths = paths
+
+    def is_fast_path(self, path: str) -> bool:
+        return path in self.paths or path.startswith(self.prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and self.is_fast_path(scope["path"]):
+            await self.fast_app(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
@@ -1,17 +1,17 @@
 import logging
-import typing
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
-
-RequestResponseEndpoint = typing.Callable[[Request], typing.Awaitable[Response]]
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
 
-class HTMXMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        request.state.htmx = request.headers.get("HX-Request", "false").lower() == "true"
-        response = await call_next(request)
-        return response
+class HTMXMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            htmx = Headers(scope=scope).get("HX-Request", "false").lower() == "true"
+            scope.setdefault("state", {})["htmx"] = htmx
+        await self.app(scope, receive, send)
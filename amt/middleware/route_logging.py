@@ -1,49 +1,84 @@
+import json
 import logging
-import typing
-from time import time
+import random
+from time import perf_counter, time
+from typing import Any
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from ulid import ULID
 
 from amt.utils.mask import Mask
 
-RequestResponseEndpoint = typing.Callable[[Request], typing.Awaitable[Response]]
-
 logger = logging.getLogger(__name__)
 
+MASK_VALUE = "***MASKED***"
+_masker = Mask(mask_value=MASK_VALUE, mask_keywords=["cookie"])
+
+
+def mask_headers(raw_headers: list[tuple[bytes, bytes]]) -> dict[str, str]:
+    headers = {name.decode("latin-1"): value.decode("latin-1") for name, value in raw_headers}
+    return _masker.secrets(headers)  # pyright: ignore[reportReturnType]
+
+
+class RequestLoggingMiddleware:
+    """
+    Adds a request id to each request and logs a sample of the requests as JSON at DEBUG level. The
+    duration per route is recorded by the Prometheus instrumentator (http_request_duration_seconds).
+
+    The log line is only built when the logger is enabled for DEBUG and the request is sampled.
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: float = 1.0) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+
+    def _should_log(self) -> bool:
+        if not logger.isEnabledFor(logging.DEBUG):
+            return False
+        return self.sample_rate >= 1 or random.random() < self.sample_rate  # noqa: S311
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         request_time = time()
+        start = perf_counter()
         request_id: str = str(ULID())
-        masker = Mask(mask_keywords=["cookie"])
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
+        response_start: Message = {}
 
-        response = await call_next(request)
-        response_time = time()
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-API-Request-ID"] = request_id
+                response_start.update(message)
+            await send(message)
 
-        response.headers["X-API-Request-ID"] = request_id
-        masked_request_headers = masker.secrets(dict(request.headers))
-        masked_response_headers = masker.secrets(dict(response.headers))
+        await self.app(scope, receive, send_wrapper)
 
-        logging_body = {
+        if self._should_log():
+            duration = perf_counter() - start
+            logger.debug(self._logging_body(scope, request_id, request_time, duration, response_start))
+
+    @staticmethod
+    def _logging_body(
+        scope: Scope, request_id: str, request_time: float, duration: float, response_start: Message
+    ) -> str:
+        logging_body: dict[str, Any] = {
             "request_id": request_id,
             "request": {
                 "time": request_time,
-                "method": request.method,
-                "path": request.url.path,
-                "query_params": str(request.query_params),
-                "headers": masked_request_headers,
+                "method": scope["method"],
+                "path": scope["path"],
+                "query_params": scope["query_string"].decode("latin-1"),
+                "headers": mask_headers(scope["headers"]),
             },
             "response": {
-                "time": response_time,
-                "status_code": response.status_code,
-                "headers": masked_response_headers,
+                "time": request_time + duration,
+                "status_code": response_start.get("status"),
+                "headers": mask_headers(response_start.get("headers", [])),
             },
-            "duration": (response_time - request_time) * 1000,
+            "duration": duration * 1000,
         }
-
-        logger.debug(logging_body)
-        return response
+        return json.dumps(logging_body, separators=(",", ":"))
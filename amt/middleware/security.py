@@ -1,16 +1,20 @@
-import typing
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
 
-RequestResponseEndpoint = typing.Callable[[Request], typing.Awaitable[Response]]
+class SecurityMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-class SecurityMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        response = await call_next(request)
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+            await send(message)
 
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-
-        return response
+        await self.app(scope, receive, send_wrapper)
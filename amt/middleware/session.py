@@ -1,5 +1,9 @@
+import json
 import logging
+import time
 import uuid
+from collections.abc import MutableMapping
+from typing import Any
 
 import itsdangerous
 from starlette.datastructures import MutableHeaders
@@ -8,12 +12,21 @@ from starlette.routing import Mount
 from starlette.staticfiles import StaticFiles
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from amt.core.session_store import SessionStore
+from amt.core.session_store import CopyOnWriteDict, SessionStore
 
 logger = logging.getLogger(__name__)
 
 
 class ServerSideSessionMiddleware:
+    """
+    Keeps the session data in a session store, and only its signed id in a cookie.
+
+    The session is only written to the store when it was modified. Otherwise the TTL of the session in
+    the store is extended, and the cookie signed again, once the cookie is older than the refresh
+    interval. A session therefore expires between max_age minus the refresh interval and max_age
+    after the last request.
+    """
+
     def __init__(
         self,
         app: ASGIApp,
@@ -27,12 +40,14 @@ class ServerSideSessionMiddleware:
         domain: str | None = None,
         exclude_paths: list[str] | None = None,
         exclude_static_paths: bool = True,
+        refresh_interval: int = 5 * 60,
     ) -> None:
         self.app = app
         self.session_store = session_store
         self.signer = itsdangerous.TimestampSigner(secret_key)
         self.session_cookie = session_cookie
         self.max_age = max_age
+        self.refresh_interval = refresh_interval
         self.path = path
         self.exclude_paths = exclude_paths or []
         self.exclude_static_paths = exclude_static_paths
@@ -51,23 +66,58 @@ class ServerSideSessionMiddleware:
             )
         return f"{self.session_cookie}={value}; path={self.path}; Max-Age={self.max_age}; {self.security_flags}"
 
-    async def _load_session(self, connection: HTTPConnection) -> tuple[str, dict[str, object], bool]:
-        """Load session from cookie. Returns (session_id, data, had_session_on_arrival)."""
+    async def _load_session(self, connection: HTTPConnection) -> tuple[str, MutableMapping[str, Any], float | None]:
+        """
+        Load session from cookie. Returns (session_id, data, signed_at), where signed_at is the time the
+        cookie was signed, or None if there was no session on arrival.
+        """
         if self.session_cookie not in connection.cookies:
-            return str(uuid.uuid4()), {}, False
+            return str(uuid.uuid4()), {}, None
 
         signed_id = connection.cookies[self.session_cookie].encode("utf-8")
         try:
-            session_id = self.signer.unsign(signed_id, max_age=self.max_age).decode("utf-8")
+            session_id, signed_at = self.signer.unsign(signed_id, max_age=self.max_age, return_timestamp=True)
         except itsdangerous.BadSignature:
             logger.warning("Invalid session cookie signature - possible tampering or secret key mismatch")
-            return str(uuid.uuid4()), {}, False
+            return str(uuid.uuid4()), {}, None
 
-        session_data = await self.session_store.get(session_id)
+        if self._is_refresh_due(signed_at.timestamp()):
+            # the TTL is extended in the same round trip as the session is read
+            session_data = await self.session_store.get_and_touch(session_id.decode("utf-8"), self.max_age)
+        else:
+            session_data = await self.session_store.get(session_id.decode("utf-8"))
         if session_data is not None:
-            return session_id, session_data, True
-
-        return str(uuid.uuid4()), {}, False
+            return session_id.decode("utf-8"), session_data, signed_at.timestamp()
+
+        return str(uuid.uuid4()), {}, None
+
+    def _is_refresh_due(self, signed_at: float | None) -> bool:
+        return signed_at is None or time.time() - signed_at >= self.refresh_interval
+
+    @staticmethod
+    def _snapshot(session_data: MutableMapping[str, Any]) -> str | None:
+        """
+        Returns a serialized copy of the session data to detect changes, or None if the session data
+        tracks its own changes.
+        """
+        if isinstance(session_data, CopyOnWriteDict):
+            return None
+        return json.dumps(session_data, sort_keys=True, separators=(",", ":"), default=str)
+
+    def _is_modified(
+        self, loaded_data: MutableMapping[str, Any], current_data: MutableMapping[str, Any], snapshot: str | None
+    ) -> bool:
+        if current_data is not loaded_data:
+            return True
+        if isinstance(current_data, CopyOnWriteDict):
+            # an unmodified CopyOnWriteDict shares its values with the store, so changes to nested
+            # values are already stored
+            return current_data.modified
+        return self._snapshot(current_data) != snapshot
+
+    async def _save_session(self, session_id: str, session_data: MutableMapping[str, Any], modified: bool) -> None:
+        if modified:
+            await self.session_store.set(session_id, session_data, self.max_age)
 
     def _resolve_static_paths(self, app: ASGIApp) -> None:
         """Discover static file mount paths from the app routes."""
@@ -99,24 +149,29 @@ class ServerSideSessionMiddleware:
             return
 
         connection = HTTPConnection(scope)
-        session_id, session_data, had_session_on_arrival = await self._load_session(connection)
+        session_id, session_data, signed_at = await self._load_session(connection)
+        snapshot = self._snapshot(session_data)
         scope["session"] = session_data
         scope["session_id"] = session_id
 
         async def send_wrapper(message: Message) -> None:
             if message["type"] == "http.response.start":
-                current_session: dict[str, object] = scope.get("session", {})
+                current_session: MutableMapping[str, Any] = scope.get("session", {})
                 headers = MutableHeaders(scope=message)
 
                 session_has_data = bool(current_session)
                 session_is_empty = not current_session
-                user_logged_out = had_session_on_arrival and session_is_empty
+                user_logged_out = signed_at is not None and session_is_empty
+                refresh_due = self._is_refresh_due(signed_at)
 
                 if session_has_data:
-                    # Active session: save to store and set/refresh cookie
-                    await self.session_store.set(session_id, current_session, self.max_age)
-                    signed_id = self.signer.sign(session_id.encode("utf-8")).decode("utf-8")
-                    headers.append("Set-Cookie", self._build_cookie_header(signed_id))
+                    # Active session: save to store if modified and refresh the cookie when due, the TTL
+                    # was already extended when the session was loaded
+                    modified = self._is_modified(session_data, current_session, snapshot)
+                    await self._save_session(session_id, current_session, modified)
+                    if refresh_due:
+                        signed_id = self.signer.sign(session_id.encode("utf-8")).decode("utf-8")
+                        headers.append("Set-Cookie", self._build_cookie_header(signed_id))
                 elif user_logged_out:
                     # User logged out: delete from store and clear cookie
                     await self.session_store.delete(session_id)
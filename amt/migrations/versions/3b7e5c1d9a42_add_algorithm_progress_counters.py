@@ -0,0 +1,65 @@
+"""add algorithm progress counters
+
+Revision ID: 3b7e5c1d9a42
+Revises: a8454864255d
+Create Date: 2026-10-18 12:41:09.204718
+
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.sql import column, table
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7e5c1d9a42"
+down_revision: str | None = "a8454864255d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COUNTERS = ("requirements_completed", "requirements_total")
+
+algorithm_table = table(
+    "algorithm",
+    column("id", sa.Integer),
+    column("system_card_json", sa.JSON),
+    *(column(counter, sa.Integer) for counter in COUNTERS),
+)
+
+
+def get_progress(system_card_json: dict[str, Any] | None) -> dict[str, int]:
+    # a copy of amt.models.algorithm.get_system_card_progress at the time of this migration
+    requirements = (system_card_json or {}).get("requirements") or []
+    return {
+        "requirements_completed": sum(1 for requirement in requirements if requirement.get("state") == "done"),
+        "requirements_total": len(requirements),
+    }
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("algorithm", schema=None) as batch_op:
+        for counter in COUNTERS:
+            batch_op.add_column(sa.Column(counter, sa.Integer(), server_default="0", nullable=False))
+
+    connection = op.get_bind()
+    rows = connection.execute(sa.select(algorithm_table.c.id, algorithm_table.c.system_card_json)).all()
+    updates: list[dict[str, Any]] = []
+    for algorithm_id, system_card_json in rows:
+        progress = get_progress(system_card_json)
+        if any(progress.values()):
+            updates.append({"algorithm_id": algorithm_id, **{f"new_{key}": value for key, value in progress.items()}})
+    if updates:
+        connection.execute(
+            algorithm_table.update()
+            .where(algorithm_table.c.id == sa.bindparam("algorithm_id"))
+            .values({counter: sa.bindparam(f"new_{counter}") for counter in COUNTERS}),
+            updates,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("algorithm", schema=None) as batch_op:
+        for counter in reversed(COUNTERS):
+            batch_op.drop_column(counter)
@@ -12,9 +12,6 @@ from uuid import UUID
 import sqlalchemy as sa
 from sqlalchemy import text
 from alembic import op
-from sqlalchemy.orm.session import Session
-
-from amt.models import User
 
 # revision identifiers, used by Alembic.
 revision: str = "5de977ad946f"
@@ -58,22 +55,29 @@ def upgrade() -> None:
     op.add_column("user", sa.Column("name_encoded", sa.String(), nullable=True))
     op.add_column("user", sa.Column("email", sa.String(), nullable=True))
 
-    session = Session(bind=op.get_bind())
+    # the user table as it is at this revision, the live models have columns that are added by later migrations
+    user = sa.table(
+        "user",
+        sa.column("id", sa.UUID()),
+        sa.column("name", sa.String()),
+        sa.column("email", sa.String()),
+        sa.column("email_hash", sa.String()),
+        sa.column("name_encoded", sa.String()),
+    )
+    connection = op.get_bind()
 
-    first_user = session.query(User).first()
-    if not first_user:
-        first_user = User(id=UUID("1738b1e151dc46219556a5662b26517c"), name="AMT Demo User", email="amt@amt.nl", email_hash="hash123", name_encoded="amt+demo+user")
-        session.add(first_user)
-        session.commit()
-        session.refresh(first_user)
+    first_user_id = connection.execute(sa.select(user.c.id).limit(1)).scalar()
+    if first_user_id is None:
+        first_user_id = UUID("1738b1e151dc46219556a5662b26517c")
+        op.bulk_insert(user, [{"id": first_user_id, "name": "AMT Demo User", "email": "amt@amt.nl", "email_hash": "hash123", "name_encoded": "amt+demo+user"}])
 
     # add demo organization
-    op.bulk_insert(organization,[{"name": "Demo AMT", "slug": "demo-amt", "created_by_id": first_user.id}])
+    op.bulk_insert(organization,[{"name": "Demo AMT", "slug": "demo-amt", "created_by_id": first_user_id}])
 
     # add all current users to the demo organization
     op.bulk_insert(
         users_and_organizations,
-        [{"organization_id": 1, "user_id": user.id} for user in session.query(User).all()]
+        [{"organization_id": 1, "user_id": user_id} for user_id in connection.execute(sa.select(user.c.id)).scalars()]
     )
 
     # add all current algorithms to the demo organization
@@ -0,0 +1,75 @@
+"""add algorithm system card facets
+
+Revision ID: a8454864255d
+Revises: c58215147bf9
+Create Date: 2026-10-18 10:03:27.518342
+
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.sql import column, table
+
+# revision identifiers, used by Alembic.
+revision: str = "a8454864255d"
+down_revision: str | None = "c58215147bf9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+FACETS = ("risk_group", "ai_act_type", "ai_act_role", "status")
+
+algorithm_table = table(
+    "algorithm",
+    column("id", sa.Integer),
+    column("system_card_json", sa.JSON),
+    *(column(facet, sa.String) for facet in FACETS),
+)
+
+
+def get_facets(system_card_json: dict[str, Any] | None) -> dict[str, Any]:
+    # a copy of amt.models.algorithm.get_system_card_facets at the time of this migration
+    system_card_json = system_card_json or {}
+    ai_act_profile = system_card_json.get("ai_act_profile") or {}
+    role = ai_act_profile.get("role")
+    if isinstance(role, list):
+        role = " + ".join(str(value) for value in role) or None
+    return {
+        "risk_group": ai_act_profile.get("risk_group"),
+        "ai_act_type": ai_act_profile.get("type"),
+        "ai_act_role": role,
+        "status": system_card_json.get("status"),
+    }
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("algorithm", schema=None) as batch_op:
+        for facet in FACETS:
+            batch_op.add_column(sa.Column(facet, sa.String(length=255), nullable=True))
+            batch_op.create_index(batch_op.f(f"ix_algorithm_{facet}"), [facet], unique=False)
+        batch_op.create_index(batch_op.f("ix_algorithm_lifecycle"), ["lifecycle"], unique=False)
+
+    connection = op.get_bind()
+    rows = connection.execute(sa.select(algorithm_table.c.id, algorithm_table.c.system_card_json)).all()
+    updates: list[dict[str, Any]] = []
+    for algorithm_id, system_card_json in rows:
+        facets = get_facets(system_card_json)
+        if any(facets.values()):
+            updates.append({"algorithm_id": algorithm_id, **{f"new_{key}": value for key, value in facets.items()}})
+    if updates:
+        connection.execute(
+            algorithm_table.update()
+            .where(algorithm_table.c.id == sa.bindparam("algorithm_id"))
+            .values({facet: sa.bindparam(f"new_{facet}") for facet in FACETS}),
+            updates,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("algorithm", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_algorithm_lifecycle"))
+        for facet in FACETS:
+            batch_op.drop_index(batch_op.f(f"ix_algorithm_{facet}"))
+            batch_op.drop_column(facet)
@@ -0,0 +1,46 @@
+"""add algorithm lifecycle index
+
+Revision ID: c58215147bf9
+Revises: c449b0db56ca
+Create Date: 2026-10-18 09:12:41.204511
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c58215147bf9"
+down_revision: str | None = "c449b0db56ca"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# the lifecycles in the order of the Lifecycles enum at the time of this migration
+LIFECYCLES = (
+    "ORGANIZATIONAL_RESPONSIBILITIES",
+    "PROBLEM_ANALYSIS",
+    "DESIGN",
+    "DATA_EXPLORATION_AND_PREPARATION",
+    "DEVELOPMENT",
+    "VERIFICATION_AND_VALIDATION",
+    "IMPLEMENTATION",
+    "MONITORING_AND_MANAGEMENT",
+    "PHASING_OUT",
+)
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("algorithm", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("lifecycle_index", sa.Integer(), server_default="-1", nullable=False))
+        batch_op.create_index(batch_op.f("ix_algorithm_lifecycle_index"), ["lifecycle_index"], unique=False)
+
+    whens = " ".join(f"WHEN '{lifecycle}' THEN {index}" for index, lifecycle in enumerate(LIFECYCLES))
+    op.execute(f"UPDATE algorithm SET lifecycle_index = CASE lifecycle {whens} ELSE -1 END")  # noqa: S608
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("algorithm", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_algorithm_lifecycle_index"))
+        batch_op.drop_column("lifecycle_index")
@@ -11,8 +11,6 @@ from collections.abc import Sequence
 import sqlalchemy as sa
 from alembic import op
 from amt.core.authorization import AuthorizationResource, AuthorizationVerb, AuthorizationType
-from sqlalchemy.orm.session import Session
-from amt.models import User, Organization
 
 # revision identifiers, used by Alembic.
 revision: str = "e16bb3d53cd6"
@@ -187,20 +185,23 @@ def upgrade() -> None:
         ],
     )
 
-    session = Session(bind=op.get_bind())
+    # the tables as they are at this revision, the live models have columns that are added by later migrations
+    user = sa.table("user", sa.column("id", sa.UUID()))
+    organization = sa.table("organization", sa.column("id", sa.Integer()))
+    connection = op.get_bind()
 
-    first_user = session.query(User).first()  # first user is always present due to other migration
-    organizations = session.query(Organization).all()
+    first_user_id = connection.execute(sa.select(user.c.id).limit(1)).scalar()  # first user is always present due to other migration
+    organization_ids = connection.execute(sa.select(organization.c.id)).scalars().all()
 
     authorizations = []
     # lets add user 1 to all organizations bij default
-    for organization in organizations:
+    for organization_id in organization_ids:
         authorizations.append(
             {
-                "user_id": first_user.id,
+                "user_id": first_user_id,
                 "role_id": 1,
                 "type": AuthorizationType.ORGANIZATION,
-                "type_id": organization.id,
+                "type_id": organization_id,
             },
         )
 
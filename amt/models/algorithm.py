@@ -3,13 +3,15 @@ from datetime import date, datetime
 from enum import Enum
 from typing import Any, TypeVar
 
-from sqlalchemy import ForeignKey, String, func, orm
+from sqlalchemy import ForeignKey, SQLColumnExpression, String, event, func, orm
 from sqlalchemy.dialects.postgresql import ENUM
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Mapped, Session, UOWTransaction, attributes, mapped_column, relationship
 from sqlalchemy.types import JSON
 
 from amt.api.lifecycles import Lifecycles
 from amt.models.base import Base
+from amt.schema.algorithm import AlgorithmProgress
 from amt.schema.system_card import SystemCard
 
 T = TypeVar("T", bound="Algorithm")
@@ -26,6 +28,79 @@ class CustomJSONEncoder(json.JSONEncoder):
         return super().default(o)
 
 
+_json_encoder = CustomJSONEncoder()
+
+
+def to_json_compatible(value: Any) -> Any:  # noqa: ANN401
+    """
+    Converts a value to JSON compatible data in a single pass, with the same result as
+    json.loads(json.dumps(value, cls=CustomJSONEncoder)) but without encoding and decoding a string.
+    """
+    if isinstance(value, dict):
+        return {
+            key if isinstance(key, str) else json.dumps(key): to_json_compatible(item)
+            for key, item in value.items()  # pyright: ignore[reportUnknownVariableType]
+        }
+    if isinstance(value, list | tuple):
+        return [to_json_compatible(item) for item in value]  # pyright: ignore[reportUnknownVariableType]
+    if value is None or type(value) in (str, int, float, bool):
+        return value
+    # subclasses of the primitive types (like StrEnum) are encoded as their primitive value by json
+    if isinstance(value, str):
+        return str.__str__(value)
+    if isinstance(value, bool):
+        return bool(value)
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float):
+        return float(value)
+    return to_json_compatible(_json_encoder.default(value))
+
+
+def get_lifecycle_index(lifecycle: Lifecycles | str | None) -> int:
+    """
+    Returns the ordinal of the given lifecycle (or lifecycle value or name), -1 if there is no lifecycle or
+    the lifecycle is unknown.
+    """
+    if not isinstance(lifecycle, Lifecycles) and isinstance(lifecycle, str):
+        lifecycle = Lifecycles.__members__.get(lifecycle) or next(
+            (member for member in Lifecycles if member.value == lifecycle), None
+        )
+    if lifecycle is None:
+        return -1
+    return lifecycle.index
+
+
+def get_system_card_facets(system_card_json: dict[str, Any] | None) -> dict[str, str | None]:
+    """
+    Returns the values of the commonly filtered system card fields, keyed by the Algorithm column they
+    are stored in. A role with multiple values is stored as the values joined by ' + '.
+    """
+    system_card_json = system_card_json or {}
+    ai_act_profile = system_card_json.get("ai_act_profile") or {}
+    role = ai_act_profile.get("role")
+    if isinstance(role, list):
+        role = " + ".join(str(value) for value in role) or None  # pyright: ignore[reportUnknownVariableType, reportUnknownArgumentType]
+    return {
+        "risk_group": ai_act_profile.get("risk_group"),
+        "ai_act_type": ai_act_profile.get("type"),
+        "ai_act_role": role,
+        "status": system_card_json.get("status"),
+    }
+
+
+def get_system_card_progress(system_card_json: dict[str, Any] | None) -> dict[str, int]:
+    """
+    Returns the number of completed and total requirements of the system card, keyed by the Algorithm column
+    they are stored in. A requirement is completed when its state is 'done'.
+    """
+    requirements = (system_card_json or {}).get("requirements") or []
+    return {
+        "requirements_completed": sum(1 for requirement in requirements if requirement.get("state") == "done"),
+        "requirements_total": len(requirements),
+    }
+
+
 class AlgorithmSystemCard(SystemCard):
     def __init__(self, parent: "Algorithm", **data: Any) -> None:  # noqa: ANN401
         super().__init__(**data)
@@ -34,7 +109,7 @@ class AlgorithmSystemCard(SystemCard):
     def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
         super().__setattr__(name, value)
         if name != "_parent" and hasattr(self, "_parent"):
-            self._parent.sync_system_card()
+            self._parent.mark_system_card_dirty()
 
     def __eq__(self, other: Any) -> bool:  # noqa: ANN401
         if isinstance(other, AlgorithmSystemCard | SystemCard):
@@ -50,7 +125,7 @@ class AlgorithmSystemCard(SystemCard):
             *args, exclude_unset=exclude_unset, by_alias=by_alias, exclude_none=exclude_none, **kwargs
         )
 
-        return json.loads(json.dumps(dumped, cls=CustomJSONEncoder))
+        return to_json_compatible(dumped)
 
 
 class Algorithm(Base):
@@ -58,8 +133,18 @@ class Algorithm(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(255))
-    lifecycle: Mapped[Lifecycles | None] = mapped_column(ENUM(Lifecycles, name="lifecycle"), nullable=True)
-    system_card_json: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict)
+    lifecycle: Mapped[Lifecycles | None] = mapped_column(ENUM(Lifecycles, name="lifecycle"), nullable=True, index=True)
+    # ordinal of the lifecycle, so algorithms can be sorted by lifecycle in the database
+    lifecycle_index: Mapped[int] = mapped_column(default=-1, server_default="-1", index=True)
+    _system_card_json: Mapped[dict[str, Any]] = mapped_column("system_card_json", JSON, default=dict)
+    # copies of commonly filtered system card fields, so filters can use an index instead of parsing the JSON
+    risk_group: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
+    ai_act_type: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
+    ai_act_role: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
+    status: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
+    # progress counters of the system card, so pages and lists do not need to count the tasks
+    requirements_completed: Mapped[int] = mapped_column(default=0, server_default="0")
+    requirements_total: Mapped[int] = mapped_column(default=0, server_default="0")
     last_edited: Mapped[datetime] = mapped_column(server_default=func.now(), onupdate=func.now(), nullable=False)
     deleted_at: Mapped[datetime | None] = mapped_column(server_default=None, nullable=True)
     organization_id: Mapped[int] = mapped_column(ForeignKey("organization.id"))
@@ -68,14 +153,38 @@ class Algorithm(Base):
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
         system_card: SystemCard | None = kwargs.pop("system_card", None)
+        self._system_card_dirty = False
         super().__init__(*args, **kwargs)
         self._system_card: AlgorithmSystemCard | None = None
         if system_card is not None:
             self.system_card = system_card
 
+    @orm.validates("lifecycle")  # pyright: ignore[reportUnknownMemberType, reportUntypedFunctionDecorator]
+    def _validate_lifecycle(self, key: str, lifecycle: Lifecycles | str | None) -> Lifecycles | str | None:
+        self.lifecycle_index = get_lifecycle_index(lifecycle)
+        return lifecycle
+
     @orm.reconstructor  # pyright: ignore[reportUnknownMemberType]
     def init_on_load(self) -> None:
         self._system_card: AlgorithmSystemCard | None = None
+        self._system_card_dirty = False
+
+    @hybrid_property
+    def system_card_json(self) -> dict[str, Any]:
+        if getattr(self, "_system_card_dirty", False):
+            self.sync_system_card()
+        return self._system_card_json
+
+    @system_card_json.inplace.setter
+    def _system_card_json_setter(self, value: dict[str, Any]) -> None:
+        self._system_card_json = value
+        self._system_card_dirty = False
+        self._sync_facets()
+
+    @system_card_json.inplace.expression
+    @classmethod
+    def _system_card_json_expression(cls) -> SQLColumnExpression[dict[str, Any]]:
+        return cls._system_card_json
 
     @property
     def system_card(self) -> AlgorithmSystemCard:
@@ -87,7 +196,7 @@ class Algorithm(Base):
                 self._system_card = AlgorithmSystemCard(self, **self.system_card_json)
             else:
                 self._system_card = AlgorithmSystemCard(self)
-                self.sync_system_card()
+                self.mark_system_card_dirty()
         return self._system_card
 
     @system_card.setter
@@ -96,11 +205,48 @@ class Algorithm(Base):
             self._system_card = AlgorithmSystemCard(self)
         else:
             self._system_card = AlgorithmSystemCard(self, **value.model_dump(exclude_unset=True, by_alias=True))
-        self.sync_system_card()
+        self.mark_system_card_dirty()
+
+    def mark_system_card_dirty(self) -> None:
+        """
+        Marks the system card as changed, it is serialized to system_card_json once when system_card_json is
+        read or when the algorithm is flushed, instead of on every change.
+        """
+        if getattr(self, "_system_card_dirty", False):
+            return
+        if "_system_card_json" not in self.__dict__:
+            # an expired column can not be flagged as modified without loading it, so serialize right away
+            self.sync_system_card()
+            return
+        self._system_card_dirty = True
+        # make sure the session considers the algorithm dirty, so it is serialized when flushing
+        attributes.flag_modified(self, "_system_card_json")
 
     def sync_system_card(self) -> None:
         if self._system_card is not None:
-            self.system_card_json = self._system_card.model_dump(exclude_unset=True, by_alias=True)
+            self._system_card_json = self._system_card.model_dump(exclude_unset=True, by_alias=True)
+            self._sync_facets()
+        self._system_card_dirty = False
+
+    @property
+    def progress(self) -> AlgorithmProgress:
+        if getattr(self, "_system_card_dirty", False):
+            self.sync_system_card()
+        return AlgorithmProgress(self.requirements_completed, self.requirements_total)
+
+    def _sync_facets(self) -> None:
+        # the facets are only assigned, reading them could trigger a (lazy) load of an expired attribute
+        for column, value in get_system_card_facets(self._system_card_json).items():
+            setattr(self, column, value)
+        for column, value in get_system_card_progress(self._system_card_json).items():
+            setattr(self, column, value)
 
 
 Algorithm.__mapper_args__ = {"exclude_properties": ["_system_card"]}
+
+
+@event.listens_for(Session, "before_flush")
+def sync_dirty_system_cards(session: Session, flush_context: UOWTransaction, instances: object) -> None:
+    for instance in (*session.new, *session.dirty):
+        if isinstance(instance, Algorithm) and instance._system_card_dirty:  # pyright: ignore[reportPrivateUsage]
+            instance.sync_system_card()
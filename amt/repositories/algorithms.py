@@ -1,35 +1,48 @@
 import logging
 from collections.abc import Sequence
-from typing import Annotated, cast
+from typing import Annotated, Any, TypeVar, cast
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, Select, func, select
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy_utils import escape_like  # pyright: ignore[reportMissingTypeStubs, reportUnknownVariableType]
 
 from amt.api.risk_group import RiskGroup
 from amt.core.authorization import AuthorizationType
-from amt.core.exceptions import AMTRepositoryError
+from amt.core.exceptions import AMTRepositoryError, AMTValueError
 from amt.models import Algorithm, Authorization
 from amt.repositories.deps import AsyncSessionWithCommitFlag, get_session
+from amt.repositories.pagination import (
+    Page,
+    SortKey,
+    count_rows,
+    paginate_keyset,
+    paginate_keyset_groups,
+    scoped_sort_name,
+)
 from amt.repositories.repository_classes import BaseRepository
+from amt.schema.algorithm import AlgorithmProgress, AlgorithmSummary
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T", bound=tuple[Any, ...])
 
-def sort_by_lifecycle(algorithm: Algorithm) -> int:
-    if algorithm.lifecycle:
-        return algorithm.lifecycle.index
-    else:
-        return -1
+SUMMARY_COLUMNS = (
+    Algorithm.id,
+    Algorithm.name,
+    Algorithm.lifecycle,
+    Algorithm.last_edited,
+    Algorithm.requirements_completed,
+    Algorithm.requirements_total,
+)
 
 
-def sort_by_lifecycle_reversed(algorithm: Algorithm) -> int:
-    if algorithm.lifecycle:
-        return -algorithm.lifecycle.index
-    else:
-        return 1
+def to_summary(row: Sequence[Any]) -> AlgorithmSummary:
+    """
+    Returns the summary of a row that starts with the SUMMARY_COLUMNS.
+    """
+    return AlgorithmSummary(row[0], row[1], row[2], row[3], AlgorithmProgress(*row[4 : len(SUMMARY_COLUMNS)]))
 
 
 class AlgorithmsRepository(BaseRepository):
@@ -64,66 +77,119 @@ class AlgorithmsRepository(BaseRepository):
             logger.exception("Algorithm not found")
             raise AMTRepositoryError from e
 
-    async def paginate(  # noqa
-        self, skip: int, limit: int, search: str, filters: dict[str, str | list[str | int]], sort: dict[str, str]
-    ) -> list[Algorithm]:
+    async def page_summaries(
+        self,
+        limit: int,
+        search: str,
+        filters: dict[str, str | list[str | int]],
+        sort: dict[str, str],
+        cursor: str | None = None,
+    ) -> Page[AlgorithmSummary]:
+        """
+        Returns the page of algorithm summaries after the given cursor, see `paginate_keyset`.
+        Only the columns needed for overviews are selected, so the system card and the relationships
+        of the algorithms are not loaded.
+        """
         try:
-            statement = select(Algorithm)
-            if search != "":
-                statement = statement.filter(Algorithm.name.ilike(f"%{escape_like(search)}%"))
-            if filters:
-                for key, value in filters.items():
-                    match key:
-                        case "user_id":
-                            user_id = (
-                                UUID(filters["user_id"]) if isinstance(filters["user_id"], str) else filters["user_id"]
-                            )
-                            statement = (
-                                statement.where(Authorization.type_id == Algorithm.id)
-                                .where(Authorization.user_id == user_id)
-                                .where(Authorization.type == AuthorizationType.ALGORITHM)
-                            )
-                        case "id":
-                            statement = statement.where(Algorithm.id == int(cast(str, value)))
-                        case "lifecycle":
-                            statement = statement.filter(Algorithm.lifecycle == value)
-                        case "risk-group":
-                            statement = statement.filter(
-                                Algorithm.system_card_json["ai_act_profile"]["risk_group"].as_string()
-                                == RiskGroup[cast(str, value)].value
-                            )
-                        case "organization-id":
-                            value = [int(value)] if not isinstance(value, list) else [int(v) for v in value]
-                            statement = statement.filter(Algorithm.organization_id.in_(value))
-                        case _:
-                            raise TypeError(f"Unknown filter type with key: {key}")  # noqa
-            if sort:
-                if "name" in sort and sort["name"] == "ascending":
-                    statement = statement.order_by(func.lower(Algorithm.name).asc())
-                elif "name" in sort and sort["name"] == "descending":
-                    statement = statement.order_by(func.lower(Algorithm.name).desc())
-                elif "last_update" in sort and sort["last_update"] == "ascending":
-                    statement = statement.order_by(Algorithm.last_edited.asc())
-                elif "last_update" in sort and sort["last_update"] == "descending":
-                    statement = statement.order_by(Algorithm.last_edited.desc())
-            else:
-                statement = statement.order_by(func.lower(Algorithm.name))
-            statement = statement.filter(Algorithm.deleted_at.is_(None))
-            statement = statement.offset(skip).limit(limit)
-            db_result = await self.session.execute(statement)
-            result = list(db_result.scalars())
-            # todo: the good way to do sorting is to use an enum field (or any int field)
-            #  in the database so we can sort on that
-            if result and sort and "lifecycle" in sort:
-                if sort["lifecycle"] == "ascending":
-                    result = sorted(result, key=sort_by_lifecycle)
-                else:
-                    result = sorted(result, key=sort_by_lifecycle_reversed)
-            return result  # noqa
+            sort_name, keys = self._sort_keys(sort)
+            statement = self._filter_statement(select(*SUMMARY_COLUMNS), search, filters)
+            sort_name = scoped_sort_name(sort_name, search, filters)
+            page = await paginate_keyset(self.session, statement, keys, sort_name, limit, cursor)
+            return Page([to_summary(row) for row in page.items], page.next_cursor)
+        except AMTValueError:
+            raise
         except Exception as e:
             logger.exception("Error paginating algorithms")
             raise AMTRepositoryError from e
 
+    async def count(self, search: str, filters: dict[str, str | list[str | int]]) -> int:
+        try:
+            return await count_rows(self.session, self._filter_statement(select(Algorithm.id), search, filters))
+        except Exception as e:
+            logger.exception("Error counting algorithms")
+            raise AMTRepositoryError from e
+
+    async def find_summaries_by_lifecycle(
+        self, limit: int, search: str, filters: dict[str, str | list[str | int]], sort: dict[str, str]
+    ) -> tuple[dict[str, Page[AlgorithmSummary]], dict[str, int]]:
+        """
+        Finds the first page of algorithms of each lifecycle in a single query, see `paginate_keyset_groups`.
+        The next pages of a lifecycle are fetched with `page_summaries`, filtered on that lifecycle.
+        Algorithms without a lifecycle are left out.
+        :return: the pages and the total number of matching algorithms, both per lifecycle name
+        """
+        try:
+            sort_name, keys = self._sort_keys(sort)
+            statement = self._filter_statement(select(*SUMMARY_COLUMNS), search, filters)
+            groups = await paginate_keyset_groups(
+                self.session,
+                statement,
+                Algorithm.lifecycle,
+                keys,
+                # the cursor of a lifecycle continues with page_summaries filtered on that lifecycle
+                lambda lifecycle: scoped_sort_name(sort_name, search, {**filters, "lifecycle": lifecycle.value}),
+                limit,
+            )
+        except Exception as e:
+            logger.exception("Error finding algorithms by lifecycle")
+            raise AMTRepositoryError from e
+        pages: dict[str, Page[AlgorithmSummary]] = {}
+        counts: dict[str, int] = {}
+        for lifecycle, (page, count) in groups.items():
+            pages[lifecycle.name] = Page([to_summary(row) for row in page.items], page.next_cursor)
+            counts[lifecycle.name] = count
+        return pages, counts
+
+    @staticmethod
+    def _filter_statement(  # noqa: C901
+        statement: Select[T], search: str, filters: dict[str, str | list[str | int]]
+    ) -> Select[T]:
+        if search != "":
+            statement = statement.filter(Algorithm.name.ilike(f"%{escape_like(search)}%"))
+        if filters:
+            for key, value in filters.items():
+                match key:
+                    case "user_id":
+                        user_id = (
+                            UUID(filters["user_id"]) if isinstance(filters["user_id"], str) else filters["user_id"]
+                        )
+                        statement = (
+                            statement.where(Authorization.type_id == Algorithm.id)
+                            .where(Authorization.user_id == user_id)
+                            .where(Authorization.type == AuthorizationType.ALGORITHM)
+                        )
+                    case "id":
+                        statement = statement.where(Algorithm.id == int(cast(str, value)))
+                    case "lifecycle":
+                        statement = statement.filter(Algorithm.lifecycle == value)
+                    case "risk-group":
+                        statement = statement.filter(Algorithm.risk_group == RiskGroup[cast(str, value)].value)
+                    case "organization-id":
+                        value = [int(value)] if not isinstance(value, list) else [int(v) for v in value]
+                        statement = statement.filter(Algorithm.organization_id.in_(value))
+                    case _:
+                        raise TypeError(f"Unknown filter type with key: {key}")
+        return statement.filter(Algorithm.deleted_at.is_(None))
+
+    @staticmethod
+    def _sort_keys(sort: dict[str, str]) -> tuple[str, list[SortKey]]:
+        """
+        Returns the name and the keyset sort keys for the given sort, with the id as tiebreaker.
+        Sorts by name when no (known) sort is given.
+        """
+        sortable: dict[str, ColumnElement[Any]] = {
+            "name": func.lower(Algorithm.name),
+            "last_update": Algorithm.last_edited,
+            "lifecycle": Algorithm.lifecycle_index,
+        }
+        for field, expression in sortable.items():
+            if sort.get(field) in ("ascending", "descending"):
+                return f"{field}:{sort[field]}", [
+                    SortKey(expression, descending=sort[field] == "descending"),
+                    SortKey(Algorithm.id),
+                ]
+        return "name:ascending", [SortKey(sortable["name"]), SortKey(Algorithm.id)]
+
     async def get_by_user_and_organization(self, user_id: UUID, organization_id: int) -> Sequence[Algorithm]:
         statement = (
             select(Algorithm)
@@ -1,20 +1,23 @@
 import logging
 from collections.abc import Sequence
-from typing import Annotated, cast
+from functools import partial
+from typing import Annotated, Any, cast
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import BindParameter, BooleanClauseList, delete, func, literal, select
+from sqlalchemy import BindParameter, BooleanClauseList, Select, delete, func, literal, select
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy_utils import escape_like  # pyright: ignore[reportMissingTypeStubs, reportUnknownVariableType]
 
 from amt.core.authorization import AuthorizationResource, AuthorizationType, AuthorizationVerb
 from amt.core.exceptions import AMTRepositoryError
+from amt.core.permission_cache import permission_cache
 from amt.models import Algorithm, Authorization, Organization, Role, Rule, User
 from amt.models.base import Base
 from amt.repositories.algorithms import AlgorithmsRepository
 from amt.repositories.deps import AsyncSessionWithCommitFlag, get_session
 from amt.repositories.organizations import OrganizationsRepository
+from amt.repositories.pagination import Page, SortKey, count_rows, paginate_keyset, scoped_sort_name
 from amt.repositories.repository_classes import BaseRepository
 from amt.repositories.users import UsersRepository
 
@@ -74,6 +77,14 @@ class AuthorizationRepository(BaseRepository):
             )
         self.session.add(authorization)
         self.session.should_commit = True
+        self._invalidate_permissions(user_id)
+
+    def _invalidate_permissions(self, user_id: UUID) -> None:
+        """
+        Drops the cached permissions of the user once the changes are committed; invalidating before the
+        commit would allow a concurrent request to cache the old permissions again.
+        """
+        self.session.add_after_commit(partial(permission_cache.invalidate, user_id))
 
     @staticmethod
     def get_default_permissions() -> PermissionsList:
@@ -123,6 +134,7 @@ class AuthorizationRepository(BaseRepository):
         )
         self.session.should_commit = True
         await self.session.execute(statement)
+        self._invalidate_permissions(user_id)
 
     async def remove_algorithm_roles(self, user_id: str | UUID, algorithm: Algorithm | list[Algorithm]) -> None:
         ids = [algorithm.id for algorithm in algorithm] if isinstance(algorithm, list) else [algorithm.id]
@@ -147,8 +159,6 @@ class AuthorizationRepository(BaseRepository):
         search: str | None = None,
         sort: dict[str, str] | None = None,
         filters: dict[str, str | list[str | int]] | None = None,
-        skip: int | None = None,
-        limit: int | None = None,
     ) -> list[tuple[User, Authorization, Role]]:
         statement = (
             select(User, Authorization, Role)
@@ -164,10 +174,6 @@ class AuthorizationRepository(BaseRepository):
                 statement = statement.order_by(func.lower(User.name).asc())
             elif "name" in sort and sort["name"] == "descending":
                 statement = statement.order_by(func.lower(User.name).desc())
-        if skip:
-            statement = statement.offset(skip)
-        if limit:
-            statement = statement.limit(limit)
         return cast(list[tuple[User, Authorization, Role]], (await self.session.execute(statement)).fetchall())
 
     async def get_by_id(self, authorization_id: int) -> Authorization | None:
@@ -195,16 +201,60 @@ class AuthorizationRepository(BaseRepository):
         self.session.add(authorization)
         await self.session.flush()
         self.session.should_commit = True
+        self._invalidate_permissions(authorization.user_id)
         return authorization
 
-    async def find_all(  # noqa C901
+    async def find_all(
         self,
         search: str | None = None,
         sort: dict[str, str] | None = None,
         filters: dict[str, str | int | list[str | int] | AuthorizationType] | None = None,
-        skip: int | None = None,
-        limit: int | None = None,
     ) -> list[tuple[User, Authorization, Role, type[Base] | None]]:
+        statement = self._find_all_statement(search, filters)
+        if sort:
+            if "name" in sort and sort["name"] == "ascending":
+                statement = statement.order_by(func.lower(User.name).asc())
+            elif "name" in sort and sort["name"] == "descending":
+                statement = statement.order_by(func.lower(User.name).desc())
+        statement = statement.order_by(User.name.asc())
+
+        # Get the result with all the fields
+        return cast(
+            list[tuple[User, Authorization, Role, type[Base] | None]],
+            (await self.session.execute(statement)).fetchall(),
+        )
+
+    async def page_all(
+        self,
+        limit: int,
+        search: str | None = None,
+        sort: dict[str, str] | None = None,
+        filters: dict[str, str | int | list[str | int] | AuthorizationType] | None = None,
+        cursor: str | None = None,
+    ) -> Page[tuple[User, Authorization, Role, type[Base] | None]]:
+        """
+        Returns the page of users with their authorization after the given cursor, see `paginate_keyset`.
+        """
+        descending = sort is not None and sort.get("name") == "descending"
+        keys = [SortKey(func.lower(User.name), descending=descending), SortKey(Authorization.id)]
+        sort_name = scoped_sort_name("name:descending" if descending else "name:ascending", search, filters)
+        page = await paginate_keyset(
+            self.session, self._find_all_statement(search, filters), keys, sort_name, limit, cursor
+        )
+        return Page(cast(list[tuple[User, Authorization, Role, type[Base] | None]], page.items), page.next_cursor)
+
+    async def count_all(
+        self,
+        search: str | None = None,
+        filters: dict[str, str | int | list[str | int] | AuthorizationType] | None = None,
+    ) -> int:
+        return await count_rows(self.session, self._find_all_statement(search, filters))
+
+    @staticmethod
+    def _find_all_statement(  # noqa C901
+        search: str | None = None,
+        filters: dict[str, str | int | list[str | int] | AuthorizationType] | None = None,
+    ) -> Select[Any]:
         type_mappings = {
             AuthorizationType.ALGORITHM: {
                 "table": Algorithm,
@@ -249,22 +299,7 @@ class AuthorizationRepository(BaseRepository):
             statement = statement.where(
                 Authorization.type_id == filters["type_id"],
             )
-        if sort:
-            if "name" in sort and sort["name"] == "ascending":
-                statement = statement.order_by(func.lower(User.name).asc())
-            elif "name" in sort and sort["name"] == "descending":
-                statement = statement.order_by(func.lower(User.name).desc())
-        if skip:
-            statement = statement.offset(skip)
-        if limit:
-            statement = statement.limit(limit)
-        statement = statement.order_by(User.name.asc())
-
-        # Get the result with all the fields
-        return cast(
-            list[tuple[User, Authorization, Role, type[Base] | None]],
-            (await self.session.execute(statement)).fetchall(),
-        )
+        return statement
 
     async def find_all_by_user_and_type(
         self, user_id: str | UUID, authorization_type: AuthorizationType
@@ -1,10 +1,11 @@
 import logging
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from typing import Any
 
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from amt.core.db import get_engine
 from amt.core.exceptions import AMTRepositoryError
@@ -26,6 +27,7 @@ class AsyncSessionWithCommitFlag(AsyncSession):
     def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa ANN401
         super().__init__(*args, **kwargs)
         self._should_commit: bool = False
+        self._after_commit: list[Callable[[], Awaitable[None]]] = []
 
     @property
     def should_commit(self) -> bool:
@@ -37,27 +39,97 @@ class AsyncSessionWithCommitFlag(AsyncSession):
         """Sets whether this session should be committed"""
         self._should_commit = value
 
+    def add_after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Registers a callback to run once the changes of this session are committed"""
+        self._after_commit.append(callback)
+
+    async def run_after_commit(self) -> None:
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception:
+                logger.exception("After commit callback failed")
+
+
+_session_factory: tuple[AsyncEngine, async_sessionmaker[AsyncSessionWithCommitFlag]] | None = None
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSessionWithCommitFlag]:
+    """Returns the session factory of the current engine, it is only created again if the engine is reset"""
+    global _session_factory
+    engine = get_engine()
+    if _session_factory is None or _session_factory[0] is not engine:
+        _session_factory = (
+            engine,
+            async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSessionWithCommitFlag),
+        )
+    return _session_factory[1]
+
+
+class RequestSession:
+    """
+    The database session of a single request, shared by the middleware, the permission checks and the
+    route, so a request checks out a single connection.
+
+    The session is created when it is first used, requests that do not use the database do not check out
+    a connection at all.
+    """
+
+    def __init__(self) -> None:
+        self._session: AsyncSessionWithCommitFlag | None = None
+
+    @property
+    def session(self) -> AsyncSessionWithCommitFlag:
+        if self._session is None:
+            self._session = get_session_factory()()
+            self._session.info["id"] = str(id(self._session)) + " (request)"
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+_request_session: ContextVar[RequestSession | None] = ContextVar("request_session", default=None)
+
+
+def get_request_session() -> RequestSession | None:
+    """Returns the session of the current request, None outside a request_session_scope"""
+    return _request_session.get()
+
+
+@asynccontextmanager
+async def request_session_scope() -> AsyncGenerator[RequestSession, None]:
+    """
+    Makes a RequestSession the session of all code running within this scope, including tasks it starts,
+    and closes it when leaving the scope.
+    """
+    request_session = RequestSession()
+    token = _request_session.set(request_session)
+    try:
+        yield request_session
+    finally:
+        _request_session.reset(token)
+        await request_session.close()
+
 
 async def get_session() -> AsyncGenerator[AsyncSessionWithCommitFlag, None]:
     """Provides either a read-only or auto-commit session based on the mode"""
-    async_session_factory = async_sessionmaker(
-        get_engine(),
-        expire_on_commit=False,
-        class_=AsyncSessionWithCommitFlag,
-    )
+    request_session = get_request_session()
+    if request_session is not None:
+        async with transaction_context(request_session.session) as tx_session:
+            yield tx_session
+        return
 
-    async with async_session_factory() as session, transaction_context(session) as tx_session:
+    async with get_session_factory()() as session, transaction_context(session) as tx_session:
         tx_session.info["id"] = str(id(tx_session)) + " (auto-commit)"
         yield tx_session
 
 
 async def get_session_non_generator() -> AsyncSessionWithCommitFlag:
-    async_session_factory = async_sessionmaker(
-        get_engine(),
-        expire_on_commit=False,
-        class_=AsyncSessionWithCommitFlag,
-    )
-    async_session = async_session_factory()
+    async_session = get_session_factory()()
     async_session.info["id"] = id(async_session)
     return async_session
 
@@ -68,6 +140,7 @@ async def transaction_context(session: AsyncSessionWithCommitFlag) -> AsyncGener
         yield session
         if session.should_commit:
             await session.commit()
+            await session.run_after_commit()
         elif session.dirty or session.new or session.deleted:
             logger.warning("Session changes detected, but no commit flag found. This is undesirable, check your code.")
     except SQLAlchemyError as e:
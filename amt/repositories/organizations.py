@@ -1,10 +1,14 @@
 import logging
+import sys
+import time
+from collections import OrderedDict
 from collections.abc import Sequence
+from functools import partial
 from typing import Annotated, Any
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import Select, func, select
+from sqlalchemy import ColumnElement, Select, func, select
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import lazyload
 from sqlalchemy_utils import escape_like  # pyright: ignore[reportMissingTypeStubs, reportUnknownVariableType]
@@ -14,11 +18,53 @@ from amt.core.authorization import AuthorizationType
 from amt.core.exceptions import AMTRepositoryError
 from amt.models import Authorization, Organization
 from amt.repositories.deps import AsyncSessionWithCommitFlag, get_session
+from amt.repositories.pagination import Page, SortKey, paginate_keyset, scoped_sort_name
 from amt.repositories.repository_classes import BaseRepository
 
 logger = logging.getLogger(__name__)
 
 
+class OrganizationSlugCache:
+    """
+    A small least recently used cache of organization ids by slug, in the memory of a single worker.
+
+    The entries of an organization are dropped when it is saved, as a rename or delete changes what its
+    slug resolves to. Entries expire after the TTL, like the permission cache, so a change made on another
+    worker is picked up eventually. A max size of 0 disables the cache.
+    """
+
+    def __init__(self, ttl_seconds: int = 60, max_size: int = 256) -> None:
+        self._entries: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        self._ttl = ttl_seconds
+        self._max_size = max_size
+
+    def get(self, slug: str) -> int | None:
+        entry = self._entries.get(slug)
+        if entry is None:
+            return None
+        organization_id, expires_at = entry
+        if time.monotonic() > expires_at:
+            del self._entries[slug]
+            return None
+        self._entries.move_to_end(slug)
+        return organization_id
+
+    def set(self, slug: str, organization_id: int) -> None:
+        if self._max_size <= 0:
+            return
+        self._entries[slug] = (organization_id, time.monotonic() + self._ttl)
+        self._entries.move_to_end(slug)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, organization_id: int) -> None:
+        for slug in [slug for slug, (entry_id, _) in self._entries.items() if entry_id == organization_id]:
+            del self._entries[slug]
+
+
+organization_slug_cache = OrganizationSlugCache(max_size=0 if "pytest" in sys.modules else 256)
+
+
 class OrganizationsRepository(BaseRepository):
     def __init__(self, session: Annotated[AsyncSessionWithCommitFlag, Depends(get_session)]) -> None:
         super().__init__(session)
@@ -28,14 +74,12 @@ class OrganizationsRepository(BaseRepository):
         statement = statement.options(lazyload("*"))
         return statement
 
-    def _find_by(  # noqa
+    def _find_by(
         self,
         sort: dict[str, str] | None = None,
         filters: dict[str, str] | None = None,
         user_id: str | UUID | None = None,
         search: str | None = None,
-        skip: int | None = None,
-        limit: int | None = None,
     ) -> Select[Any]:
         user_id = UUID(user_id) if isinstance(user_id, str) else user_id
         statement = select(Organization)
@@ -63,10 +107,6 @@ class OrganizationsRepository(BaseRepository):
             elif "last_update" in sort and sort["last_update"] == "descending":
                 statement = statement.order_by(Organization.modified_at.desc())
         statement = statement.where(Organization.deleted_at.is_(None))
-        if skip:
-            statement = statement.offset(skip)
-        if limit:
-            statement = statement.limit(limit)
         # to force lazy-loading, use line below
         # statement = statement.options(lazyload('*')) # noqa
         return statement
@@ -77,22 +117,54 @@ class OrganizationsRepository(BaseRepository):
         filters: dict[str, str] | None = None,
         user_id: str | UUID | None = None,
         search: str | None = None,
-        skip: int | None = None,
-        limit: int | None = None,
     ) -> Sequence[Organization]:
-        statement = self._find_by(sort=sort, filters=filters, user_id=user_id, search=search, skip=skip, limit=limit)
+        statement = self._find_by(sort=sort, filters=filters, user_id=user_id, search=search)
         return (await self.session.execute(statement)).scalars().all()
 
+    async def page_by(
+        self,
+        limit: int,
+        sort: dict[str, str] | None = None,
+        filters: dict[str, str] | None = None,
+        user_id: str | UUID | None = None,
+        search: str | None = None,
+        cursor: str | None = None,
+    ) -> Page[Organization]:
+        """
+        Returns the page of organizations after the given cursor, see `paginate_keyset`.
+        """
+        sort_name, keys = self._sort_keys(sort or {})
+        statement = self._find_by(filters=filters, user_id=user_id, search=search)
+        sort_name = scoped_sort_name(sort_name, search, filters, user_id)
+        page = await paginate_keyset(self.session, statement, keys, sort_name, limit, cursor)
+        return Page([row[0] for row in page.items], page.next_cursor)
+
+    @staticmethod
+    def _sort_keys(sort: dict[str, str]) -> tuple[str, list[SortKey]]:
+        """
+        Returns the name and the keyset sort keys for the given sort, with the id as tiebreaker.
+        Sorts by name when no (known) sort is given.
+        """
+        sortable: dict[str, ColumnElement[Any]] = {
+            "name": func.lower(Organization.name),
+            "last_update": Organization.modified_at,
+        }
+        for field, expression in sortable.items():
+            if sort.get(field) in ("ascending", "descending"):
+                return f"{field}:{sort[field]}", [
+                    SortKey(expression, descending=sort[field] == "descending"),
+                    SortKey(Organization.id),
+                ]
+        return "name:ascending", [SortKey(sortable["name"]), SortKey(Organization.id)]
+
     async def find_by_as_count(
         self,
         sort: dict[str, str] | None = None,
         filters: dict[str, str] | None = None,
         user_id: str | UUID | None = None,
         search: str | None = None,
-        skip: int | None = None,
-        limit: int | None = None,
     ) -> Any:  # noqa
-        statement = self._find_by(sort=sort, filters=filters, user_id=user_id, search=search, skip=skip, limit=limit)
+        statement = self._find_by(sort=sort, filters=filters, user_id=user_id, search=search)
         statement = self._as_count_query(statement)
         return (await self.session.execute(statement)).scalars().first()
 
@@ -100,15 +172,42 @@ class OrganizationsRepository(BaseRepository):
         self.session.add(organization)
         await self.session.flush()
         self.session.should_commit = True
+        organization_slug_cache.invalidate(organization.id)
+        self.session.add_after_commit(partial(self._invalidate_slug, organization.id))
         return organization
 
+    @staticmethod
+    async def _invalidate_slug(organization_id: int) -> None:
+        organization_slug_cache.invalidate(organization_id)
+
     async def find_by_slug(self, slug: str) -> Organization:
         try:
             statement = select(Organization).where(Organization.slug == slug).where(Organization.deleted_at.is_(None))
-            return (await self.session.execute(statement)).scalars().one()
+            organization = (await self.session.execute(statement)).scalars().one()
+        except NoResultFound as e:
+            logger.exception("Organization not found")
+            raise AMTRepositoryError from e
+        organization_slug_cache.set(slug, organization.id)
+        return organization
+
+    async def find_id_by_slug(self, slug: str) -> int:
+        """
+        Returns the id of the organization with the given slug, from the slug cache if possible,
+        without loading the organization.
+        """
+        organization_id = organization_slug_cache.get(slug)
+        if organization_id is not None:
+            return organization_id
+        try:
+            statement = (
+                select(Organization.id).where(Organization.slug == slug).where(Organization.deleted_at.is_(None))
+            )
+            organization_id = (await self.session.execute(statement)).scalars().one()
         except NoResultFound as e:
             logger.exception("Organization not found")
             raise AMTRepositoryError from e
+        organization_slug_cache.set(slug, organization_id)
+        return organization_id
 
     async def find_by_id(self, organization_id: int) -> Organization:
         try:
@@ -0,0 +1,215 @@
+import base64
+import binascii
+import hashlib
+import json
+import sqlite3
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, DateTime, Select, and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from amt.core.exceptions import AMTValueError
+
+
+@dataclass(frozen=True, slots=True)
+class SortKey:
+    """
+    A column (expression) a keyset page is ordered by. The last key of a sort must be unique, so rows
+    with equal values for the other keys still have a stable order.
+    """
+
+    expression: ColumnElement[Any]
+    descending: bool = False
+
+
+@dataclass(slots=True)
+class Page[I]:
+    """
+    A page of results and the cursor to fetch the next page with, None if this is the last page.
+    """
+
+    items: list[I]
+    next_cursor: str | None = None
+
+
+def scoped_sort_name(sort_name: str, *scope: Any) -> str:  # noqa: ANN401
+    """
+    Returns the sort name bound to the given values, like the search and filters of the rows, so a cursor
+    created for other values is rejected instead of continuing on another result.
+    """
+    digest = hashlib.sha256(json.dumps(scope, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    return f"{sort_name}@{digest[:16]}"
+
+
+def encode_cursor(sort_name: str, values: Sequence[Any]) -> str:
+    """
+    Encodes the sort key values of the last row of a page into an opaque, URL safe cursor.
+    """
+    payload = {"s": sort_name, "v": [_encode_value(value) for value in values]}
+    data = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(data).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_name: str, size: int) -> list[Any]:
+    """
+    Decodes a cursor created by `encode_cursor` for the given sort.
+    :raises AMTValueError: if the cursor is malformed or was created for another sort
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        values = [_decode_value(value) for value in payload["v"]] if payload["s"] == sort_name else []
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise AMTValueError("cursor") from e
+    if len(values) != size:
+        raise AMTValueError("cursor")
+    return values
+
+
+def keyset_condition(keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement[bool]:
+    """
+    Returns the condition that selects the rows after the given sort key values, for any mix of
+    ascending and descending keys: (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ...
+    """
+    clauses: list[ColumnElement[bool]] = []
+    for position, key in enumerate(keys):
+        value = values[position]
+        after = key.expression < value if key.descending else key.expression > value
+        equals = [keys[i].expression == values[i] for i in range(position)]
+        clauses.append(and_(*equals, after))
+    return or_(*clauses)
+
+
+async def paginate_keyset[T: tuple[Any, ...]](
+    session: AsyncSession,
+    statement: Select[T],
+    keys: Sequence[SortKey],
+    sort_name: str,
+    limit: int,
+    cursor: str | None = None,
+) -> Page[tuple[Any, ...]]:
+    """
+    Fetches the page of rows after the cursor, ordered by the given keys.
+
+    Instead of skipping rows with an offset, the rows are selected by comparing the sort keys with the
+    values of the last row of the previous page, so every page costs the same as the first one. The key
+    values are selected along with the rows, the returned rows do not include them.
+    :param sort_name: identifies the sort, so a cursor can not be used with another sort
+    """
+    keys = [_comparable(key, session.get_bind().dialect.name) for key in keys]
+    if cursor is not None:
+        statement = statement.where(keyset_condition(keys, decode_cursor(cursor, sort_name, len(keys))))
+    statement = (
+        statement.add_columns(*(key.expression for key in keys))
+        .order_by(*(key.expression.desc() if key.descending else key.expression.asc() for key in keys))
+        .limit(limit + 1)
+    )
+    rows = list((await session.execute(statement)).all())
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(sort_name, rows[-1][-len(keys) :])
+    return Page(items=[tuple(row[: -len(keys)]) for row in rows], next_cursor=next_cursor)
+
+
+async def paginate_keyset_groups[T: tuple[Any, ...]](
+    session: AsyncSession,
+    statement: Select[T],
+    group: ColumnElement[Any],
+    keys: Sequence[SortKey],
+    sort_name: Callable[[Any], str],
+    limit: int,
+) -> dict[Any, tuple[Page[tuple[Any, ...]], int]]:
+    """
+    Fetches the first page of every group in a single query, ordered by the given keys, with the number of
+    rows of each group. Rows without a group are left out.
+
+    The cursor of a group fetches the next page with `paginate_keyset`, for the statement filtered on
+    the group and the sort name of the group.
+    :param sort_name: returns the sort name for the cursor of the given group
+    """
+    keys = [_comparable(key, session.get_bind().dialect.name) for key in keys]
+    order_by = [key.expression.desc() if key.descending else key.expression.asc() for key in keys]
+    statement = statement.where(group.is_not(None))
+    size = len(statement.selected_columns)
+    rows: list[Any] = []
+    counts: dict[Any, int] = {}
+
+    if _supports_window_functions(session):
+        ranked = statement.add_columns(
+            group.label("group_key"),
+            *(key.expression.label(f"sort_key_{position}") for position, key in enumerate(keys)),
+            func.row_number().over(partition_by=group, order_by=order_by).label("row_number"),
+            func.count().over(partition_by=group).label("group_count"),
+        ).subquery()
+        rows = list(
+            (
+                await session.execute(
+                    select(*ranked.c)
+                    .where(ranked.c.row_number <= limit)
+                    .order_by(ranked.c.group_key, ranked.c.row_number)
+                )
+            ).all()
+        )
+        counts = {row[size]: row[-1] for row in rows}
+    else:
+        # without window functions all rows are fetched, only the rows of the first pages are kept
+        ordered = statement.add_columns(group, *(key.expression for key in keys)).order_by(*order_by)
+        for row in (await session.execute(ordered)).all():
+            counts[row[size]] = counts.get(row[size], 0) + 1
+            if counts[row[size]] <= limit:
+                rows.append(row)
+
+    items: dict[Any, list[Any]] = {}
+    for row in rows:
+        items.setdefault(row[size], []).append(row)
+    pages: dict[Any, tuple[Page[tuple[Any, ...]], int]] = {}
+    for group_value, group_rows in items.items():
+        next_cursor = None
+        if counts[group_value] > limit:
+            next_cursor = encode_cursor(sort_name(group_value), group_rows[-1][size + 1 : size + 1 + len(keys)])
+        pages[group_value] = (Page([tuple(row[:size]) for row in group_rows], next_cursor), counts[group_value])
+    return pages
+
+
+async def count_rows(session: AsyncSession, statement: Select[Any]) -> int:
+    """
+    Returns the number of rows the given statement selects.
+    """
+    count_statement = select(func.count()).select_from(statement.order_by(None).subquery())
+    return (await session.execute(count_statement)).scalar_one()
+
+
+def _supports_window_functions(session: AsyncSession) -> bool:
+    # window functions are available in SQLite from version 3.25 on
+    return session.get_bind().dialect.name != "sqlite" or sqlite3.sqlite_version_info >= (3, 25)
+
+
+def _comparable(key: SortKey, dialect_name: str) -> SortKey:
+    # SQLite stores datetimes as text, in another format for server defaults (CURRENT_TIMESTAMP) than for
+    # values written by SQLAlchemy, so they are compared and ordered in a single format
+    if dialect_name == "sqlite" and isinstance(key.expression.type, DateTime):
+        return SortKey(func.strftime("%Y-%m-%d %H:%M:%f", key.expression), key.descending)
+    return key
+
+
+def _encode_value(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, dict):
+        if "datetime" in value:
+            return datetime.fromisoformat(value["datetime"])  # pyright: ignore[reportUnknownArgumentType]
+        if "uuid" in value:
+            return UUID(value["uuid"])  # pyright: ignore[reportUnknownArgumentType]
+        raise ValueError("Unknown cursor value")
+    return value
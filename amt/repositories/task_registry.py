@@ -3,8 +3,9 @@ import logging
 from collections.abc import Sequence
 from typing import Any
 
-from amt.clients.clients import TaskRegistryAPIClient, TaskType, get_task_by_urn
+from amt.clients.clients import TaskRegistryAPIClient, TaskType, get_task_by_urn, task_registry_api_client
 from amt.core.exceptions import AMTNotFound
+from amt.repositories.task_registry_mirror import TaskRegistryMirror, task_registry_mirror
 
 logger = logging.getLogger(__name__)
 
@@ -12,10 +13,23 @@ logger = logging.getLogger(__name__)
 class TaskRegistryRepository:
     """
     Responsible for fetching tasks (instruments, measures, etc.) from the Task Registry API.
+
+    When a loaded mirror is available, tasks are served from the mirror and only URNs unknown to
+    the mirror are fetched from the Task Registry API.
     """
 
-    def __init__(self, client: TaskRegistryAPIClient) -> None:
+    def __init__(self, client: TaskRegistryAPIClient, mirror: TaskRegistryMirror | None = None) -> None:
         self.client = client
+        self.mirror = mirror
+
+    @property
+    def registry_version(self) -> str | None:
+        """
+        The version of the loaded mirror, or None if tasks are fetched from the Task Registry API directly.
+        """
+        if self.mirror is None:
+            return None
+        return self.mirror.version
 
     async def fetch_tasks(self, task_type: TaskType, urns: str | Sequence[str] | None = None) -> list[dict[str, Any]]:
         """
@@ -27,15 +41,42 @@ class TaskRegistryRepository:
         @param urns: URNs of tasks to fetch. If None, function returns all tasks of the given type.
         @return: List of task data dictionaries with the given URNs in 'urns'.
         """
+        if isinstance(urns, str):
+            urns = [urns]
+
+        if self.mirror is not None and self.mirror.is_loaded:
+            return await self._fetch_tasks_from_mirror(self.mirror, task_type, urns)
+
         if urns is None:
             all_valid_urns: list[str] = await self._fetch_valid_urns(task_type)
             return await self._fetch_tasks_by_urns(task_type, all_valid_urns)
 
-        if isinstance(urns, str):
-            urns = [urns]
-
         return await self._fetch_tasks_by_urns(task_type, urns)
 
+    async def _fetch_tasks_from_mirror(
+        self, mirror: TaskRegistryMirror, task_type: TaskType, urns: Sequence[str] | None
+    ) -> list[dict[str, Any]]:
+        """
+        Serves tasks from the mirror, falling back to the Task Registry API for URNs the mirror does not know.
+        """
+        if urns is None:
+            return mirror.get_all(task_type)
+
+        found: dict[str, dict[str, Any]] = {}
+        missing_urns: list[str] = []
+        for urn in urns:
+            task = mirror.get(task_type, urn)
+            if task is not None:
+                found[urn] = task
+            else:
+                missing_urns.append(urn)
+
+        if missing_urns:
+            for task in await self._fetch_tasks_by_urns(task_type, missing_urns):
+                found[task["urn"]] = task
+
+        return [found[urn] for urn in urns if urn in found]
+
     async def _fetch_valid_urns(self, task_type: TaskType) -> list[str]:
         """
         Fetches all valid URNs for the given task type.
@@ -69,4 +110,4 @@ class TaskRegistryRepository:
         return tasks
 
 
-task_registry_repository = TaskRegistryRepository(client=TaskRegistryAPIClient())
+task_registry_repository = TaskRegistryRepository(client=task_registry_api_client, mirror=task_registry_mirror)
@@ -0,0 +1,156 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from amt.clients.clients import TaskRegistryAPIClient, TaskType, task_registry_api_client
+from amt.core.config import get_settings
+from amt.core.exceptions import AMTNotFound
+
+logger = logging.getLogger(__name__)
+
+# task_type -> version -> urn -> task data
+Snapshot = dict[str, dict[str, dict[str, dict[str, Any]]]]
+
+
+class TaskRegistryMirror:
+    """
+    Local, persistent mirror of the Task Registry.
+
+    The mirror is filled by a bulk snapshot job (see `sync`) and stored on disk, so it survives restarts and
+    can be shared by all workers on the same host. Once loaded, tasks can be served by URN and version without
+    any network round-trip.
+    """
+
+    def __init__(self, client: TaskRegistryAPIClient, snapshot_file: Path | None = None) -> None:
+        self.client = client
+        self.snapshot_file = snapshot_file
+        self.version: str | None = None
+        self.synced_at: float | None = None
+        self._snapshot: Snapshot = {}
+        self._listeners: list[Callable[[str], None]] = []
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.version is not None
+
+    def get(self, task_type: TaskType, urn: str, version: str = "latest") -> dict[str, Any] | None:
+        return self._snapshot.get(task_type.value, {}).get(version, {}).get(urn)
+
+    def get_all(self, task_type: TaskType, version: str = "latest") -> list[dict[str, Any]]:
+        return list(self._snapshot.get(task_type.value, {}).get(version, {}).values())
+
+    def add_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        Registers a callback that is called with the new mirror version whenever the mirror contents change.
+        """
+        self._listeners.append(listener)
+
+    def load(self) -> bool:
+        """
+        Loads the snapshot from disk if it exists.
+        :return: True if a snapshot was loaded, False otherwise
+        """
+        if self.snapshot_file is None or not self.snapshot_file.is_file():
+            return False
+        try:
+            with open(self.snapshot_file) as f:
+                data = json.load(f)
+            self._replace(data["tasks"], data["version"], data["synced_at"])
+        except (OSError, ValueError, KeyError):
+            logger.exception("Could not load task registry snapshot")
+            return False
+        logger.info(f"Loaded task registry snapshot version {self.version}")
+        return True
+
+    async def sync(self) -> bool:
+        """
+        Fetches a full snapshot of all task types from the Task Registry and replaces the mirror contents
+        if anything changed. If fetching fails, the current mirror contents are kept.
+        :return: True if the mirror contents changed, False otherwise
+        """
+        async with self._lock:
+            snapshot: Snapshot = {}
+            for task_type in TaskType:
+                snapshot[task_type.value] = {"latest": await self._fetch_all(task_type)}
+
+            version = self._compute_version(snapshot)
+            if version == self.version:
+                self.synced_at = time.time()
+                return False
+
+            self._replace(snapshot, version, time.time())
+            self._persist()
+            logger.info(f"Synchronized task registry mirror to version {version}")
+            return True
+
+    async def _fetch_all(self, task_type: TaskType) -> dict[str, dict[str, Any]]:
+        content_list = await self.client.get_list_of_task(task_type)
+        urns = [content.urn for content in content_list.root]
+        results = await asyncio.gather(
+            *[self.client.get_task_by_urn(task_type, urn) for urn in urns], return_exceptions=True
+        )
+        tasks: dict[str, dict[str, Any]] = {}
+        for urn, result in zip(urns, results, strict=True):
+            if isinstance(result, dict):
+                tasks[urn] = result
+            elif isinstance(result, AMTNotFound):
+                continue
+            elif isinstance(result, BaseException):
+                raise result
+        return tasks
+
+    @staticmethod
+    def _compute_version(snapshot: Snapshot) -> str:
+        content = json.dumps(snapshot, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(content).hexdigest()[:16]
+
+    def _replace(self, snapshot: Snapshot, version: str, synced_at: float) -> None:
+        changed = version != self.version
+        self._snapshot = snapshot
+        self.version = version
+        self.synced_at = synced_at
+        if changed:
+            for listener in self._listeners:
+                listener(version)
+
+    def _persist(self) -> None:
+        if self.snapshot_file is None or self.version is None:
+            return
+        data = {"version": self.version, "synced_at": self.synced_at, "tasks": self._snapshot}
+        try:
+            self.snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file first so readers never see a partially written snapshot
+            fd, tmp_name = tempfile.mkstemp(dir=self.snapshot_file.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_name, self.snapshot_file)
+        except OSError:
+            logger.exception("Could not persist task registry snapshot")
+
+
+async def sync_task_registry_task(mirror: TaskRegistryMirror, interval: int) -> None:
+    """Background task to periodically refresh the task registry mirror."""
+    while True:
+        try:
+            await mirror.sync()
+            await asyncio.sleep(interval)
+        except asyncio.CancelledError:
+            break
+        except Exception:
+            logger.exception("Error during task registry synchronization")
+            await asyncio.sleep(interval)
+
+
+task_registry_mirror = TaskRegistryMirror(
+    client=task_registry_api_client,
+    snapshot_file=None if "pytest" in sys.modules else get_settings().TASK_REGISTRY_MIRROR_FILE,
+)
@@ -1,10 +1,11 @@
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy import and_, delete, desc, select, update
+from sqlalchemy import and_, case, delete, desc, select, update
 from sqlalchemy.exc import NoResultFound
+from sqlalchemy.orm.attributes import set_committed_value
 
 from amt.core.exceptions import AMTRepositoryError
 from amt.enums.tasks import Status, TaskType
@@ -97,6 +98,40 @@ class TasksRepository(BaseRepository):
             logger.exception("Task not found")
             raise AMTRepositoryError from e
 
+    async def find_by_ids(self, task_ids: Iterable[int]) -> dict[int, Task]:
+        """
+        Returns the tasks with the given ids in one query.
+        :param task_ids: the ids of the tasks to find
+        :return: the found tasks by id or an exception if any task was not found
+        """
+        task_ids = set(task_ids)
+        statement = select(Task).where(Task.id.in_(task_ids))
+        tasks = {task.id: task for task in (await self.session.execute(statement)).scalars().all()}
+        if len(tasks) != len(task_ids):
+            logger.error(f"Tasks not found: {sorted(task_ids - tasks.keys())}")
+            raise AMTRepositoryError
+        return tasks
+
+    async def update_sort_orders(self, sort_orders: Mapping[int, float]) -> None:
+        """
+        Sets the sort order of the tasks with the given ids in a single UPDATE statement. Loaded tasks are
+        updated as well.
+        :param sort_orders: the new sort order by task id
+        """
+        if sort_orders:
+            statement = (
+                update(Task)
+                .where(Task.id.in_(sort_orders.keys()))
+                .values(sort_order=case(dict(sort_orders), value=Task.id))
+                .execution_options(synchronize_session=False)
+            )
+            await self.session.execute(statement)
+            # the new values are known, so loaded tasks are updated without expiring (and reloading) them
+            for task in self.session.identity_map.values():
+                if isinstance(task, Task) and task.id in sort_orders:
+                    set_committed_value(task, "sort_order", sort_orders[task.id])
+            self.session.should_commit = True
+
     async def get_last_task(self, algorithm_id: int) -> Task | None:
         statement = select(Task).where(Task.algorithm_id == algorithm_id).order_by(desc(Task.sort_order)).limit(1)
         return (await self.session.execute(statement)).scalar_one_or_none()
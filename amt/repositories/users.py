@@ -1,5 +1,5 @@
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from typing import Annotated
 from uuid import UUID
 
@@ -35,7 +35,6 @@ class UsersRepository(BaseRepository):
         search: str | None = None,
         sort: dict[str, str] | None = None,
         filters: dict[str, str | list[str | int]] | None = None,
-        skip: int | None = None,
         limit: int | None = None,
     ) -> Sequence[User]:
         statement = select(User)
@@ -47,8 +46,6 @@ class UsersRepository(BaseRepository):
             elif "name" in sort and sort["name"] == "descending":
                 statement = statement.order_by(func.lower(User.name).desc())
         # https://docs.sqlalchemy.org/en/14/orm/loading_relationships.html#lazy-loading
-        if skip:
-            statement = statement.offset(skip)
         if limit:
             statement = statement.limit(limit)
 
@@ -71,6 +68,21 @@ class UsersRepository(BaseRepository):
                 return None
         return self.cache[id]
 
+    async def find_by_ids(self, ids: Iterable[UUID | str]) -> dict[UUID, User]:
+        """
+        Returns the users with the given ids, keyed by id. Users that are not cached are found with a
+        single query. Ids of users that do not exist are left out.
+        :param ids: the ids of the users to find
+        :return: the found users by id
+        """
+        uuids = {UUID(id) if isinstance(id, str) else id for id in ids}
+        missing_ids = [id for id in uuids if self.cache.get(id) is None]
+        if missing_ids:
+            statement = select(User).where(User.id.in_(missing_ids))
+            for user in (await self.session.execute(statement)).scalars():
+                self.cache[user.id] = user
+        return {id: user for id in uuids if (user := self.cache.get(id)) is not None}
+
     async def upsert(self, user: User) -> User:
         """
         Upserts (create or update) a user.
@@ -1,8 +1,12 @@
-from dataclasses import field
+from dataclasses import dataclass, field
+from datetime import datetime
 
 from pydantic import BaseModel, Field
 from pydantic.functional_validators import field_validator
 
+from amt.api.lifecycles import Lifecycles
+from amt.schema.localized_value_item import LocalizedValueItem
+
 
 class AlgorithmBase(BaseModel):
     name: str = Field(min_length=3, max_length=255)
@@ -36,3 +40,39 @@ class AlgorithmNew(AlgorithmBase):
     @classmethod
     def ensure_list(cls, v: list[str] | str) -> list[str]:
         return v if isinstance(v, list) else [v]
+
+
+@dataclass(slots=True, frozen=True)
+class AlgorithmProgress:
+    """
+    The number of completed and total requirements of an algorithm.
+    """
+
+    requirements_completed: int = 0
+    requirements_total: int = 0
+
+
+@dataclass(slots=True)
+class AlgorithmSummary:
+    """
+    Lightweight, detached projection of an algorithm with only the fields the overview lists need.
+    The lifecycle is replaced by its localized value before rendering.
+    """
+
+    id: int
+    name: str
+    lifecycle: Lifecycles | LocalizedValueItem | None
+    last_edited: datetime
+    progress: AlgorithmProgress = field(default_factory=AlgorithmProgress)
+
+
+@dataclass(slots=True)
+class LifecycleGroup:
+    """
+    The first page of algorithms of a lifecycle, the cursor of its next page and the number of algorithms
+    in the lifecycle.
+    """
+
+    algorithms: list[AlgorithmSummary] = field(default_factory=list[AlgorithmSummary])
+    next_cursor: str | None = None
+    total: int = 0
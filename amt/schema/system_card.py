@@ -1,7 +1,8 @@
 from datetime import date, datetime
 from enum import Enum
+from typing import Any
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from amt.schema.ai_act_profile import AiActProfile
 from amt.schema.assessment_card import AssessmentCard
@@ -112,6 +113,33 @@ class Owner(BaseModel):
     )
 
 
+class UrnIndex:
+    """
+    The measure and requirement tasks of a system card by urn.
+
+    An index is built when it is first used and built again when its list of tasks is replaced or changes
+    in length. It is derived from the card, so it never makes two cards unequal.
+    """
+
+    def __init__(self) -> None:
+        self._indexes: dict[str, tuple[list[Any], int, dict[str, Any]]] = {}
+
+    def get[T: MeasureTask | RequirementTask](self, name: str, tasks: list[T], urn: str) -> T | None:
+        cached = self._indexes.get(name)
+        if cached is None or cached[0] is not tasks or cached[1] != len(tasks):
+            index: dict[str, T] = {}
+            for task in tasks:
+                # the first task wins, like a scan of the list
+                index.setdefault(task.urn, task)
+            cached = self._indexes[name] = (tasks, len(tasks), index)
+        return cached[2].get(urn)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, UrnIndex)
+
+    __hash__ = None  # pyright: ignore[reportAssignmentType]
+
+
 class SystemCard(BaseModel):
     version: str | None = Field(description="The version of the schema used", default="0.0.0")
     provenance: Provenance | None = None
@@ -187,3 +215,11 @@ class SystemCard(BaseModel):
     assessments: list[AssessmentCard] = Field(default=[])
     references: list[Reference] = Field(default=[])
     models: list[ModelCardSchema] = Field(default=[])
+
+    _urn_index: UrnIndex = PrivateAttr(default_factory=UrnIndex)
+
+    def find_measure(self, urn: str) -> MeasureTask | None:
+        return self._urn_index.get("measures", self.measures, urn)
+
+    def find_requirement(self, urn: str) -> RequirementTask | None:
+        return self._urn_index.get("requirements", self.requirements, urn)
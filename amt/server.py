@@ -17,18 +17,23 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
 from amt.api.main import api_router
+from amt.clients.clients import task_registry_api_client
 from amt.core.config import PROJECT_DESCRIPTION, PROJECT_NAME, VERSION, get_settings
 from amt.core.db import check_db, get_engine, init_db
 from amt.core.exception_handlers import general_exception_handler as amt_general_exception_handler
 from amt.core.exception_handlers import redirect_exception_handler
 from amt.core.exceptions import AMTRedirectError
 from amt.core.log import configure_logging
-from amt.core.session_store import InMemorySessionStore, SessionStore
+from amt.core.session_store import SessionStore, create_session_store
+from amt.repositories.task_registry_mirror import sync_task_registry_task, task_registry_mirror
+from amt.services.task_registry import precompute_requirements_and_measures
 from amt.utils.mask import Mask
 
 from .api.http_browser_caching import static_files
 from .middleware.authorization import AuthorizationMiddleware
 from .middleware.csrf import CSRFMiddleware, CSRFMiddlewareExceptionHandler
+from .middleware.database_session import DatabaseSessionMiddleware
+from .middleware.fast_path import FastPathMiddleware
 from .middleware.htmx import HTMXMiddleware
 from .middleware.route_logging import RequestLoggingMiddleware
 from .middleware.security import SecurityMiddleware
@@ -46,6 +51,8 @@ logger = logging.getLogger(__name__)
 _db_pool_checked_in = Gauge("db_pool_checked_in", "DB connections available in pool")  # pyright: ignore[reportUnknownVariableType]
 _db_pool_checked_out = Gauge("db_pool_checked_out", "DB connections currently in use")  # pyright: ignore[reportUnknownVariableType]
 _db_pool_overflow = Gauge("db_pool_overflow", "DB connections beyond pool_size")  # pyright: ignore[reportUnknownVariableType]
+_task_registry_pool_in_use = Gauge("task_registry_pool_in_use", "Task Registry requests using the HTTP pool")  # pyright: ignore[reportUnknownVariableType]
+_task_registry_pool_max = Gauge("task_registry_pool_max_connections", "Task Registry HTTP pool size")  # pyright: ignore[reportUnknownVariableType]
 
 STATIC_DIR_ROOS = Path(jinja_roos_components.__file__).parent / "static" / "roos" / "dist"
 
@@ -57,7 +64,10 @@ async def cleanup_sessions_task(session_store: SessionStore, interval: int) -> N
             await asyncio.sleep(interval)
             expired_count = await session_store.cleanup_expired()
             active_count = await session_store.count()
-            logger.info(f"Session stats: {active_count} active, {expired_count} expired and removed")
+            if active_count is None:
+                logger.info(f"Session stats: {expired_count} expired and removed")
+            else:
+                logger.info(f"Session stats: {active_count} active, {expired_count} expired and removed")
         except asyncio.CancelledError:
             break
         except Exception:
@@ -70,6 +80,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     mask = Mask(mask_keywords=["database_uri"])
     await check_db()
     await init_db()
+    await task_registry_api_client.open()
     logger.info(f"Starting {PROJECT_NAME} version {VERSION}")
     logger.info(f"Settings: {mask.secrets(get_settings().model_dump())}")
 
@@ -77,12 +88,26 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         cleanup_sessions_task(app.state.session_store, get_settings().SESSION_CLEANUP_INTERVAL_SECONDS)
     )
 
+    if task_registry_mirror.load() and get_settings().TASK_REGISTRY_PRECOMPUTE_PROFILES:
+        resolutions = await precompute_requirements_and_measures()
+        logger.info(f"Precomputed {resolutions} distinct AI Act profile resolutions")
+    sync_task: asyncio.Task[None] | None = None
+    if get_settings().TASK_REGISTRY_SYNC_INTERVAL_SECONDS > 0:
+        sync_task = asyncio.create_task(
+            sync_task_registry_task(task_registry_mirror, get_settings().TASK_REGISTRY_SYNC_INTERVAL_SECONDS)
+        )
+
     yield
 
     cleanup_task.cancel()
     with contextlib.suppress(asyncio.CancelledError):
         await cleanup_task
+    if sync_task is not None:
+        sync_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await sync_task
     await app.state.session_store.close()
+    await task_registry_api_client.close()
 
     logger.info(f"Stopping application {PROJECT_NAME} version {VERSION}")
     logging.shutdown()
@@ -99,20 +124,23 @@ def create_app() -> FastAPI:
         debug=get_settings().DEBUG,
     )
 
-    session_store = InMemorySessionStore(default_ttl_seconds=get_settings().SESSION_TTL_SECONDS)
+    session_store = create_session_store(get_settings())
     app.state.session_store = session_store
 
     app.add_middleware(AuthorizationMiddleware)
+    # the database session is created before the authorization middleware, so it is shared with the route
+    app.add_middleware(DatabaseSessionMiddleware)
     app.add_middleware(
         ServerSideSessionMiddleware,
         session_store=session_store,
         secret_key=get_settings().SECRET_KEY,
         session_cookie=get_settings().SESSION_COOKIE_NAME,
         max_age=get_settings().SESSION_TTL_SECONDS,
+        refresh_interval=get_settings().SESSION_REFRESH_INTERVAL_SECONDS,
         https_only=get_settings().SESSION_COOKIE_SECURE,
         exclude_paths=["/health", "/metrics"],
     )
-    app.add_middleware(RequestLoggingMiddleware)
+    app.add_middleware(RequestLoggingMiddleware, sample_rate=get_settings().REQUEST_LOG_SAMPLE_RATE)
     app.add_middleware(CSRFMiddleware)
     app.add_middleware(CSRFMiddlewareExceptionHandler)
     app.add_middleware(HTMXMiddleware)
@@ -157,10 +185,19 @@ def create_app() -> FastAPI:
         _db_pool_checked_out.set(pool.checkedout())  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType, reportAttributeAccessIssue]
         _db_pool_overflow.set(pool.overflow())  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType, reportAttributeAccessIssue]
 
+    def task_registry_pool_metrics(info: Any) -> None:  # noqa: ANN401  # pyright: ignore[reportUnknownParameterType]
+        stats = task_registry_api_client.pool_stats()
+        _task_registry_pool_in_use.set(stats["in_use"])  # pyright: ignore[reportUnknownMemberType]
+        _task_registry_pool_max.set(stats["max_connections"])  # pyright: ignore[reportUnknownMemberType]
+
     instrumentator = Instrumentator(excluded_handlers=["/health", "/metrics"])  # pyright: ignore[reportUnknownVariableType]
     instrumentator.add(db_pool_metrics)  # pyright: ignore[reportUnknownMemberType]
+    instrumentator.add(task_registry_pool_metrics)  # pyright: ignore[reportUnknownMemberType]
     instrumentator.instrument(app).expose(app, endpoint="/metrics", include_in_schema=False)  # pyright: ignore[reportUnknownMemberType]
 
+    # added last, so static files, health checks and metrics skip all other middleware
+    app.add_middleware(FastPathMiddleware, router=app.router)
+
     return app
 
 
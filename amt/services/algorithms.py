@@ -18,8 +18,9 @@ from amt.enums.tasks import TaskType
 from amt.models import Algorithm, Organization, Role
 from amt.repositories.algorithms import AlgorithmsRepository
 from amt.repositories.organizations import OrganizationsRepository
+from amt.repositories.pagination import Page
 from amt.repositories.tasks import TasksRepository
-from amt.schema.algorithm import AlgorithmNew
+from amt.schema.algorithm import AlgorithmNew, AlgorithmSummary
 from amt.schema.instrument import InstrumentBase
 from amt.schema.measure import MeasureTask
 from amt.schema.system_card import AiActProfile, Owner, SystemCard
@@ -136,11 +137,25 @@ class AlgorithmsService(BaseService):
 
         return algorithm
 
-    async def paginate(
-        self, skip: int, limit: int, search: str, filters: dict[str, str | list[str | int]], sort: dict[str, str]
-    ) -> list[Algorithm]:
-        algorithms = await self.repository.paginate(skip=skip, limit=limit, search=search, filters=filters, sort=sort)
-        return algorithms
+    async def page_summaries(
+        self,
+        limit: int,
+        search: str,
+        filters: dict[str, str | list[str | int]],
+        sort: dict[str, str],
+        cursor: str | None = None,
+    ) -> Page[AlgorithmSummary]:
+        return await self.repository.page_summaries(
+            limit=limit, search=search, filters=filters, sort=sort, cursor=cursor
+        )
+
+    async def count(self, search: str, filters: dict[str, str | list[str | int]]) -> int:
+        return await self.repository.count(search=search, filters=filters)
+
+    async def find_summaries_by_lifecycle(
+        self, limit: int, search: str, filters: dict[str, str | list[str | int]], sort: dict[str, str]
+    ) -> tuple[dict[str, Page[AlgorithmSummary]], dict[str, int]]:
+        return await self.repository.find_summaries_by_lifecycle(limit=limit, search=search, filters=filters, sort=sort)
 
     async def update(self, algorithm: Algorithm) -> Algorithm:
         # TODO: Is this the right place to sync system cards: system_card and system_card_json?
@@ -12,6 +12,7 @@ from amt.models.base import Base
 from amt.repositories.algorithms import AlgorithmsRepository
 from amt.repositories.authorizations import AuthorizationRepository, PermissionsList
 from amt.repositories.organizations import OrganizationsRepository
+from amt.repositories.pagination import Page
 from amt.schema.permission import Permission
 from amt.services.service_classes import BaseService
 
@@ -76,12 +77,8 @@ class AuthorizationsService(BaseService):
         search: str | None = None,
         sort: dict[str, str] | None = None,
         filters: dict[str, str | list[str | int]] | None = None,
-        skip: int | None = None,
-        limit: int | None = None,
     ) -> list[tuple[User, Authorization, Role]]:
-        return await self.repository.get_users_with_authorizations(
-            type_id, authorization_type, search, sort, filters, skip, limit
-        )
+        return await self.repository.get_users_with_authorizations(type_id, authorization_type, search, sort, filters)
 
     @alru_cache
     async def get_role_by_id(self, role_id: int) -> Role | None:
@@ -99,10 +96,25 @@ class AuthorizationsService(BaseService):
         search: str | None = None,
         sort: dict[str, str] | None = None,
         filters: dict[str, str | int | list[str | int]] | None = None,
-        skip: int | None = None,
-        limit: int | None = None,
     ) -> list[tuple[User, Authorization, Role, type[Base] | None]]:
-        return await self.repository.find_all(search, sort, filters, skip, limit)
+        return await self.repository.find_all(search, sort, filters)
+
+    async def page_all(
+        self,
+        limit: int,
+        search: str | None = None,
+        sort: dict[str, str] | None = None,
+        filters: dict[str, str | int | list[str | int]] | None = None,
+        cursor: str | None = None,
+    ) -> Page[tuple[User, Authorization, Role, type[Base] | None]]:
+        return await self.repository.page_all(limit, search, sort, filters, cursor)
+
+    async def count_all(
+        self,
+        search: str | None = None,
+        filters: dict[str, str | int | list[str | int]] | None = None,
+    ) -> int:
+        return await self.repository.count_all(search, filters)
 
     async def remove_algorithm_roles(self, user_id: str | UUID, algorithm: Algorithm | list[Algorithm]) -> None:
         await self.repository.remove_algorithm_roles(user_id, algorithm)
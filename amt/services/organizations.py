@@ -63,6 +63,9 @@ class OrganizationsService(BaseService):
     async def find_by_slug(self, slug: str) -> Organization:
         return await self.organizations_repository.find_by_slug(slug)
 
+    async def find_id_by_slug(self, slug: str) -> int:
+        return await self.organizations_repository.find_id_by_slug(slug)
+
     async def get_by_id(self, organization_id: int) -> Organization:
         return await self.organizations_repository.find_by_id(organization_id)
 
@@ -0,0 +1,176 @@
+import logging
+from collections import Counter
+from collections.abc import Iterable
+
+from amt.api.forms.measure import MeasureStatusOptions
+from amt.repositories.task_registry_mirror import task_registry_mirror
+from amt.schema.measure import Measure
+from amt.schema.requirement import Requirement, RequirementTask
+from amt.schema.system_card import SystemCard
+from amt.services.measures import measures_service
+from amt.services.requirements import requirements_service
+
+logger = logging.getLogger(__name__)
+
+
+class RequirementGraph:
+    """
+    The links between measures and requirements in the task registry.
+
+    A measure links to the requirements it contributes to and a requirement links to the measures that
+    determine its state. Measures are added with their linked requirements when they are first needed,
+    so a graph only contains the part of the registry that was used.
+    """
+
+    def __init__(self) -> None:
+        self._requirements_by_measure: dict[str, tuple[str, ...]] = {}
+        self._measures_by_requirement: dict[str, frozenset[str]] = {}
+
+    def has_measure(self, measure_urn: str) -> bool:
+        return measure_urn in self._requirements_by_measure
+
+    def has_requirement(self, requirement_urn: str) -> bool:
+        return requirement_urn in self._measures_by_requirement
+
+    def add(
+        self, measure_urns: Iterable[str], measures: Iterable[Measure], requirements: Iterable[Requirement]
+    ) -> None:
+        """
+        Adds the given measures and requirements. Measures that are not in the registry are added without
+        links, so they are not fetched again.
+        """
+        for requirement in requirements:
+            self._measures_by_requirement[requirement.urn] = frozenset(requirement.links)
+        for measure_urn in measure_urns:
+            self._requirements_by_measure.setdefault(measure_urn, ())
+        for measure in measures:
+            # measures link to requirements that do not exist in the registry, those are left out
+            self._requirements_by_measure[measure.urn] = tuple(
+                requirement_urn for requirement_urn in measure.links if self.has_requirement(requirement_urn)
+            )
+
+    def requirements_of(self, measure_urn: str) -> tuple[str, ...]:
+        return self._requirements_by_measure.get(measure_urn, ())
+
+    def measures_of(self, requirement_urn: str) -> frozenset[str]:
+        return self._measures_by_requirement.get(requirement_urn, frozenset())
+
+
+class RequirementGraphCache:
+    """
+    The requirement graph of a single registry version.
+    """
+
+    def __init__(self) -> None:
+        self.version: str | None = None
+        self.graph = RequirementGraph()
+
+    def invalidate(self) -> None:
+        self.version = None
+        self.graph = RequirementGraph()
+
+
+_graph_cache = RequirementGraphCache()
+# the mirror notifies the cache whenever its contents change, so links of an older version are dropped
+task_registry_mirror.add_listener(lambda version: _graph_cache.invalidate())
+
+
+async def get_requirement_graph(measure_urns: Iterable[str]) -> RequirementGraph:
+    """
+    Returns a requirement graph containing the given measures and the requirements they link to.
+
+    Measures and requirements that are not in the graph yet are fetched with one call for the measures and
+    one for their requirements. Without a registry version (no mirror is loaded) the graph can not be
+    reused safely, so a new graph is returned on every call.
+    """
+    version = requirements_service.registry_version
+    if version is None:
+        graph = RequirementGraph()
+    else:
+        if version != _graph_cache.version:
+            _graph_cache.invalidate()
+            _graph_cache.version = version
+        graph = _graph_cache.graph
+
+    missing_measure_urns = [urn for urn in dict.fromkeys(measure_urns) if not graph.has_measure(urn)]
+    if missing_measure_urns:
+        measures = await measures_service.fetch_measures(missing_measure_urns)
+        missing_requirement_urns = [
+            urn
+            for urn in dict.fromkeys(requirement_urn for measure in measures for requirement_urn in measure.links)
+            if not graph.has_requirement(urn)
+        ]
+        requirements = (
+            await requirements_service.fetch_requirements(missing_requirement_urns) if missing_requirement_urns else []
+        )
+        graph.add(missing_measure_urns, measures, requirements)
+    return graph
+
+
+class RequirementStates:
+    """
+    Keeps the state of the requirements of a system card in line with the states of their measures.
+
+    The state of a requirement follows from the number of its linked measures in each state. These
+    numbers are counted once per requirement, when it is first needed, and after that a changed measure
+    only moves one from its previous state to its new state for each requirement it links to.
+
+    Every change of the state of a measure must be passed to `measure_changed`, otherwise the counts of
+    the requirements it links to are no longer correct.
+    """
+
+    def __init__(self, graph: RequirementGraph, system_card: SystemCard) -> None:
+        self.graph = graph
+        self.system_card = system_card
+        self._counts: dict[str, Counter[str]] = {}
+        # the state each measure was counted with
+        self._measure_states: dict[str, str] = {}
+
+    def measure_changed(self, measure_urn: str) -> list[RequirementTask]:
+        """
+        Updates the requirements linked to the given measure to the current state of that measure.
+        :return: the requirement tasks of the system card linked to the measure
+        """
+        measure_task = self.system_card.find_measure(measure_urn)
+        previous_state = self._measure_states.get(measure_urn)
+        if measure_task is not None and previous_state is not None and measure_task.state != previous_state:
+            self._measure_states[measure_urn] = measure_task.state
+            for requirement_urn in self.graph.requirements_of(measure_urn):
+                counts = self._counts.get(requirement_urn)
+                if counts is not None and measure_urn in self.graph.measures_of(requirement_urn):
+                    counts[previous_state] -= 1
+                    counts[measure_task.state] += 1
+
+        requirement_tasks: list[RequirementTask] = []
+        for requirement_urn in self.graph.requirements_of(measure_urn):
+            # TODO: This is because measure are linked to too many requirement not applicable in our use case
+            requirement_task = self.system_card.find_requirement(requirement_urn)
+            if requirement_task is not None:
+                requirement_task.state = self.requirement_state(requirement_urn)
+                requirement_tasks.append(requirement_task)
+        return requirement_tasks
+
+    def requirement_state(self, requirement_urn: str) -> str:
+        """
+        Returns the state of all linked measures if they are all in the same state. Otherwise the requirement
+        is 'in progress' if any linked measure has a state other than 'to do'.
+        """
+        counts = self._counts.get(requirement_urn)
+        if counts is None:
+            counts = self._counts[requirement_urn] = self._count(requirement_urn)
+
+        linked_measures = len(self.graph.measures_of(requirement_urn))
+        for state in MeasureStatusOptions:
+            if counts[state] == linked_measures:
+                return state
+        if any(count > 0 and state != MeasureStatusOptions.TODO for state, count in counts.items()):
+            return MeasureStatusOptions.IN_PROGRESS
+        return MeasureStatusOptions.TODO
+
+    def _count(self, requirement_urn: str) -> Counter[str]:
+        counts: Counter[str] = Counter()
+        for measure_urn in self.graph.measures_of(requirement_urn):
+            measure_task = self.system_card.find_measure(measure_urn)
+            if measure_task is not None:
+                counts[self._measure_states.setdefault(measure_urn, measure_task.state)] += 1
+        return counts
@@ -12,6 +12,10 @@ class RequirementsService:
     def __init__(self, repository: TaskRegistryRepository) -> None:
         self.repository = repository
 
+    @property
+    def registry_version(self) -> str | None:
+        return self.repository.registry_version
+
     async def fetch_requirements(self, urns: str | Sequence[str] | None = None) -> list[Requirement]:
         """
         Fetches measures with the given URNs.
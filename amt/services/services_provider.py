@@ -5,7 +5,12 @@ from typing import Annotated, Any, TypeVar, cast, get_type_hints
 
 from fastapi import Depends
 
-from amt.repositories.deps import AsyncSessionWithCommitFlag, get_session, get_session_non_generator
+from amt.repositories.deps import (
+    AsyncSessionWithCommitFlag,
+    get_request_session,
+    get_session,
+    get_session_non_generator,
+)
 from amt.repositories.repository_classes import BaseRepository
 from amt.services.service_classes import BaseService
 
@@ -56,6 +61,9 @@ class ServicesProvider:
         self._should_close_session = False
 
     async def initialize_session_if_needed(self) -> AsyncSessionWithCommitFlag:
+        if self._session is None and (request_session := get_request_session()) is not None:
+            # the session of the request is closed at the end of the request
+            self._session = request_session.session
         if self._session is None:
             self._session = await get_session_non_generator()
             self._should_close_session = True
@@ -1,6 +1,9 @@
+import itertools
 import logging
+from collections.abc import Sequence, Set
 from typing import Any
 
+from amt.repositories.task_registry_mirror import task_registry_mirror
 from amt.schema.measure import MeasureTask
 from amt.schema.requirement import Requirement, RequirementTask
 from amt.schema.system_card import AiActProfile
@@ -9,6 +12,16 @@ from amt.services.requirements import requirements_service
 
 logger = logging.getLogger(__name__)
 
+COMPARISON_ATTRS = (
+    "type",
+    "risk_group",
+    "role",
+    "open_source",
+    "systemic_risk",
+    "transparency_obligations",
+    "conformity_assessment_body",
+)
+
 
 def is_requirement_applicable(requirement: Requirement, ai_act_profile: AiActProfile) -> bool:
     """
@@ -27,17 +40,8 @@ def is_requirement_applicable(requirement: Requirement, ai_act_profile: AiActPro
 
     # We can assume the ai_act_profile field always contains exactly 1 element.
     requirement_profile = requirement.ai_act_profile[0]
-    comparison_attrs = (
-        "type",
-        "risk_group",
-        "role",
-        "open_source",
-        "systemic_risk",
-        "transparency_obligations",
-        "conformity_assessment_body",
-    )
 
-    for attr in comparison_attrs:
+    for attr in COMPARISON_ATTRS:
         requirement_attr_values = getattr(requirement_profile, attr, [])
 
         if not requirement_attr_values:
@@ -51,35 +55,192 @@ def is_requirement_applicable(requirement: Requirement, ai_act_profile: AiActPro
     return True
 
 
+class RequirementApplicabilityIndex:
+    """
+    Precompiled index to resolve the requirements applicable to an AI Act profile.
+
+    Every requirement gets a bit position. Per attribute, the index keeps a bitset of the requirements
+    without restrictions on that attribute and a bitset per attribute value of the requirements that
+    accept that value. Resolving a profile is then a union per attribute and an intersection over all
+    attributes, which gives the same result as calling `is_requirement_applicable` for every requirement.
+    """
+
+    def __init__(self, requirements: list[Requirement]) -> None:
+        self.requirements = requirements
+        self._all = (1 << len(requirements)) - 1
+        self._always_applicable = 0
+        self._unrestricted: dict[str, int] = dict.fromkeys(COMPARISON_ATTRS, 0)
+        self._by_value: dict[str, dict[str, int]] = {attr: {} for attr in COMPARISON_ATTRS}
+
+        for position, requirement in enumerate(requirements):
+            bit = 1 << position
+            if requirement.always_applicable == 1:
+                self._always_applicable |= bit
+                continue
+            # We can assume the ai_act_profile field always contains exactly 1 element.
+            requirement_profile = requirement.ai_act_profile[0]
+            for attr in COMPARISON_ATTRS:
+                requirement_attr_values = getattr(requirement_profile, attr, [])
+                if not requirement_attr_values:
+                    self._unrestricted[attr] |= bit
+                    continue
+                by_value = self._by_value[attr]
+                for attr_value in requirement_attr_values:
+                    by_value[attr_value.value] = by_value.get(attr_value.value, 0) | bit
+
+    def values(self, attr: str) -> list[str]:
+        """
+        Returns the values of the given attribute that at least one requirement is restricted to.
+        """
+        return sorted(self._by_value[attr])
+
+    def applicable_mask(self, values: Sequence[Set[str]]) -> int:
+        """
+        Returns the bitset of applicable requirements, given the profile values per attribute in COMPARISON_ATTRS.
+        """
+        applicable = self._all
+        for attr, attr_values in zip(COMPARISON_ATTRS, values, strict=True):
+            by_value = self._by_value[attr]
+            accepted = self._unrestricted[attr]
+            for value in attr_values:
+                accepted |= by_value.get(value, 0)
+            applicable &= accepted
+            if not applicable:
+                break
+        return applicable | self._always_applicable
+
+    def requirements_for_mask(self, mask: int) -> list[Requirement]:
+        return [requirement for position, requirement in enumerate(self.requirements) if mask >> position & 1]
+
+    def applicable_requirements(self, ai_act_profile: AiActProfile) -> list[Requirement]:
+        return self.requirements_for_mask(self.applicable_mask(_profile_key(ai_act_profile)))
+
+
+ProfileKey = tuple[frozenset[str], ...]
+Resolution = tuple[list[RequirementTask], list[MeasureTask]]
+
+
+class ApplicabilityCache:
+    """
+    Applicability index and resolved requirements and measures for a single registry version.
+
+    Profiles are normalized to a key with the set of values per comparison attribute. Each key maps to the
+    bitset of applicable requirements and each distinct bitset to its resolved requirements and measures,
+    so the many profiles that resolve to the same requirements share a single resolution.
+    """
+
+    def __init__(self) -> None:
+        self.version: str | None = None
+        self.index: RequirementApplicabilityIndex | None = None
+        self.masks: dict[ProfileKey, int] = {}
+        self.resolutions: dict[int, Resolution] = {}
+
+    def invalidate(self) -> None:
+        self.version = None
+        self.index = None
+        self.masks.clear()
+        self.resolutions.clear()
+
+
+_applicability_cache = ApplicabilityCache()
+# the mirror notifies the cache whenever its contents change, so stale resolutions are dropped immediately
+task_registry_mirror.add_listener(lambda version: _applicability_cache.invalidate())
+
+
+async def get_applicability_index() -> RequirementApplicabilityIndex:
+    """
+    Returns the applicability index for the current registry version, building it if needed.
+
+    Without a registry version (no mirror is loaded) the index can not be reused safely, so it is
+    rebuilt from the fetched requirements on every call.
+    """
+    version = requirements_service.registry_version
+    if version is not None and version == _applicability_cache.version and _applicability_cache.index is not None:
+        return _applicability_cache.index
+
+    index = RequirementApplicabilityIndex(await requirements_service.fetch_requirements())
+    if version is not None:
+        _applicability_cache.invalidate()
+        _applicability_cache.version = version
+        _applicability_cache.index = index
+    return index
+
+
 async def get_requirements_and_measures(
     ai_act_profile: AiActProfile,
 ) -> tuple[list[RequirementTask], list[MeasureTask]]:
-    all_requirements = await requirements_service.fetch_requirements()
-
-    applicable_requirements: list[RequirementTask] = []
-    applicable_measures: list[MeasureTask] = []
-    measure_urns: set[str] = set()
-
-    for requirement in all_requirements:
-        if is_requirement_applicable(requirement, ai_act_profile):
-            applicable_requirements.append(RequirementTask(urn=requirement.urn, version=requirement.schema_version))
-
-            for measure_urn in requirement.links:
-                if measure_urn not in measure_urns:
-                    measure = await measures_service.fetch_measures(measure_urn)
-                    applicable_measures.append(
-                        MeasureTask(
-                            urn=measure_urn,
-                            state="to do",
-                            version=measure[0].schema_version,
-                            lifecycle=measure[0].lifecycle,
-                        )
-                    )
-                    measure_urns.add(measure_urn)
+    index = await get_applicability_index()
+    values = _profile_key(ai_act_profile)
+    requirements, measures = await _resolve(index, values)
+    # callers modify the tasks (e.g. their state), so never hand out the cached instances
+    return (
+        [requirement.model_copy() for requirement in requirements],
+        [measure.model_copy(deep=True) for measure in measures],
+    )
+
+
+async def precompute_requirements_and_measures() -> int:
+    """
+    Resolves the requirements and measures of all AI Act profile combinations for the current registry version.
+
+    Only the values known to the requirements are combined, with a single role per profile; other
+    profiles are resolved (and cached) on first use.
+    :return: The number of distinct resolutions, 0 if there is no registry version to cache for
+    """
+    index = await get_applicability_index()
+    if index is not _applicability_cache.index:
+        return 0
+
+    options = [[frozenset[str](), *(frozenset({value}) for value in index.values(attr))] for attr in COMPARISON_ATTRS]
+    for values in itertools.product(*options):
+        await _resolve(index, values)
+    return len(_applicability_cache.resolutions)
+
+
+async def _resolve(index: RequirementApplicabilityIndex, values: ProfileKey) -> Resolution:
+    cache = _applicability_cache if index is _applicability_cache.index else None
+
+    mask = cache.masks.get(values) if cache is not None else None
+    if mask is None:
+        mask = index.applicable_mask(values)
+        if cache is not None:
+            cache.masks[values] = mask
+
+    resolution = cache.resolutions.get(mask) if cache is not None else None
+    if resolution is None:
+        resolution = await _fetch_requirements_and_measures(index.requirements_for_mask(mask))
+        # the registry version may have changed while the measures were fetched
+        if cache is not None and index is cache.index:
+            cache.resolutions[mask] = resolution
+    return resolution
+
+
+async def _fetch_requirements_and_measures(requirements: list[Requirement]) -> Resolution:
+    applicable_requirements = [
+        RequirementTask(urn=requirement.urn, version=requirement.schema_version) for requirement in requirements
+    ]
+
+    # dict.fromkeys keeps the order in which the measures are first linked, without duplicates
+    measure_urns = list(dict.fromkeys(measure_urn for requirement in requirements for measure_urn in requirement.links))
+    if not measure_urns:
+        return applicable_requirements, []
+
+    measures = {measure.urn: measure for measure in await measures_service.fetch_measures(measure_urns)}
+    applicable_measures = [
+        MeasureTask(urn=urn, state="to do", version=measures[urn].schema_version, lifecycle=measures[urn].lifecycle)
+        for urn in measure_urns
+        if urn in measures
+    ]
+    if len(applicable_measures) != len(measure_urns):
+        logger.warning("Cannot find all measures linked to the applicable requirements")
 
     return applicable_requirements, applicable_measures
 
 
+def _profile_key(ai_act_profile: AiActProfile) -> ProfileKey:
+    return tuple(frozenset(_parse_attribute_values(attr, ai_act_profile)) for attr in COMPARISON_ATTRS)
+
+
 def _parse_attribute_values(attr: str, ai_act_profile: AiActProfile) -> set[str] | set[Any]:
     """
     Helper function needed in `is_requirement_applicable`, handling special case for 'publication_category'.
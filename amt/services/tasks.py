@@ -4,6 +4,7 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from amt.core.exceptions import AMTNotFound
 from amt.enums.tasks import Status, TaskType
 from amt.models.algorithm import Algorithm
 from amt.models.task import Task
@@ -12,11 +13,35 @@ from amt.repositories.tasks import TasksRepository
 from amt.schema.instrument import InstrumentTask
 from amt.schema.measure import MeasureTask
 from amt.schema.system_card import SystemCard
+from amt.schema.task import MovedTask
 from amt.services.service_classes import BaseService
 from amt.services.storage import StorageFactory
 
 logger = logging.getLogger(__name__)
 
+SORT_ORDER_STEP = 10
+# cards are placed halfway between their neighbours, when the gap gets smaller than this the column is renumbered
+# long before the precision of the sort order runs out
+MIN_SORT_ORDER_GAP = 1e-6
+
+
+def get_sort_order(previous_task: Task | None, next_task: Task | None) -> float | None:
+    """
+    Returns the sort order for a task placed between the given tasks, or None if there is no room left
+    between them and the column has to be renumbered.
+    """
+    if previous_task and next_task:
+        if next_task.sort_order - previous_task.sort_order < MIN_SORT_ORDER_GAP:
+            return None
+        return previous_task.sort_order + ((next_task.sort_order - previous_task.sort_order) / 2)
+    if previous_task:
+        return previous_task.sort_order + SORT_ORDER_STEP
+    if next_task:
+        if next_task.sort_order < MIN_SORT_ORDER_GAP:
+            return None
+        return next_task.sort_order / 2
+    return SORT_ORDER_STEP
+
 
 class TasksService(BaseService):
     def __init__(
@@ -63,6 +88,7 @@ class TasksService(BaseService):
         status_id: int | None,
         previous_sibling_id: int | None = None,
         next_sibling_id: int | None = None,
+        algorithm_id: int | None = None,
     ) -> Task:
         """
         Updates the task with the given task_id
@@ -70,31 +96,74 @@ class TasksService(BaseService):
         :param status_id: the id of the status of the task
         :param previous_sibling_id: the id of the previous sibling of the task or None
         :param next_sibling_id: the id of the next sibling of the task or None
+        :param algorithm_id: the id of the algorithm the task and its siblings must belong to, or None
         :return: the updated task
         """
         if task_id is None or status_id is None:
             raise ValueError("task_id or status_id must not be None")
-        task = await self.repository.find_by_id(task_id)
-
-        # update the status for the task (this may not be needed if the status has not changed)
-        task.status_id = status_id
-
-        # update order position of the card
-        if previous_sibling_id and next_sibling_id:
-            previous_task = await self.repository.find_by_id(previous_sibling_id)
-            next_task = await self.repository.find_by_id(next_sibling_id)
-            new_sort_order = previous_task.sort_order + ((next_task.sort_order - previous_task.sort_order) / 2)
-            task.sort_order = new_sort_order
-        elif previous_sibling_id and not next_sibling_id:
-            previous_task = await self.repository.find_by_id(previous_sibling_id)
-            task.sort_order = previous_task.sort_order + 10
-        elif not previous_sibling_id and next_sibling_id:
-            next_task = await self.repository.find_by_id(next_sibling_id)
-            task.sort_order = next_task.sort_order / 2
-        else:
-            task.sort_order = 10
+        moved_task = MovedTask(
+            taskId=task_id, statusId=status_id, previousSiblingId=previous_sibling_id, nextSiblingId=next_sibling_id
+        )
+        return (await self.move_tasks([moved_task], algorithm_id))[0]
 
-        return await self.repository.save(task)
+    async def move_tasks(self, moved_tasks: Sequence[MovedTask], algorithm_id: int | None = None) -> list[Task]:
+        """
+        Moves the given tasks in order. The tasks and their siblings are read in one query. When there is no
+        room left between the siblings of a task, the tasks of its column are renumbered in one update.
+        :param moved_tasks: the tasks to move with their new status and siblings
+        :param algorithm_id: the id of the algorithm all tasks and siblings must belong to, or None
+        :return: the updated tasks
+        """
+        task_ids = {
+            task_id
+            for moved_task in moved_tasks
+            for task_id in (moved_task.id, moved_task.previous_sibling_id, moved_task.next_sibling_id)
+            if task_id
+        }
+        tasks = await self.repository.find_by_ids(task_ids)
+        if algorithm_id is not None and any(task.algorithm_id != algorithm_id for task in tasks.values()):
+            raise AMTNotFound()
+
+        updated_tasks: list[Task] = []
+        for moved_task in moved_tasks:
+            task = tasks[moved_task.id]
+            task.status_id = moved_task.status_id
+            previous_task = tasks.get(moved_task.previous_sibling_id) if moved_task.previous_sibling_id else None
+            next_task = tasks.get(moved_task.next_sibling_id) if moved_task.next_sibling_id else None
+
+            sort_order = get_sort_order(previous_task, next_task)
+            if sort_order is None:
+                await self._renumber_column(task, previous_task, next_task)
+            else:
+                task.sort_order = sort_order
+            updated_tasks.append(task)
+
+        await self.repository.save_all(updated_tasks)
+        return updated_tasks
+
+    async def _renumber_column(self, task: Task, previous_task: Task | None, next_task: Task | None) -> None:
+        """
+        Places the task between its siblings and spreads the sort orders of all tasks in its column evenly.
+        """
+        column: list[Task] = []
+        if task.algorithm_id is not None and task.status_id is not None:
+            column = [
+                column_task
+                for column_task in await self.repository.find_by_algorithm_id_and_status_id(
+                    task.algorithm_id, task.status_id
+                )
+                if column_task.id != task.id
+            ]
+        column_ids = [column_task.id for column_task in column]
+        position = len(column)
+        if previous_task and previous_task.id in column_ids:
+            position = column_ids.index(previous_task.id) + 1
+        elif next_task and next_task.id in column_ids:
+            position = column_ids.index(next_task.id)
+        column.insert(position, task)
+        await self.repository.update_sort_orders(
+            {column_task.id: (index + 1) * SORT_ORDER_STEP for index, column_task in enumerate(column)}
+        )
 
     async def update_tasks_status(self, algorithm_id: int, task_type: TaskType, type_id: str, status: Status) -> None:
         await self.repository.update_tasks_status(algorithm_id, task_type, type_id, status)
@@ -1,5 +1,5 @@
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from typing import Annotated
 from uuid import UUID
 
@@ -27,6 +27,9 @@ class UsersService(BaseService):
         id = UUID(id) if isinstance(id, str) else id
         return await self.repository.find_by_id(id)
 
+    async def find_by_ids(self, ids: Iterable[UUID | str]) -> dict[UUID, User]:
+        return await self.repository.find_by_ids(ids)
+
     @deprecated(
         "This method can only be used to find all users."
         "Use the authorizations service to get organization or algorithm users"
@@ -36,7 +39,6 @@ class UsersService(BaseService):
         search: str | None = None,
         sort: dict[str, str] | None = None,
         filters: dict[str, str | list[str | int]] | None = None,
-        skip: int | None = None,
         limit: int | None = None,
     ) -> Sequence[User]:
-        return await self.repository.find_all(search, sort, filters, skip, limit)  # pyright: ignore[reportDeprecated]
+        return await self.repository.find_all(search, sort, filters, limit)  # pyright: ignore[reportDeprecated]
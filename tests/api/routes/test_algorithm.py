@@ -1,6 +1,7 @@
 from io import BytesIO
 from json import JSONDecodeError
 from typing import Any
+from uuid import UUID, uuid4
 
 import pytest
 from amt.api.editable_route_utils import get_user_id_or_error
@@ -8,6 +9,7 @@ from amt.api.routes.algorithm import (
     find_measure_task,
     find_requirement_task,
     find_requirement_tasks_by_measure_urn,
+    get_measure_task_functions,
     resolve_and_enrich_measures,
     update_requirements_state,
 )
@@ -16,9 +18,11 @@ from amt.core.config import get_settings
 from amt.core.exceptions import AMTError
 from amt.enums.tasks import TaskType
 from amt.models import Algorithm
+from amt.repositories.tasks import TasksRepository
 from amt.repositories.users import UsersRepository
-from amt.schema.measure import MeasureTask
+from amt.schema.measure import MeasureTask, Person
 from amt.schema.task import MovedTask
+from amt.services.algorithms import AlgorithmsService
 from amt.services.object_storage import create_object_storage_service
 from amt.services.users import UsersService
 from fastapi import UploadFile
@@ -119,6 +123,66 @@ async def test_move_task(client: AsyncClient, db: DatabaseTestUtils, mocker: Moc
     assert b"Controleer de datakwaliteit" in response.content
 
 
+@pytest.mark.asyncio
+async def test_move_tasks(client: AsyncClient, db: DatabaseTestUtils, mocker: MockFixture) -> None:
+    # given
+    await db.given(
+        [
+            default_user(),
+            default_organization(),
+            default_algorithm_with_system_card("testalgorithm1"),
+            default_task(algorithm_id=1, status_id=1, sort_order=10),
+            default_task(algorithm_id=1, status_id=1, sort_order=20),
+            default_task(algorithm_id=1, status_id=1, sort_order=30),
+        ]
+    )
+    await db.init_authorizations_and_roles()
+    mocker.patch("amt.middleware.csrf.CookieOnlyCsrfProtect.validate_csrf", new_callable=mocker.AsyncMock)
+    client.cookies["fastapi-csrf-token"] = "1"
+    get_algorithm_spy = mocker.spy(AlgorithmsService, "get")
+
+    # when
+    moved_tasks_json = [
+        MovedTask(taskId=3, statusId=2, previousSiblingId=-1, nextSiblingId=-1).model_dump(by_alias=True),
+        MovedTask(taskId=1, statusId=2, previousSiblingId=3, nextSiblingId=-1).model_dump(by_alias=True),
+    ]
+    response = await client.patch("/algorithm/1/move_tasks", json=moved_tasks_json, headers={"X-CSRF-Token": "1"})
+
+    # then
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/html; charset=utf-8"
+    assert b'id="card-content-3"' in response.content
+    assert b'id="card-content-1"' in response.content
+    get_algorithm_spy.assert_not_called()
+    tasks = await TasksRepository(db.get_session()).find_by_algorithm_id_and_status_id(1, 2)
+    assert [(task.id, task.sort_order) for task in tasks] == [(3, 10), (1, 20)]
+
+
+@pytest.mark.asyncio
+async def test_move_tasks_of_other_algorithm(client: AsyncClient, db: DatabaseTestUtils, mocker: MockFixture) -> None:
+    # given
+    await db.given(
+        [
+            default_user(),
+            default_organization(),
+            default_algorithm_with_system_card("testalgorithm1"),
+            default_algorithm_with_system_card("testalgorithm2"),
+            default_task(algorithm_id=2, status_id=1, sort_order=10),
+        ]
+    )
+    await db.init_authorizations_and_roles()
+    mocker.patch("amt.middleware.csrf.CookieOnlyCsrfProtect.validate_csrf", new_callable=mocker.AsyncMock)
+    client.cookies["fastapi-csrf-token"] = "1"
+
+    # when
+    moved_tasks_json = [MovedTask(taskId=1, statusId=2).model_dump(by_alias=True)]
+    response = await client.patch("/algorithm/1/move_tasks", json=moved_tasks_json, headers={"X-CSRF-Token": "1"})
+
+    # then
+    assert response.status_code == 404
+    assert (await TasksRepository(db.get_session()).find_by_id(1)).status_id == 1
+
+
 @pytest.mark.asyncio
 @amt_vcr.use_cassette("tests/fixtures/vcr_cassettes/test_get_algorithm_context.yml")  # type: ignore
 async def test_get_algorithm_context(client: AsyncClient, db: DatabaseTestUtils, mocker: MockFixture) -> None:
@@ -739,9 +803,8 @@ async def test_find_requirement_tasks_by_measure_urn() -> None:
     test_algorithm = default_algorithm_with_system_card("testalgorithm1")
 
     # no matched requirement
-    with pytest.raises(IndexError):
-        # TODO: this is because it is not coded well change later
-        requirement_tasks = await find_requirement_tasks_by_measure_urn(test_algorithm.system_card, "")
+    requirement_tasks = await find_requirement_tasks_by_measure_urn(test_algorithm.system_card, "")
+    assert requirement_tasks == []
 
     # matches measure
     requirement_tasks = await find_requirement_tasks_by_measure_urn(test_algorithm.system_card, "urn:nl:ak:mtr:dat-01")
@@ -1113,13 +1176,10 @@ async def test_update_requirements_state() -> None:
 
 @pytest.mark.asyncio
 @amt_vcr.use_cassette("tests/fixtures/vcr_cassettes/test_update_requirements_state.yml")  # type: ignore
-async def test_update_requirements_state_with_nonexistent_measure(mocker: MockFixture) -> None:
+async def test_update_requirements_state_with_nonexistent_measure() -> None:
     # given
     test_algorithm = default_algorithm_with_system_card("testalgorithm1")
-
-    # Mock the find_requirement_tasks_by_measure_urn function to handle nonexistent measure
-    mock_find_requirement_tasks = mocker.patch("amt.api.routes.algorithm.find_requirement_tasks_by_measure_urn")
-    mock_find_requirement_tasks.return_value = []  # Empty list when measure doesn't exist
+    states = [requirement.state for requirement in test_algorithm.system_card.requirements]
 
     # Test with non-existent measure URN
     # This shouldn't raise exceptions but shouldn't update any requirements
@@ -1127,9 +1187,7 @@ async def test_update_requirements_state_with_nonexistent_measure(mocker: MockFi
 
     # The algorithm should be returned unchanged
     assert updated_algorithm is test_algorithm
-
-    # Verify that find_requirement_tasks_by_measure_urn was called with the correct parameters
-    mock_find_requirement_tasks.assert_called_once_with(test_algorithm.system_card, "urn:nl:ak:non-existent")
+    assert [requirement.state for requirement in updated_algorithm.system_card.requirements] == states
 
 
 @pytest.mark.asyncio
@@ -1190,15 +1248,44 @@ async def test_resolve_and_enrich_measures(mocker: MockFixture) -> None:
     users_service = UsersService(
         repository=mocker.AsyncMock(spec=UsersRepository),
     )
-    users_service.repository.find_by_id = mocker.AsyncMock(return_value=default_user())
     urns = {"urn:nl:ak:mtr:dat-01"}
     my_algorithm = default_algorithm_with_system_card()
+    person_id = UUID(my_algorithm.system_card.measures[0].responsible_persons[0].uuid)  # pyright: ignore[reportOptionalSubscript]
+    users_service.repository.find_by_ids = mocker.AsyncMock(return_value={person_id: default_user(id=person_id)})
     result = await resolve_and_enrich_measures(my_algorithm, urns, users_service)
     assert (
         result["urn:nl:ak:mtr:dat-01"].description
         == "Stel vast of de gebruikte data van voldoende kwaliteit is voor de beoogde toepassing.\n"
     )
     assert len(result["urn:nl:ak:mtr:dat-01"].users) == 3
+    users_service.repository.find_by_ids.assert_awaited_once()
+    users_service.repository.find_by_id.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_measure_task_functions(mocker: MockFixture) -> None:
+    # given
+    other_user = default_user(id=uuid4(), name="Other User")
+    users_service = UsersService(repository=mocker.AsyncMock(spec=UsersRepository))
+    users_service.repository.find_by_ids = mocker.AsyncMock(  # type: ignore
+        return_value={default_user().id: default_user(), other_user.id: other_user}
+    )
+    person = Person(name=default_user().name, uuid=str(default_user().id))
+    other_person = Person(name=other_user.name, uuid=str(other_user.id))
+    measure_tasks = [
+        MeasureTask(urn="urn:1", version="1.0", responsible_persons=[person], accountable_persons=[other_person]),
+        MeasureTask(urn="urn:2", version="1.0", reviewer_persons=[other_person, person]),
+        MeasureTask(urn="urn:3", version="1.0", reviewer_persons=[Person(name="Unknown", uuid=str(uuid4()))]),
+    ]
+
+    # when
+    result = await get_measure_task_functions(measure_tasks, users_service)
+
+    # then
+    assert [user.name for user in result["urn:1"]] == [default_user().name, "Other User"]
+    assert [user.name for user in result["urn:2"]] == ["Other User"]
+    assert "urn:3" not in result
+    users_service.repository.find_by_ids.assert_awaited_once()  # type: ignore
 
 
 @pytest.mark.asyncio
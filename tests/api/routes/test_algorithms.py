@@ -3,11 +3,13 @@ from datetime import UTC, datetime
 from typing import Any, cast
 
 import pytest
+from amt.api.lifecycles import Lifecycles
 from amt.api.routes.shared import get_localized_value
 from amt.models import Algorithm, Task
 from amt.models.base import Base
+from amt.repositories.pagination import Page
 from amt.schema.ai_act_profile import AiActProfile
-from amt.schema.algorithm import AlgorithmNew
+from amt.schema.algorithm import AlgorithmNew, AlgorithmProgress, AlgorithmSummary
 from amt.schema.system_card import SystemCard
 from amt.services.task_registry import get_requirements_and_measures
 from fastapi.requests import Request
@@ -16,7 +18,7 @@ from pytest_mock import MockFixture
 from starlette.datastructures import URL, Headers
 
 from tests.conftest import amt_vcr
-from tests.constants import default_algorithm, default_auth_user, default_instrument, default_organization, default_user
+from tests.constants import default_auth_user, default_instrument, default_organization, default_user
 from tests.database_test_utils import DatabaseTestUtils
 
 
@@ -64,16 +66,46 @@ async def test_algorithms_get_root_htmx_with_group_by_and_lifecycle_filter(clien
 
 @pytest.mark.asyncio
 async def test_algorithms_get_root_htmx_with_algorithms_mock(client: AsyncClient, mocker: MockFixture) -> None:
-    mock_algorithm = default_algorithm()
-    mock_algorithm.last_edited = datetime.now(UTC)
+    mock_algorithm = AlgorithmSummary(
+        id=1,
+        name="Algorithm",
+        lifecycle=Lifecycles.DESIGN,
+        last_edited=datetime.now(UTC),
+        progress=AlgorithmProgress(requirements_completed=2, requirements_total=7),
+    )
     # given
-    mocker.patch("amt.services.algorithms.AlgorithmsService.paginate", return_value=[mock_algorithm])
+    mocker.patch("amt.services.algorithms.AlgorithmsService.page_summaries", return_value=Page([mock_algorithm]))
+    mocker.patch("amt.services.algorithms.AlgorithmsService.count", return_value=1)
 
     # when
     response = await client.get("/algorithms/", headers={"HX-Request": "true"})
 
     assert response.status_code == 200
     assert b'<table id="search-results-table" class="rvo-table margin-top-large">' in response.content
+    assert b"2/7" in response.content
+
+
+@pytest.mark.asyncio
+async def test_algorithms_get_root_htmx_with_group_by_next_page(client: AsyncClient, mocker: MockFixture) -> None:
+    mock_algorithm = AlgorithmSummary(
+        id=1, name="Algorithm", lifecycle=Lifecycles.DESIGN, last_edited=datetime.now(UTC)
+    )
+    # given
+    page_summaries = mocker.patch(
+        "amt.services.algorithms.AlgorithmsService.page_summaries", return_value=Page([mock_algorithm], "next")
+    )
+
+    # when
+    response = await client.get(
+        "/algorithms/?cursor=first&display_type=LIFECYCLE&group=DESIGN&search=algo&active-filter-risk-group=VERBODEN_AI",
+        headers={"HX-Request": "true"},
+    )
+
+    # then
+    assert response.status_code == 200
+    assert page_summaries.call_args.kwargs["filters"]["lifecycle"] == "DESIGN"
+    assert b"cursor=next" in response.content
+    assert b"search=algo&active-filter-risk-group=VERBODEN_AI&display_type=LIFECYCLE&group=DESIGN" in response.content
 
 
 @pytest.mark.asyncio
@@ -21,3 +21,12 @@ async def test_metrics_contains_db_pool_gauges(client: AsyncClient) -> None:
     assert "db_pool_checked_in" in body
     assert "db_pool_checked_out" in body
     assert "db_pool_overflow" in body
+
+
+@pytest.mark.asyncio
+async def test_metrics_contains_task_registry_client_metrics(client: AsyncClient) -> None:
+    response = await client.get("/metrics")
+    body = response.text
+    assert "task_registry_pool_in_use" in body
+    assert "task_registry_pool_max_connections" in body
+    assert "api_client_request_duration_seconds" in body
@@ -5,10 +5,13 @@
 import json
 import typing
 
-from amt.api.decorators import permission
+import pytest
+from amt.api.decorators import CompiledPermission, permission, resolve_organization_id
 from amt.core.authorization import AuthorizationResource, AuthorizationVerb
+from amt.repositories.organizations import OrganizationSlugCache
 from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
 from starlette.responses import Response
 
 RequestResponseEndpoint = typing.Callable[[Request], typing.Awaitable[Response]]
@@ -93,3 +96,66 @@ def test_permission_decorator_unauthorized_permission_variable():
 
     response = client.get("/authorizedparameters/4453546", headers={"X-Permissions": '{"organization/1": ["Create"]}'})
     assert response.status_code == 404
+
+
+@app.get("/authorizedslug/{organization_slug}")
+@permission({AuthorizationResource.ORGANIZATION_INFO_SLUG: [AuthorizationVerb.READ, AuthorizationVerb.UPDATE]})
+async def authorizedslug(request: Request, organization_slug: str):
+    return {"message": "Hello World"}
+
+
+def test_permission_decorator_slug(mocker: MockerFixture):
+    client = TestClient(app, base_url="https://testserver")
+    mocker.patch("amt.api.decorators.resolve_organization_id", return_value=1)
+
+    response = client.get(
+        "/authorizedslug/default-organization", headers={"X-Permissions": '{"organization/1": ["Read", "Update"]}'}
+    )
+    assert response.status_code == 200
+
+    response = client.get(
+        "/authorizedslug/default-organization", headers={"X-Permissions": '{"organization/1": ["Read"]}'}
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_resolve_organization_id(mocker: MockerFixture):
+    # given
+    organizations_service = mocker.AsyncMock()
+    organizations_service.find_id_by_slug.return_value = 1
+    services_provider = mocker.patch("amt.api.decorators.ServicesProvider").return_value
+    services_provider.get = mocker.AsyncMock(return_value=organizations_service)
+
+    # when
+    organization_id = await resolve_organization_id("default-organization")
+    await resolve_organization_id("default-organization")
+
+    # then
+    assert organization_id == 1
+    assert organizations_service.find_id_by_slug.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_organization_id_from_slug_cache(mocker: MockerFixture):
+    # given
+    slug_cache = OrganizationSlugCache()
+    slug_cache.set("default-organization", 1)
+    mocker.patch("amt.api.decorators.organization_slug_cache", slug_cache)
+    services_provider = mocker.patch("amt.api.decorators.ServicesProvider")
+
+    # when
+    organization_id = await resolve_organization_id("default-organization")
+
+    # then
+    assert organization_id == 1
+    services_provider.assert_not_called()
+
+
+def test_compiled_permission():
+    compiled_permission = CompiledPermission(AuthorizationResource.ORGANIZATION_ALGORITHM_SLUG, ["Create", "Unknown"])
+
+    assert compiled_permission.resource({"organization_slug": "slug"}) == "organization/slug/algorithm"
+    assert compiled_permission.resource({"organization_id": 1}, by_id=True) == "organization/1/algorithm"
+    assert compiled_permission.resource({}) == "organization/{organization_slug}/algorithm"
+    assert not compiled_permission.is_granted({"organization/1/algorithm": ["Create"]}, "organization/1/algorithm")
@@ -56,3 +56,42 @@ async def test_task_registry_api_client_get_instrument_not_succesfull(httpx_mock
     # then
     with pytest.raises(AMTNotFound):
         await TaskRegistryAPIClient().get_task_by_urn(TaskType.INSTRUMENTS, urn)
+
+
+@pytest.mark.asyncio
+async def test_task_registry_api_client_shared_client(httpx_mock: HTTPXMock):
+    # given
+    httpx_mock.add_response(
+        url="https://task-registry.rijksapp.nl/instruments/urn/urn:nl:aivt:tr:iama:1.0?version=latest",
+        content=TASK_REGISTRY_CONTENT_PAYLOAD.encode(),
+    )
+    client = TaskRegistryAPIClient()
+
+    # when
+    await client.open()
+    result = await client.get_task_by_urn(TaskType.INSTRUMENTS, "urn:nl:aivt:tr:iama:1.0")
+    is_open = client.is_open
+    await client.close()
+
+    # then
+    assert result == json.loads(TASK_REGISTRY_CONTENT_PAYLOAD)
+    assert is_open is True
+    assert client.is_open is False
+
+
+@pytest.mark.asyncio
+async def test_task_registry_api_client_opens_on_first_request(httpx_mock: HTTPXMock):
+    # given
+    httpx_mock.add_response(
+        url="https://task-registry.rijksapp.nl/instruments/urn/urn:nl:aivt:tr:iama:1.0?version=latest",
+        content=TASK_REGISTRY_CONTENT_PAYLOAD.encode(),
+    )
+    client = TaskRegistryAPIClient()
+
+    # when
+    await client.get_task_by_urn(TaskType.INSTRUMENTS, "urn:nl:aivt:tr:iama:1.0")
+
+    # then
+    assert client.is_open is True
+    assert client.pool_stats() == {"in_use": 0, "max_connections": 20}
+    await client.close()
@@ -2,8 +2,12 @@ import logging
 from pathlib import Path
 
 import pytest
+from amt.core.config import Settings
 from amt.core.db import (
+    InstrumentedQueuePool,
     check_db,
+    get_engine,
+    get_pool_kwargs,
     init_db,
     reset_engine,
 )
@@ -27,3 +31,38 @@ async def test_check_and_init_database(monkeypatch: pytest.MonkeyPatch, tmp_path
     assert AsyncSession.execute.call_args is not None
     assert str(select(1)) == str(AsyncSession.execute.call_args.args[0])
     AsyncSession.execute = org_exec
+
+
+def test_get_pool_kwargs(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("APP_DATABASE_POOL_SIZE", "5")
+    monkeypatch.setenv("APP_DATABASE_POOL_PRE_PING", "false")
+
+    pool_kwargs = get_pool_kwargs(Settings())
+
+    assert pool_kwargs["poolclass"] is InstrumentedQueuePool
+    assert pool_kwargs["pool_size"] == 5
+    assert pool_kwargs["pool_pre_ping"] is False
+    assert get_pool_kwargs(Settings(APP_DATABASE_FILE=":memory:")) == {}
+
+
+@pytest.mark.asyncio
+async def test_instrumented_engine(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, caplog: pytest.LogCaptureFixture, mocker: MockFixture
+):
+    # given
+    monkeypatch.setenv("APP_DATABASE_FILE", "/" + str(tmp_path / "database.sqlite3"))
+    monkeypatch.setenv("APP_DATABASE_SLOW_QUERY_SECONDS", "0")
+    reset_engine()
+    checkout_wait = mocker.patch("amt.core.db._db_pool_checkout_wait")
+    query_duration = mocker.patch("amt.core.db._db_query_duration")
+
+    # when
+    with caplog.at_level(logging.WARNING, logger="amt.core.db"):
+        async with AsyncSession(get_engine()) as session:
+            await session.execute(select(1))
+
+    # then
+    checkout_wait.observe.assert_called_once()
+    query_duration.observe.assert_called_once()
+    assert "Slow query" in caplog.text
+    reset_engine()
@@ -18,7 +18,7 @@ async def test_http_exception_handler(client: AsyncClient):
 
 @pytest.mark.asyncio
 async def test_request_validation_exception_handler(client: AsyncClient):
-    response = await client.get("/algorithms/?skip=a")
+    response = await client.get("/algorithms/?limit=a")
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert response.headers["content-type"] == "text/html; charset=utf-8"
@@ -51,7 +51,7 @@ async def test_http_exception_handler_htmx(client: AsyncClient):
 
 @pytest.mark.asyncio
 async def test_request_validation_exception_handler_htmx(client: AsyncClient):
-    response = await client.get("/algorithms/?skip=a", headers={"HX-Request": "true"})
+    response = await client.get("/algorithms/?limit=a", headers={"HX-Request": "true"})
 
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert response.headers["content-type"] == "text/html; charset=utf-8"
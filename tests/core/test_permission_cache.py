@@ -0,0 +1,111 @@
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+from amt.core.authorization import AuthorizationVerb
+from amt.core.permission_cache import InMemoryPermissionCache, SharedPermissionCache
+from pytest_mock import MockerFixture
+
+USER_ID = UUID("92714be3-f798-4461-ba83-55d6cfd889a6")
+PERMISSIONS = {"organizations/1": [AuthorizationVerb.READ, AuthorizationVerb.UPDATE]}
+
+
+@pytest.mark.asyncio
+async def test_in_memory_set_and_get() -> None:
+    # given
+    cache = InMemoryPermissionCache()
+
+    # when
+    await cache.set(USER_ID, PERMISSIONS)
+
+    # then
+    assert await cache.get(USER_ID) == PERMISSIONS
+    assert await cache.get(str(USER_ID)) == PERMISSIONS
+    assert await cache.get("unknown") is None
+
+
+@pytest.mark.asyncio
+async def test_in_memory_expires(mocker: MockerFixture) -> None:
+    # given
+    monotonic = mocker.patch("amt.core.permission_cache.time.monotonic", return_value=100.0)
+    cache = InMemoryPermissionCache(ttl_seconds=10)
+    await cache.set(USER_ID, PERMISSIONS)
+
+    # when
+    monotonic.return_value = 111.0
+
+    # then
+    assert await cache.get(USER_ID) is None
+
+
+@pytest.mark.asyncio
+async def test_in_memory_evicts_least_recently_used() -> None:
+    # given
+    cache = InMemoryPermissionCache(max_size=2)
+    await cache.set("a", PERMISSIONS)
+    await cache.set("b", PERMISSIONS)
+    await cache.get("a")
+
+    # when
+    await cache.set("c", PERMISSIONS)
+
+    # then
+    assert await cache.get("a") == PERMISSIONS
+    assert await cache.get("b") is None
+    assert await cache.get("c") == PERMISSIONS
+
+
+@pytest.mark.asyncio
+async def test_in_memory_invalidate_and_disable() -> None:
+    # given
+    cache = InMemoryPermissionCache()
+    disabled_cache = InMemoryPermissionCache(max_size=0)
+    await cache.set(USER_ID, PERMISSIONS)
+    await disabled_cache.set(USER_ID, PERMISSIONS)
+
+    # when
+    await cache.invalidate(str(USER_ID))
+
+    # then
+    assert await cache.get(USER_ID) is None
+    assert await disabled_cache.get(USER_ID) is None
+
+
+@pytest.mark.asyncio
+async def test_shared_is_shared_between_instances(tmp_path: Path) -> None:
+    # given
+    cache = SharedPermissionCache(tmp_path / "permissions.sqlite3")
+    other_cache = SharedPermissionCache(tmp_path / "permissions.sqlite3")
+
+    # when
+    await cache.set(USER_ID, PERMISSIONS)
+
+    # then
+    permissions = await other_cache.get(USER_ID)
+    assert permissions == PERMISSIONS
+    assert permissions is not None
+    assert isinstance(permissions["organizations/1"][0], AuthorizationVerb)
+
+    # when
+    await other_cache.invalidate(USER_ID)
+
+    # then
+    assert await cache.get(USER_ID) is None
+
+
+@pytest.mark.asyncio
+async def test_shared_expires_and_clears(tmp_path: Path) -> None:
+    # given
+    cache = SharedPermissionCache(tmp_path / "permissions.sqlite3", ttl_seconds=-1)
+    await cache.set(USER_ID, PERMISSIONS)
+
+    # then
+    assert await cache.get(USER_ID) is None
+
+    # when
+    cache = SharedPermissionCache(tmp_path / "permissions.sqlite3")
+    await cache.set(USER_ID, PERMISSIONS)
+    await cache.clear()
+
+    # then
+    assert await cache.get(USER_ID) is None
@@ -1,5 +1,17 @@
+import asyncio
+
 import pytest
-from amt.core.session_store import InMemorySessionStore
+from amt.core.config import Settings
+from amt.core.session_store import (
+    CopyOnWriteDict,
+    InMemorySessionStore,
+    RedisSessionStore,
+    create_redis_client,
+    create_session_store,
+)
+from pytest_mock import MockerFixture
+
+from tests.redis_test_server import RedisTestServer
 
 
 @pytest.mark.asyncio
@@ -116,14 +128,15 @@ async def test_touch_returns_false_for_nonexistent() -> None:
 
 
 @pytest.mark.asyncio
-async def test_session_expires_after_ttl() -> None:
+async def test_session_expires_after_ttl(mocker: MockerFixture) -> None:
     # given
+    monotonic = mocker.patch("amt.core.session_store.time.monotonic", return_value=1000.0)
     store = InMemorySessionStore(default_ttl_seconds=100)
     session_id = "test-session"
     await store.set(session_id, {"key": "value"})
 
-    # when - simulate expiry by setting expires_at to the past
-    store._sessions[session_id].expires_at = 0  # pyright: ignore[reportPrivateUsage]
+    # when
+    monotonic.return_value = 1101.0
     result = await store.get(session_id)
 
     # then
@@ -131,15 +144,13 @@ async def test_session_expires_after_ttl() -> None:
 
 
 @pytest.mark.asyncio
-async def test_cleanup_expired() -> None:
+async def test_cleanup_expired(mocker: MockerFixture) -> None:
     # given
+    monotonic = mocker.patch("amt.core.session_store.time.monotonic", return_value=1000.0)
     store = InMemorySessionStore(default_ttl_seconds=100)
     await store.set("session1", {"key": "value1"})
     await store.set("session2", {"key": "value2"})
-
-    # simulate expiry by setting expires_at to the past
-    store._sessions["session1"].expires_at = 0  # pyright: ignore[reportPrivateUsage]
-    store._sessions["session2"].expires_at = 0  # pyright: ignore[reportPrivateUsage]
+    monotonic.return_value = 1101.0
 
     # when
     count = await store.cleanup_expired()
@@ -193,3 +204,168 @@ async def test_count_returns_number_of_active_sessions() -> None:
 
     # then
     assert count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_shares_data_until_modified() -> None:
+    # given
+    store = InMemorySessionStore()
+    await store.set("test-session", {"key": "value", "user": {"name": "test"}})
+
+    # when
+    read = await store.get("test-session")
+    written = await store.get("test-session")
+    assert isinstance(read, CopyOnWriteDict)
+    assert isinstance(written, CopyOnWriteDict)
+    written["key"] = "modified"
+    del written["user"]
+
+    # then
+    assert read.modified is False
+    assert written.modified is True
+    assert written == {"key": "modified"}
+    assert await store.get("test-session") == {"key": "value", "user": {"name": "test"}}
+
+
+def test_copy_on_write_dict_clear_and_copy() -> None:
+    # given
+    data = {"key": "value"}
+    session = CopyOnWriteDict(data)
+
+    # when
+    copy = session.copy()
+    copy["key"] = "copied"
+    session.clear()
+
+    # then
+    assert data == {"key": "value"}
+    assert len(session) == 0
+    assert session.modified is True
+    assert "key" not in session
+
+
+@pytest.mark.asyncio
+async def test_cleanup_expired_skips_touched_and_deleted_sessions(mocker: MockerFixture) -> None:
+    # given
+    monotonic = mocker.patch("amt.core.session_store.time.monotonic", return_value=1000.0)
+    store = InMemorySessionStore(default_ttl_seconds=100)
+    await store.set("touched", {"key": "value"})
+    await store.set("deleted", {"key": "value"})
+    await store.set("set-again", {"key": "value"})
+    await store.set("expired", {"key": "value"})
+    monotonic.return_value = 1050.0
+    await store.touch("touched")
+    await store.delete("deleted")
+    await store.set("set-again", {"key": "new"})
+
+    # when
+    monotonic.return_value = 1101.0
+    count = await store.cleanup_expired()
+
+    # then
+    assert count == 1
+    assert await store.count() == 2
+    assert await store.get("touched") == {"key": "value"}
+    assert await store.get("set-again") == {"key": "new"}
+
+
+@pytest.mark.asyncio
+async def test_expiry_heap_is_compacted() -> None:
+    # given
+    store = InMemorySessionStore()
+    await store.set("test-session", {"key": "value"})
+
+    # when
+    for _ in range(1000):
+        await store.touch("test-session")
+
+    # then
+    assert len(store._expiry_heap) <= 2 + 64  # pyright: ignore[reportPrivateUsage]
+    assert await store.cleanup_expired() == 0
+
+
+@pytest.mark.asyncio
+async def test_redis_store() -> None:
+    async with RedisTestServer() as server:
+        # given
+        store = RedisSessionStore(create_redis_client(server.url, 2), default_ttl_seconds=60)
+        data = {"user": {"name": "test"}}
+
+        # when
+        await store.set("test-session", data)
+
+        # then
+        assert await store.get("test-session") == data
+        assert await store.get("nonexistent") is None
+        assert await store.count() is None
+        assert await store.cleanup_expired() == 0
+
+        # when
+        touched = await store.touch("test-session", 120)
+
+        # then
+        assert touched is True
+        assert await store.touch("nonexistent") is False
+        assert 60 < (server.ttl("amt:session:test-session") or 0) <= 120
+
+        # when
+        await store.delete("test-session")
+
+        # then
+        assert await store.get("test-session") is None
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_redis_store_get_and_touch_is_pipelined() -> None:
+    async with RedisTestServer() as server:
+        # given
+        store = RedisSessionStore(create_redis_client(server.url, 2), default_ttl_seconds=60)
+        await store.set("test-session", {"key": "value"}, ttl_seconds=10)
+
+        # when
+        result = await store.get_and_touch("test-session")
+
+        # then
+        assert result == {"key": "value"}
+        assert server.commands[-2:] == [
+            [b"GET", b"amt:session:test-session"],
+            [b"EXPIRE", b"amt:session:test-session", b"60"],
+        ]
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_redis_store_reconnects_after_server_restart() -> None:
+    async with RedisTestServer() as server:
+        # given
+        store = RedisSessionStore(create_redis_client(server.url, 2), default_ttl_seconds=60)
+        await store.set("test-session", {"key": "value"})
+
+        # when
+        server.disconnect_clients()
+        await asyncio.sleep(0)
+
+        # then
+        assert await store.get("test-session") == {"key": "value"}
+        assert server.connections == 2
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_in_memory_get_and_touch() -> None:
+    # given
+    store = InMemorySessionStore(default_ttl_seconds=60)
+    await store.set("test-session", {"key": "value"}, ttl_seconds=1)
+
+    # when
+    result = await store.get_and_touch("test-session")
+
+    # then
+    assert result == {"key": "value"}
+    assert await store.get_and_touch("nonexistent") is None
+
+
+def test_create_session_store() -> None:
+    assert isinstance(create_session_store(Settings()), InMemorySessionStore)
+    assert isinstance(create_session_store(Settings(SESSION_STORE_BACKEND="redis")), RedisSessionStore)
@@ -5,12 +5,16 @@ import pytest
 from amt.middleware.csrf import (
     CookieOnlyCsrfProtect,
     CSRFMiddleware,
+    CSRFMiddlewareExceptionHandler,
 )
+from amt.middleware.htmx import HTMXMiddleware
 from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi_csrf_protect.exceptions import (
     MissingTokenError,
     TokenValidationError,
 )
+from httpx import ASGITransport, AsyncClient
 from itsdangerous import BadData, SignatureExpired
 from pytest_mock import MockerFixture
 
@@ -92,3 +96,50 @@ async def test_csrf_middleware_init() -> None:
     assert middleware.app == app
     assert isinstance(middleware.csrf_protect, CookieOnlyCsrfProtect)
     assert middleware.safe_methods == ("GET", "HEAD", "OPTIONS", "TRACE")
+
+
+def create_csrf_test_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.api_route("/form", methods=["GET", "POST"])
+    async def form(request: Request) -> JSONResponse:  # pyright: ignore[reportUnusedFunction]
+        return JSONResponse({"csrftoken": request.state.csrftoken})
+
+    app.add_middleware(CSRFMiddleware)
+    app.add_middleware(CSRFMiddlewareExceptionHandler)
+    app.add_middleware(HTMXMiddleware)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_csrf_middleware_sets_cookie_on_safe_methods(mocker: MockerFixture) -> None:
+    # given
+    mocker.patch.object(CookieOnlyCsrfProtect, "_secret_key", "test-secret", create=True)
+    app = create_csrf_test_app()
+
+    # when
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/form")
+
+    # then
+    assert response.status_code == 200
+    assert response.json()["csrftoken"] != ""
+    assert "fastapi-csrf-token" in response.cookies
+
+
+@pytest.mark.asyncio
+async def test_csrf_middleware_rejects_missing_token(mocker: MockerFixture) -> None:
+    # given
+    mocker.patch.object(CookieOnlyCsrfProtect, "_secret_key", "test-secret", create=True)
+    exception_handler = mocker.patch(
+        "amt.middleware.csrf.general_exception_handler", return_value=JSONResponse({}, status_code=400)
+    )
+    app = create_csrf_test_app()
+
+    # when
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/form")
+
+    # then
+    assert response.status_code == 400
+    exception_handler.assert_called_once()
@@ -0,0 +1,48 @@
+import pytest
+from amt.middleware.database_session import DatabaseSessionMiddleware
+from amt.repositories.deps import RequestSession, get_request_session, get_session
+from amt.services.services_provider import ServicesProvider
+from httpx import ASGITransport, AsyncClient
+from pytest_mock import MockerFixture
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+
+async def shared_session(request: Request) -> JSONResponse:
+    request_session: RequestSession = request.state.request_session
+    async with ServicesProvider().session_scope() as services_provider:
+        provider_session = await services_provider.get_session()
+    session_generator = get_session()
+    dependency_session = await anext(session_generator)
+    await session_generator.aclose()
+    return JSONResponse(
+        {
+            "current": get_request_session() is request_session,
+            "services_provider": provider_session is request_session.session,
+            "dependency": dependency_session is request_session.session,
+        }
+    )
+
+
+def create_test_app() -> Starlette:
+    app = Starlette(routes=[Route("/shared", shared_session)])
+    app.add_middleware(DatabaseSessionMiddleware)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_request_session_is_shared_and_closed(mocker: MockerFixture) -> None:
+    # given
+    close = mocker.patch.object(RequestSession, "close")
+    app = create_test_app()
+
+    # when
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver") as client:
+        response = await client.get("/shared")
+
+    # then
+    assert response.json() == {"current": True, "services_provider": True, "dependency": True}
+    assert get_request_session() is None
+    close.assert_awaited_once()
@@ -0,0 +1,73 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+from amt.middleware.fast_path import FastPathMiddleware
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from starlette.staticfiles import StaticFiles
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class RecordingMiddleware:
+    def __init__(self, app: ASGIApp, paths: list[str]) -> None:
+        self.app = app
+        self.paths = paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.paths.append(scope["path"])
+        await self.app(scope, receive, send)
+
+
+def create_test_app(static_dir: str, recorded_paths: list[str]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health/live")
+    async def liveness() -> dict[str, str]:  # pyright: ignore[reportUnusedFunction]
+        return {"status": "ok"}
+
+    @app.get("/page")
+    async def page() -> dict[str, str]:  # pyright: ignore[reportUnusedFunction]
+        return {"page": "ok"}
+
+    app.mount("/static", StaticFiles(directory=Path(static_dir)), name="static")
+    app.add_middleware(RecordingMiddleware, paths=recorded_paths)
+    app.add_middleware(FastPathMiddleware, router=app.router)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_fast_path_skips_other_middleware() -> None:
+    with tempfile.TemporaryDirectory() as static_dir:
+        # given
+        (Path(static_dir) / "style.css").write_text("body {}")
+        recorded_paths: list[str] = []
+        app = create_test_app(static_dir, recorded_paths)
+
+        # when
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            static_response = await client.get("/static/style.css")
+            missing_response = await client.get("/static/missing.css")
+            health_response = await client.get("/health/live")
+            page_response = await client.get("/page")
+
+    # then
+    assert static_response.text == "body {}"
+    assert missing_response.status_code == 404
+    assert health_response.json() == {"status": "ok"}
+    assert page_response.json() == {"page": "ok"}
+    assert "Strict-Transport-Security" in static_response.headers
+    assert "Strict-Transport-Security" in health_response.headers
+    assert recorded_paths == ["/page"]
+
+
+def test_is_fast_path() -> None:
+    # given
+    middleware = FastPathMiddleware(FastAPI(), router=FastAPI().router)
+
+    # then
+    assert middleware.is_fast_path("/static/js/main.js")
+    assert middleware.is_fast_path("/health/ready")
+    assert middleware.is_fast_path("/metrics")
+    assert not middleware.is_fast_path("/metrics/other")
+    assert not middleware.is_fast_path("/algorithms/")
@@ -0,0 +1,70 @@
+import json
+import logging
+
+import pytest
+from amt.middleware.route_logging import MASK_VALUE, RequestLoggingMiddleware, mask_headers
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+
+async def request_id(request: Request) -> JSONResponse:
+    return JSONResponse({"request_id": request.state.request_id})
+
+
+def create_test_app(sample_rate: float = 1.0) -> Starlette:
+    app = Starlette(routes=[Route("/items/{item_id}", request_id)])
+    app.add_middleware(RequestLoggingMiddleware, sample_rate=sample_rate)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_request_logging_middleware(caplog: pytest.LogCaptureFixture) -> None:
+    # given
+    app = create_test_app()
+
+    # when
+    with caplog.at_level(logging.DEBUG, logger="amt.middleware.route_logging"):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/items/1?q=1", cookies={"secret": "value"})
+
+    # then
+    assert response.headers["X-API-Request-ID"] == response.json()["request_id"]
+    records = [record for record in caplog.records if record.name == "amt.middleware.route_logging"]
+    logging_body = json.loads(records[-1].getMessage())
+    assert logging_body["request_id"] == response.json()["request_id"]
+    assert logging_body["request"]["path"] == "/items/1"
+    assert logging_body["request"]["query_params"] == "q=1"
+    assert logging_body["request"]["headers"]["cookie"] == MASK_VALUE
+    assert logging_body["response"]["status_code"] == 200
+
+
+@pytest.mark.asyncio
+async def test_request_logging_middleware_skips_logging(caplog: pytest.LogCaptureFixture) -> None:
+    # given
+    sampled_out_app = create_test_app(sample_rate=0)
+
+    # when
+    async with AsyncClient(transport=ASGITransport(app=create_test_app()), base_url="http://test") as client:
+        with caplog.at_level(logging.INFO, logger="amt.middleware.route_logging"):
+            await client.get("/items/1")
+    async with AsyncClient(transport=ASGITransport(app=sampled_out_app), base_url="http://test") as client:
+        with caplog.at_level(logging.DEBUG, logger="amt.middleware.route_logging"):
+            response = await client.get("/items/2")
+
+    # then
+    assert "X-API-Request-ID" in response.headers
+    assert [record for record in caplog.records if record.name == "amt.middleware.route_logging"] == []
+
+
+def test_mask_headers() -> None:
+    # given
+    raw_headers = [(b"cookie", b"session_id=1"), (b"x-secret-key", b"key"), (b"accept", b"text/html")]
+
+    # when
+    masked_headers = mask_headers(raw_headers)
+
+    # then
+    assert masked_headers == {"cookie": MASK_VALUE, "x-secret-key": MASK_VALUE, "accept": "text/html"}
@@ -0,0 +1,26 @@
+import pytest
+from amt.middleware.security import SecurityMiddleware
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+
+async def homepage(request: Request) -> PlainTextResponse:
+    return PlainTextResponse("ok")
+
+
+@pytest.mark.asyncio
+async def test_security_middleware_adds_hsts_header() -> None:
+    # given
+    app = Starlette(routes=[Route("/", homepage)])
+    app.add_middleware(SecurityMiddleware)
+
+    # when
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/")
+
+    # then
+    assert response.text == "ok"
+    assert response.headers["Strict-Transport-Security"] == "max-age=31536000; includeSubDomains"
@@ -2,14 +2,16 @@ import tempfile
 from pathlib import Path
 
 import pytest
-from amt.core.session_store import InMemorySessionStore
+from amt.core.session_store import InMemorySessionStore, RedisSessionStore, SessionStore, create_redis_client
 from amt.middleware.session import ServerSideSessionMiddleware
 from httpx import ASGITransport, AsyncClient
+from pytest_mock import MockerFixture
 from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 from starlette.routing import Route
 from starlette.staticfiles import StaticFiles
+from tests.redis_test_server import RedisTestServer
 
 
 async def get_session(request: Request) -> JSONResponse:
@@ -28,17 +30,24 @@ async def clear_session(request: Request) -> JSONResponse:
     return JSONResponse({"status": "cleared"})
 
 
-def create_test_app(session_store: InMemorySessionStore) -> Starlette:
+async def rename_user(request: Request) -> JSONResponse:
+    request.session["user"]["name"] = (await request.json())["name"]
+    return JSONResponse({"status": "ok"})
+
+
+def create_test_app(session_store: SessionStore, refresh_interval: int = 5 * 60) -> Starlette:
     routes = [
         Route("/get", get_session),
         Route("/set", set_session, methods=["POST"]),
         Route("/clear", clear_session, methods=["POST"]),
+        Route("/rename", rename_user, methods=["POST"]),
     ]
     app = Starlette(routes=routes)
     app.add_middleware(
         ServerSideSessionMiddleware,
         session_store=session_store,
         secret_key="test-secret-key",  # noqa: S106
+        refresh_interval=refresh_interval,
     )
     return app
 
@@ -373,3 +382,108 @@ async def test_expired_session_cookie_creates_new_session() -> None:
         new_data = new_response.json()
         assert new_data["session"] == {}
         assert new_data["session_id"] != session_id
+
+
+@pytest.mark.asyncio
+async def test_unmodified_session_is_not_written(mocker: MockerFixture) -> None:
+    # given
+    store = InMemorySessionStore()
+    app = create_test_app(store)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        set_response = await client.post("/set", json={"user": "test-user"})
+        store_set = mocker.spy(store, "set")
+        store_touch = mocker.spy(store, "touch")
+        store_get_and_touch = mocker.spy(store, "get_and_touch")
+
+        # when
+        response = await client.get("/get", cookies=set_response.cookies)
+
+    # then
+    assert response.json()["session"] == {"user": "test-user"}
+    assert "set-cookie" not in response.headers
+    store_set.assert_not_called()
+    store_touch.assert_not_called()
+    store_get_and_touch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_modified_session_is_written_without_new_cookie(mocker: MockerFixture) -> None:
+    # given
+    store = InMemorySessionStore()
+    app = create_test_app(store)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        set_response = await client.post("/set", json={"user": "test-user"})
+        store_set = mocker.spy(store, "set")
+
+        # when
+        response = await client.post("/set", json={"other": "value"}, cookies=set_response.cookies)
+        get_response = await client.get("/get", cookies=set_response.cookies)
+
+    # then
+    assert "set-cookie" not in response.headers
+    store_set.assert_called_once()
+    assert get_response.json()["session"] == {"user": "test-user", "other": "value"}
+
+
+@pytest.mark.asyncio
+async def test_unmodified_session_is_touched_when_refresh_is_due(mocker: MockerFixture) -> None:
+    # given
+    store = InMemorySessionStore()
+    app = create_test_app(store, refresh_interval=0)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        set_response = await client.post("/set", json={"user": "test-user"})
+        store_set = mocker.spy(store, "set")
+        store_get_and_touch = mocker.spy(store, "get_and_touch")
+
+        # when
+        response = await client.get("/get", cookies=set_response.cookies)
+
+    # then
+    assert response.json()["session"] == {"user": "test-user"}
+    assert "session_id" in response.cookies
+    store_get_and_touch.assert_called_once()
+    store_set.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_nested_change_is_stored() -> None:
+    # given
+    store = InMemorySessionStore()
+    app = create_test_app(store)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        set_response = await client.post("/set", json={"user": {"name": "old"}})
+
+        # when
+        await client.post("/rename", json={"name": "new"}, cookies=set_response.cookies)
+        response = await client.get("/get", cookies=set_response.cookies)
+
+    # then
+    assert response.json()["session"] == {"user": {"name": "new"}}
+
+
+@pytest.mark.asyncio
+async def test_nested_change_is_detected_for_redis_store() -> None:
+    async with RedisTestServer() as server:
+        # given
+        store = RedisSessionStore(create_redis_client(server.url, 2))
+        app = create_test_app(store)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            set_response = await client.post("/set", json={"user": {"name": "old"}})
+            await client.get("/get", cookies=set_response.cookies)
+            writes_before = sum(1 for command in server.commands if command[0] == b"SET")
+
+            # when
+            await client.post("/rename", json={"name": "new"}, cookies=set_response.cookies)
+            response = await client.get("/get", cookies=set_response.cookies)
+
+        await store.close()
+
+    # then
+    assert writes_before == 1
+    assert sum(1 for command in server.commands if command[0] == b"SET") == 2
+    assert response.json()["session"] == {"user": {"name": "new"}}
@@ -2,8 +2,20 @@ import json
 from datetime import UTC, datetime
 from enum import Enum
 
-from amt.models.algorithm import Algorithm, CustomJSONEncoder
+from amt.api.lifecycles import Lifecycles
+from amt.models.algorithm import (
+    Algorithm,
+    CustomJSONEncoder,
+    get_lifecycle_index,
+    get_system_card_facets,
+    get_system_card_progress,
+    to_json_compatible,
+)
+from amt.schema.ai_act_profile import AiActProfile
+from amt.schema.algorithm import AlgorithmProgress
+from amt.schema.requirement import RequirementTask
 from amt.schema.system_card import SystemCard
+from pytest_mock import MockerFixture
 
 
 def test_model_basic_algorithm():
@@ -14,6 +26,68 @@ def test_model_basic_algorithm():
     assert algorithm.name == "Test Algorithm"
 
 
+def test_model_lifecycle_index():
+    # given
+    algorithm = Algorithm(name="Test Algorithm")
+    algorithm_with_lifecycle = Algorithm(name="Test Algorithm", lifecycle=Lifecycles.DESIGN)
+
+    # when
+    algorithm.lifecycle = "PHASING_OUT"  # pyright: ignore[reportAttributeAccessIssue]
+
+    # then
+    assert algorithm.lifecycle_index == Lifecycles.PHASING_OUT.index
+    assert algorithm_with_lifecycle.lifecycle_index == Lifecycles.DESIGN.index
+    assert get_lifecycle_index(None) == -1
+    assert get_lifecycle_index("new lifecycle") == -1
+
+    # when
+    algorithm.lifecycle = "development"  # pyright: ignore[reportAttributeAccessIssue]
+
+    # then
+    assert algorithm.lifecycle_index == -1
+
+
+def test_model_system_card_facets():
+    # given
+    algorithm = Algorithm(name="Test Algorithm")
+    algorithm_from_json = Algorithm(
+        name="Test Algorithm", system_card_json={"status": "in use", "ai_act_profile": {"risk_group": "verboden AI"}}
+    )
+
+    # when
+    algorithm.system_card = SystemCard(
+        status="in development",
+        ai_act_profile=AiActProfile(type="AI-systeem", risk_group="hoog-risico AI", role=["aanbieder", "gebruiker"]),
+    )
+    algorithm.sync_system_card()
+
+    # then
+    assert algorithm.risk_group == "hoog-risico AI"
+    assert algorithm.ai_act_type == "AI-systeem"
+    assert algorithm.ai_act_role == "aanbieder + gebruiker"
+    assert algorithm.status == "in development"
+    assert algorithm_from_json.risk_group == "verboden AI"
+    assert algorithm_from_json.status == "in use"
+    assert get_system_card_facets(None) == dict.fromkeys(("risk_group", "ai_act_type", "ai_act_role", "status"))
+
+
+def test_model_system_card_progress():
+    # given
+    algorithm = Algorithm(name="Test Algorithm", system_card=SystemCard())
+    assert algorithm.progress == AlgorithmProgress()
+
+    # when
+    algorithm.system_card.requirements = [
+        RequirementTask(urn="urn:requirement:1", version="1.0", state="done"),
+        RequirementTask(urn="urn:requirement:2", version="1.0", state="in progress"),
+    ]
+
+    # then
+    assert algorithm.progress == AlgorithmProgress(1, 2)
+    assert algorithm.requirements_completed == 1
+    assert get_system_card_progress(None) == {"requirements_completed": 0, "requirements_total": 0}
+
+
 def test_model_systemcard():
     # given
     system_card = SystemCard(name="Test System Card")  # pyright: ignore[reportCallIssue]
@@ -95,6 +169,22 @@ def test_model_systemcard_none():
     assert algorithm.system_card == SystemCard()  # pyright: ignore[reportCallIssue]
 
 
+def test_model_systemcard_is_serialized_once(mocker: MockerFixture):
+    # given
+    algorithm = Algorithm(name="Test Algorithm", system_card=SystemCard(name="Test System Card"))  # pyright: ignore[reportCallIssue]
+    sync_system_card = mocker.spy(algorithm, "sync_system_card")
+
+    # when
+    algorithm.system_card.name = "Another name"
+    algorithm.system_card.description = "Another description"
+
+    # then
+    sync_system_card.assert_not_called()
+    assert algorithm.system_card_json["name"] == "Another name"
+    assert algorithm.system_card_json["description"] == "Another description"
+    sync_system_card.assert_called_once()
+
+
 class TestEnum(Enum):
     A = 1
     B = 2
@@ -128,3 +218,13 @@ def test_custom_json_encoder_mixed_types():
     encoded = json.dumps(test_data, cls=CustomJSONEncoder)
     decoded = json.loads(encoded)
     assert decoded == {"datetime": "2023-05-17T12:30:45+00:00", "enum": "B", "standard": "test"}
+
+
+def test_to_json_compatible_matches_custom_json_encoder():
+    test_data = {
+        "datetime": datetime(2023, 5, 17, 12, 30, 45, tzinfo=UTC),
+        "enum": TestEnum.B,
+        "list": [1, (2, 3), {"nested": TestEnum.A}],
+        1: None,
+    }
+    assert to_json_compatible(test_data) == json.loads(json.dumps(test_data, cls=CustomJSONEncoder))
@@ -0,0 +1,117 @@
+import asyncio
+import fnmatch
+import time
+from types import TracebackType
+
+RedisValue = bytes | int | list["RedisValue"] | None
+
+
+class RedisTestServer:
+    """
+    An in-process stand-in for a Redis server, supporting the commands used by AMT.
+    """
+
+    def __init__(self, password: str | None = None) -> None:
+        self.password = password
+        self.data: dict[bytes, tuple[bytes, float | None]] = {}
+        self.commands: list[list[bytes]] = []
+        self.connections = 0
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None
+        port = self._server.sockets[0].getsockname()[1]
+        credentials = f":{self.password}@" if self.password else ""
+        return f"redis://{credentials}127.0.0.1:{port}/1"
+
+    async def __aenter__(self) -> "RedisTestServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def disconnect_clients(self) -> None:
+        """Closes all client connections, like a restart of the server."""
+        for writer in self._writers:
+            writer.close()
+
+    def ttl(self, key: str) -> float | None:
+        expires_at = self.data[key.encode()][1]
+        return None if expires_at is None else expires_at - time.monotonic()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self._writers.add(writer)
+        try:
+            while line := await reader.readline():
+                command: list[bytes] = []
+                for _ in range(int(line[1:-2])):
+                    length = int((await reader.readline())[1:-2])
+                    command.append((await reader.readexactly(length + 2))[:-2])
+                self.commands.append(command)
+                writer.write(self._reply(command))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    def _get(self, key: bytes) -> bytes | None:
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        if entry[1] is not None and entry[1] <= time.monotonic():
+            del self.data[key]
+            return None
+        return entry[0]
+
+    def _reply(self, command: list[bytes]) -> bytes:  # noqa: C901
+        name, args = command[0].upper(), command[1:]
+        match name:
+            case b"PING":
+                return b"+PONG\r\n"
+            case b"AUTH":
+                return b"+OK\r\n" if args[-1].decode() == self.password else b"-WRONGPASS invalid password\r\n"
+            case b"SELECT":
+                return b"+OK\r\n"
+            case b"GET":
+                return self._encode(self._get(args[0]))
+            case b"SET":
+                expires_at = time.monotonic() + int(args[3]) if len(args) > 3 and args[2].upper() == b"EX" else None
+                self.data[args[0]] = (args[1], expires_at)
+                return b"+OK\r\n"
+            case b"DEL":
+                return self._encode(sum(1 for key in args if self.data.pop(key, None) is not None))
+            case b"EXPIRE":
+                value = self._get(args[0])
+                if value is None:
+                    return self._encode(0)
+                self.data[args[0]] = (value, time.monotonic() + int(args[1]))
+                return self._encode(1)
+            case b"SCAN":
+                pattern = args[args.index(b"MATCH") + 1].decode() if b"MATCH" in args else "*"
+                keys: list[RedisValue] = [
+                    key
+                    for key in list(self.data)
+                    if self._get(key) is not None and fnmatch.fnmatch(key.decode(), pattern)
+                ]
+                return self._encode([b"0", keys])
+            case _:
+                return b"-ERR unknown command '" + name + b"'\r\n"
+
+    def _encode(self, value: RedisValue) -> bytes:
+        if value is None:
+            return b"$-1\r\n"
+        if isinstance(value, int):
+            return b":%d\r\n" % value
+        if isinstance(value, list):
+            return b"*%d\r\n" % len(value) + b"".join(self._encode(item) for item in value)
+        return b"$%d\r\n%s\r\n" % (len(value), value)
@@ -3,9 +3,10 @@ from datetime import datetime
 import pytest
 from amt.api.lifecycles import Lifecycles
 from amt.api.risk_group import RiskGroup
-from amt.core.exceptions import AMTRepositoryError
-from amt.models import Algorithm
-from amt.repositories.algorithms import AlgorithmsRepository, sort_by_lifecycle, sort_by_lifecycle_reversed
+from amt.core.exceptions import AMTRepositoryError, AMTValueError
+from amt.repositories.algorithms import AlgorithmsRepository
+from amt.schema.algorithm import AlgorithmProgress, AlgorithmSummary
+from pytest_mock import MockerFixture
 from sqlalchemy.exc import IntegrityError, InvalidRequestError
 from tests.constants import (
     default_algorithm,
@@ -109,17 +110,165 @@ async def test_find_by_id_failed(db: DatabaseTestUtils):
 
 
 @pytest.mark.asyncio
-async def test_paginate(db: DatabaseTestUtils):
-    await db.given([default_user(), default_organization(), default_algorithm()])
+async def test_page_summaries_of_lifecycles(db: DatabaseTestUtils):
+    await db.given(
+        [
+            default_user(),
+            default_organization(),
+            default_algorithm_with_lifecycle(name="bbb", lifecycle=Lifecycles.DESIGN),
+            default_algorithm_with_lifecycle(name="aaa", lifecycle=Lifecycles.MONITORING_AND_MANAGEMENT),
+        ]
+    )
     algorithm_repository = AlgorithmsRepository(db.get_session())
 
-    result: list[Algorithm] = await algorithm_repository.paginate(skip=0, limit=3, search="", filters={}, sort={})
+    result: list[AlgorithmSummary] = (
+        await algorithm_repository.page_summaries(limit=3, search="", filters={}, sort={})
+    ).items
 
-    assert len(result) == 1
+    assert [summary.name for summary in result] == ["aaa", "bbb"]
+    assert all(isinstance(summary, AlgorithmSummary) for summary in result)
+    assert result[1].lifecycle == Lifecycles.DESIGN
+    assert result[1].last_edited is not None
+    assert result[1].progress == AlgorithmProgress()
+
+    result = (
+        await algorithm_repository.page_summaries(limit=3, search="", filters={}, sort={"lifecycle": "ascending"})
+    ).items
+
+    assert [summary.name for summary in result] == ["bbb", "aaa"]
 
 
 @pytest.mark.asyncio
-async def test_paginate_more(db: DatabaseTestUtils):
+@pytest.mark.parametrize(
+    "sort",
+    [{}, {"name": "descending"}, {"last_update": "ascending"}, {"lifecycle": "ascending"}, {"lifecycle": "descending"}],
+)
+async def test_page_summaries(db: DatabaseTestUtils, sort: dict[str, str]):
+    # given
+    await db.given(
+        [
+            default_user(),
+            default_organization(),
+            default_algorithm_with_lifecycle(name="ccc", lifecycle=Lifecycles.DESIGN),
+            default_algorithm_with_lifecycle(name="aaa", lifecycle=Lifecycles.DESIGN),
+            default_algorithm_with_lifecycle(name="Bbb", lifecycle=Lifecycles.MONITORING_AND_MANAGEMENT),
+            default_algorithm(name="ddd"),
+            default_algorithm(name="aaa"),
+        ]
+    )
+    algorithm_repository = AlgorithmsRepository(db.get_session())
+    expected = (await algorithm_repository.page_summaries(limit=10, search="", filters={}, sort=sort)).items
+
+    # when
+    names: list[str] = []
+    cursor = None
+    while True:
+        page = await algorithm_repository.page_summaries(limit=2, search="", filters={}, sort=sort, cursor=cursor)
+        assert len(page.items) <= 2
+        names.extend(summary.name for summary in page.items)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    # then
+    assert len(names) == 5
+    assert sorted(names) == sorted(summary.name for summary in expected)
+    if "last_update" not in sort:
+        # algorithms inserted in the same transaction share their last edited timestamp
+        assert names == [summary.name for summary in expected]
+    assert await algorithm_repository.count(search="", filters={}) == 5
+
+
+@pytest.mark.asyncio
+async def test_page_summaries_invalid_cursor(db: DatabaseTestUtils):
+    # given
+    await db.given([default_user(), default_organization(), default_algorithm(), default_algorithm()])
+    algorithm_repository = AlgorithmsRepository(db.get_session())
+    page = await algorithm_repository.page_summaries(limit=1, search="", filters={}, sort={})
+    assert page.next_cursor is not None
+
+    # when/then
+    with pytest.raises(AMTValueError):
+        await algorithm_repository.page_summaries(limit=1, search="", filters={}, sort={}, cursor="invalid")
+    with pytest.raises(AMTValueError):
+        await algorithm_repository.page_summaries(
+            limit=1, search="", filters={}, sort={"last_update": "ascending"}, cursor=page.next_cursor
+        )
+    with pytest.raises(AMTValueError):
+        await algorithm_repository.page_summaries(
+            limit=1, search="default", filters={}, sort={}, cursor=page.next_cursor
+        )
+    with pytest.raises(AMTValueError):
+        await algorithm_repository.page_summaries(
+            limit=1, search="", filters={"lifecycle": "DESIGN"}, sort={}, cursor=page.next_cursor
+        )
+
+
+@pytest.mark.asyncio
+async def test_page_summaries_progress(db: DatabaseTestUtils):
+    # given
+    algorithm = default_algorithm_with_system_card("with progress")
+    algorithm.system_card.requirements[0].state = "done"
+    algorithm.sync_system_card()
+    await db.given([default_user(), default_organization(), algorithm])
+    algorithm_repository = AlgorithmsRepository(db.get_session())
+
+    # when
+    result = (await algorithm_repository.page_summaries(limit=3, search="", filters={}, sort={})).items
+    algorithms, _ = await algorithm_repository.find_summaries_by_lifecycle(limit=3, search="", filters={}, sort={})
+
+    # then
+    assert result[0].progress.requirements_completed == 1
+    assert result[0].progress.requirements_total == len(algorithm.system_card.requirements)
+    assert [summary.progress for page in algorithms.values() for summary in page.items] == [result[0].progress]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("windowed", [True, False])
+async def test_find_summaries_by_lifecycle(db: DatabaseTestUtils, mocker: MockerFixture, windowed: bool):
+    await db.given(
+        [
+            default_user(),
+            default_organization(),
+            default_algorithm_with_lifecycle(name="ccc", lifecycle=Lifecycles.DESIGN),
+            default_algorithm_with_lifecycle(name="aaa", lifecycle=Lifecycles.DESIGN),
+            default_algorithm_with_lifecycle(name="bbb", lifecycle=Lifecycles.DESIGN),
+            default_algorithm_with_lifecycle(name="ddd", lifecycle=Lifecycles.DEVELOPMENT),
+            default_algorithm(name="no lifecycle"),
+        ]
+    )
+    algorithm_repository = AlgorithmsRepository(db.get_session())
+    mocker.patch("amt.repositories.pagination._supports_window_functions", return_value=windowed)
+
+    algorithms, counts = await algorithm_repository.find_summaries_by_lifecycle(limit=2, search="", filters={}, sort={})
+
+    assert {lifecycle: [summary.name for summary in page.items] for lifecycle, page in algorithms.items()} == {
+        Lifecycles.DESIGN.name: ["aaa", "bbb"],
+        Lifecycles.DEVELOPMENT.name: ["ddd"],
+    }
+    assert counts == {Lifecycles.DESIGN.name: 3, Lifecycles.DEVELOPMENT.name: 1}
+    assert algorithms[Lifecycles.DEVELOPMENT.name].next_cursor is None
+
+    next_page = await algorithm_repository.page_summaries(
+        limit=2,
+        search="",
+        filters={"lifecycle": Lifecycles.DESIGN.name},
+        sort={},
+        cursor=algorithms[Lifecycles.DESIGN.name].next_cursor,
+    )
+
+    assert [summary.name for summary in next_page.items] == ["ccc"]
+    assert next_page.next_cursor is None
+
+    algorithms, _ = await algorithm_repository.find_summaries_by_lifecycle(
+        limit=2, search="", filters={"lifecycle": Lifecycles.DESIGN.name}, sort={"name": "descending"}
+    )
+
+    assert [summary.name for summary in algorithms[Lifecycles.DESIGN.name].items] == ["ccc", "bbb"]
+
+
+@pytest.mark.asyncio
+async def test_page_summaries_more(db: DatabaseTestUtils):
     await db.given(
         [
             default_user(),
@@ -132,13 +281,15 @@ async def test_paginate_more(db: DatabaseTestUtils):
     )
     algorithm_repository = AlgorithmsRepository(db.get_session())
 
-    result: list[Algorithm] = await algorithm_repository.paginate(skip=0, limit=3, search="", filters={}, sort={})
+    result: list[AlgorithmSummary] = (
+        await algorithm_repository.page_summaries(limit=3, search="", filters={}, sort={})
+    ).items
 
     assert len(result) == 3
 
 
 @pytest.mark.asyncio
-async def test_paginate_capitalize(db: DatabaseTestUtils):
+async def test_page_summaries_capitalize(db: DatabaseTestUtils):
     await db.given(
         [
             default_user(),
@@ -151,7 +302,9 @@ async def test_paginate_capitalize(db: DatabaseTestUtils):
     )
     algorithm_repository = AlgorithmsRepository(db.get_session())
 
-    result: list[Algorithm] = await algorithm_repository.paginate(skip=0, limit=4, search="", filters={}, sort={})
+    result: list[AlgorithmSummary] = (
+        await algorithm_repository.page_summaries(limit=4, search="", filters={}, sort={})
+    ).items
 
     assert len(result) == 4
     assert result[0].name == "Aaa"
@@ -174,7 +327,9 @@ async def test_search(db: DatabaseTestUtils):
     )
     algorithm_repository = AlgorithmsRepository(db.get_session())
 
-    result: list[Algorithm] = await algorithm_repository.paginate(skip=0, limit=4, search="bbb", filters={}, sort={})
+    result: list[AlgorithmSummary] = (
+        await algorithm_repository.page_summaries(limit=4, search="bbb", filters={}, sort={})
+    ).items
 
     assert len(result) == 1
     assert result[0].name == "bbb"
@@ -194,7 +349,9 @@ async def test_search_multiple(db: DatabaseTestUtils):
     )
     algorithm_repository = AlgorithmsRepository(db.get_session())
 
-    result: list[Algorithm] = await algorithm_repository.paginate(skip=0, limit=4, search="A", filters={}, sort={})
+    result: list[AlgorithmSummary] = (
+        await algorithm_repository.page_summaries(limit=4, search="A", filters={}, sort={})
+    ).items
 
     assert len(result) == 3
     assert result[0].name == "Aaa"
@@ -205,7 +362,9 @@ async def test_search_multiple(db: DatabaseTestUtils):
 @pytest.mark.asyncio
 async def test_search_no_results(db: DatabaseTestUtils):
     algorithm_repository = AlgorithmsRepository(db.get_session())
-    result: list[Algorithm] = await algorithm_repository.paginate(skip=0, limit=4, search="A", filters={}, sort={})
+    result: list[AlgorithmSummary] = (
+        await algorithm_repository.page_summaries(limit=4, search="A", filters={}, sort={})
+    ).items
     assert len(result) == 0
 
 
@@ -215,47 +374,7 @@ async def test_raises_exception(db: DatabaseTestUtils):
     algorithm_repository = AlgorithmsRepository(db.get_session())
 
     with pytest.raises(AMTRepositoryError):
-        await algorithm_repository.paginate(skip="a", limit=3, search="", filters={}, sort={})  # type: ignore
-
-
-@pytest.mark.asyncio
-async def test_sort_by_lifecyle(db: DatabaseTestUtils):
-    await db.given(
-        [
-            default_user(),
-            default_organization(),
-            default_algorithm_with_lifecycle(name="Algorithm1", lifecycle=Lifecycles.DESIGN),
-            default_algorithm(name="Algorithm2"),
-        ]
-    )
-    algorithm_repository = AlgorithmsRepository(db.get_session())
-
-    algorithms: list[Algorithm] = await algorithm_repository.paginate(skip=0, limit=4, search="", filters={}, sort={})
-    result = sort_by_lifecycle(algorithms[0])
-    assert result == 2
-
-    result = sort_by_lifecycle(algorithms[1])
-    assert result == -1
-
-
-@pytest.mark.asyncio
-async def test_sort_by_lifecycle_reversed(db: DatabaseTestUtils):
-    await db.given(
-        [
-            default_user(),
-            default_organization(),
-            default_algorithm_with_lifecycle(name="Algorithm1", lifecycle=Lifecycles.DESIGN),
-            default_algorithm(name="Algorithm2"),
-        ]
-    )
-    algorithm_repository = AlgorithmsRepository(db.get_session())
-
-    algorithms: list[Algorithm] = await algorithm_repository.paginate(skip=0, limit=4, search="", filters={}, sort={})
-    result = sort_by_lifecycle_reversed(algorithms[0])
-    assert result == -2
-
-    result = sort_by_lifecycle_reversed(algorithms[1])
-    assert result == 1
+        await algorithm_repository.page_summaries(limit=3, search="", filters={"unknown": "a"}, sort={})
 
 
 @pytest.mark.asyncio
@@ -272,9 +391,11 @@ async def test_with_lifecycle_filter(db: DatabaseTestUtils):
     )
     algorithm_repository = AlgorithmsRepository(db.get_session())
 
-    result: list[Algorithm] = await algorithm_repository.paginate(
-        skip=0, limit=4, search="", filters={"lifecycle": Lifecycles.DESIGN.name}, sort={}
-    )
+    result: list[AlgorithmSummary] = (
+        await algorithm_repository.page_summaries(
+            limit=4, search="", filters={"lifecycle": Lifecycles.DESIGN.name}, sort={}
+        )
+    ).items
 
     assert len(result) == 1
     assert result[0].name == "Algorithm1"
@@ -300,9 +421,11 @@ async def test_with_risk_group_filter(db: DatabaseTestUtils):
     )
     algorithm_repository = AlgorithmsRepository(db.get_session())
 
-    result: list[Algorithm] = await algorithm_repository.paginate(
-        skip=0, limit=4, search="", filters={"risk-group": RiskGroup.HOOG_RISICO_AI.name}, sort={}
-    )
+    result: list[AlgorithmSummary] = (
+        await algorithm_repository.page_summaries(
+            limit=4, search="", filters={"risk-group": RiskGroup.HOOG_RISICO_AI.name}, sort={}
+        )
+    ).items
 
     assert len(result) == 1
     assert result[0].name == "Algorithm1"
@@ -325,41 +448,48 @@ async def test_with_sorting(db: DatabaseTestUtils):
     algorithm_repository = AlgorithmsRepository(db.get_session())
 
     # Sort name Ascending
-    result: list[Algorithm] = await algorithm_repository.paginate(
-        skip=0, limit=4, search="", filters={}, sort={"name": "ascending"}
-    )
+    result: list[AlgorithmSummary] = (
+        await algorithm_repository.page_summaries(limit=4, search="", filters={}, sort={"name": "ascending"})
+    ).items
     assert result[0].name == "Algorithm1"
 
     # Sort name Descending
-    result: list[Algorithm] = await algorithm_repository.paginate(
-        skip=0, limit=4, search="", filters={}, sort={"name": "descending"}
-    )
+    result: list[AlgorithmSummary] = (
+        await algorithm_repository.page_summaries(limit=4, search="", filters={}, sort={"name": "descending"})
+    ).items
     assert result[0].name == "Algorithm2"
 
     # Sort last_update Ascending
-    result: list[Algorithm] = await algorithm_repository.paginate(
-        skip=0, limit=4, search="", filters={}, sort={"last_update": "ascending"}
-    )
+    result: list[AlgorithmSummary] = (
+        await algorithm_repository.page_summaries(limit=4, search="", filters={}, sort={"last_update": "ascending"})
+    ).items
     assert result[0].name == "Algorithm1"
 
     # Sort last_update Descending
-    result: list[Algorithm] = await algorithm_repository.paginate(
-        skip=0, limit=4, search="", filters={}, sort={"last_update": "descending"}
-    )
+    result: list[AlgorithmSummary] = (
+        await algorithm_repository.page_summaries(limit=4, search="", filters={}, sort={"last_update": "descending"})
+    ).items
     assert result[0].name == "Algorithm2"
 
     # Sort lifecycle regular
-    result: list[Algorithm] = await algorithm_repository.paginate(
-        skip=0, limit=4, search="", filters={}, sort={"lifecycle": "ascending"}
-    )
+    result: list[AlgorithmSummary] = (
+        await algorithm_repository.page_summaries(limit=4, search="", filters={}, sort={"lifecycle": "ascending"})
+    ).items
     assert result[0].name == "Algorithm1"
 
     # Sort lifecycle reversed
-    result: list[Algorithm] = await algorithm_repository.paginate(
-        skip=0, limit=4, search="", filters={}, sort={"lifecycle": "descending"}
-    )
+    result: list[AlgorithmSummary] = (
+        await algorithm_repository.page_summaries(limit=4, search="", filters={}, sort={"lifecycle": "descending"})
+    ).items
     assert result[0].name == "Algorithm2"
 
+    # Sort lifecycle is applied before paging
+    page = await algorithm_repository.page_summaries(limit=1, search="", filters={}, sort={"lifecycle": "descending"})
+    page = await algorithm_repository.page_summaries(
+        limit=1, search="", filters={}, sort={"lifecycle": "descending"}, cursor=page.next_cursor
+    )
+    assert [algorithm.name for algorithm in page.items] == ["Algorithm1"]
+
 
 @pytest.mark.asyncio
 async def test_with_organization_filter(db: DatabaseTestUtils):
@@ -374,22 +504,22 @@ async def test_with_organization_filter(db: DatabaseTestUtils):
     )
     algorithm_repository = AlgorithmsRepository(db.get_session())
 
-    result: list[Algorithm] = await algorithm_repository.paginate(
-        skip=0, limit=4, search="", filters={"organization-id": "1"}, sort={}
-    )
+    result: list[AlgorithmSummary] = (
+        await algorithm_repository.page_summaries(limit=4, search="", filters={"organization-id": "1"}, sort={})
+    ).items
 
     assert len(result) == 1
     assert result[0].name == "Algorithm1"
 
-    result: list[Algorithm] = await algorithm_repository.paginate(
-        skip=0, limit=4, search="", filters={"organization-id": "2"}, sort={}
-    )
+    result: list[AlgorithmSummary] = (
+        await algorithm_repository.page_summaries(limit=4, search="", filters={"organization-id": "2"}, sort={})
+    ).items
 
     assert len(result) == 1
     assert result[0].name == "Algorithm2"
 
-    result: list[Algorithm] = await algorithm_repository.paginate(
-        skip=0, limit=4, search="", filters={"organization-id": "99"}, sort={}
-    )
+    result: list[AlgorithmSummary] = (
+        await algorithm_repository.page_summaries(limit=4, search="", filters={"organization-id": "99"}, sort={})
+    ).items
 
     assert len(result) == 0
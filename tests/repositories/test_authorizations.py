@@ -6,6 +6,7 @@ from amt.core.authorization import AuthorizationType
 from amt.core.exceptions import AMTRepositoryError
 from amt.models import Authorization
 from amt.repositories.authorizations import AuthorizationRepository
+from pytest_mock import MockerFixture
 from tests.constants import (
     default_algorithm,
     default_auth_user,
@@ -470,12 +471,45 @@ async def test_find_all(db: DatabaseTestUtils):
     assert sorted_desc_results[0][0].name == "Default User"
     assert sorted_desc_results[1][0].name == "Another User"
 
-    # Test with limit and skip
-    limited_results = await authorization_repository.find_all(limit=1)
-    assert len(limited_results) == 1
 
-    skipped_results = await authorization_repository.find_all(skip=1, limit=1)
-    assert len(skipped_results) == 1
+@pytest.mark.asyncio
+async def test_page_all(db: DatabaseTestUtils):
+    # given
+    user1 = default_user()
+    user2 = default_user(id="d4c4e1e8-ab21-4be3-b81c-eff75906421c", name="Another User")
+    user3 = default_user(id="0f8d4b6e-5a3c-4d2b-9e1f-7a6b5c4d3e2f", name="Yet Another User")
+    await db.given([user1, user2, user3])
+    await db.given_sql(get_auth_setup_sql())
+    await db.given(
+        [
+            default_authorization(user_id=str(user.id), role_id=1, type=AuthorizationType.ORGANIZATION, type_id=1)
+            for user in (user1, user2, user3)
+        ]
+    )
+
+    authorization_repository = AuthorizationRepository(
+        session=db.session,
+        users_repository=None,  # pyright: ignore[reportArgumentType]
+        organizations_repository=None,  # pyright: ignore[reportArgumentType]
+        algorithms_repository=None,  # pyright: ignore[reportArgumentType]
+    )
+    filters: dict[str, str | int | list[str | int] | AuthorizationType] = {
+        "type": AuthorizationType.ORGANIZATION,
+        "type_id": 1,
+    }
+
+    # when
+    first_page = await authorization_repository.page_all(limit=2, sort={"name": "ascending"}, filters=filters)
+    last_page = await authorization_repository.page_all(
+        limit=2, sort={"name": "ascending"}, filters=filters, cursor=first_page.next_cursor
+    )
+
+    # then
+    assert [user.name for user, *_ in first_page.items] == ["Another User", "Default User"]
+    assert [user.name for user, *_ in last_page.items] == ["Yet Another User"]
+    assert last_page.next_cursor is None
+    assert await authorization_repository.count_all(filters=filters) == 3
+    assert await authorization_repository.count_all(search="Another", filters=filters) == 2
 
 
 @pytest.mark.asyncio
@@ -613,3 +647,30 @@ async def test_get_by_id_not_found(db: DatabaseTestUtils):
 
     # then
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_add_role_for_user_invalidates_permissions_after_commit(db: DatabaseTestUtils, mocker: MockerFixture):
+    # given
+    user = default_user()
+    await db.given([user])
+    await db.init_authorizations_and_roles()
+    invalidate = mocker.patch("amt.repositories.authorizations.permission_cache.invalidate")
+
+    authorization_repository = AuthorizationRepository(
+        session=db.session,
+        users_repository=None,  # pyright: ignore[reportArgumentType]
+        organizations_repository=None,  # pyright: ignore[reportArgumentType]
+        algorithms_repository=None,  # pyright: ignore[reportArgumentType]
+    )
+
+    # when
+    await authorization_repository.add_role_for_user(
+        user_id=str(user.id), role_id=1, role_type=AuthorizationType.ORGANIZATION, type_id=1
+    )
+
+    # then
+    invalidate.assert_not_called()
+    await db.session.commit()
+    await db.session.run_after_commit()
+    invalidate.assert_awaited_once_with(user.id)
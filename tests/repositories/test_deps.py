@@ -1,8 +1,10 @@
 import pytest
+from amt.core.db import reset_engine
 from amt.core.exceptions import AMTRepositoryError
 from amt.repositories.deps import (
     AsyncSessionWithCommitFlag,
     get_session,
+    get_session_factory,
     get_session_non_generator,
     transaction_context,
 )
@@ -165,3 +167,47 @@ async def test_async_session_with_commit_flag():
     # Set should_commit to True
     session.should_commit = True
     assert session.should_commit is True
+
+
+@pytest.mark.asyncio
+async def test_transaction_context_runs_after_commit_callbacks(mocker: MockerFixture):
+    # Given
+    session = AsyncSessionWithCommitFlag()
+    session.should_commit = True
+    mocker.patch.object(session, "commit")
+    callback = mocker.AsyncMock()
+
+    # When
+    async with transaction_context(session) as tx_session:
+        tx_session.add_after_commit(callback)
+
+    # Then
+    callback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_transaction_context_skips_after_commit_callbacks_on_error(mocker: MockerFixture):
+    # Given
+    session = AsyncSessionWithCommitFlag()
+    session.should_commit = True
+    mocker.patch.object(session, "rollback")
+    mocker.patch.object(session, "commit", side_effect=SQLAlchemyError("Test error"))
+    callback = mocker.AsyncMock()
+    session.add_after_commit(callback)
+
+    # When
+    with pytest.raises(AMTRepositoryError):
+        async with transaction_context(session) as tx_session:
+            assert tx_session is session
+
+    # Then
+    callback.assert_not_awaited()
+
+
+def test_get_session_factory_is_cached_per_engine():
+    session_factory = get_session_factory()
+
+    assert get_session_factory() is session_factory
+
+    reset_engine()
+    assert get_session_factory() is not session_factory
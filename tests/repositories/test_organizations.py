@@ -5,7 +5,8 @@ import pytest
 from amt.api.organization_filter_options import OrganizationFilterOptions
 from amt.core.exceptions import AMTRepositoryError
 from amt.models import Organization
-from amt.repositories.organizations import OrganizationsRepository
+from amt.repositories.organizations import OrganizationSlugCache, OrganizationsRepository
+from pytest_mock import MockerFixture
 from tests.constants import default_organization, default_user
 from tests.database_test_utils import DatabaseTestUtils
 
@@ -37,8 +38,30 @@ async def test_find_by(db: DatabaseTestUtils):
     organizations = await organization_repository.find_by(search="no results")
     assert len(organizations) == 0
 
-    organizations = await organization_repository.find_by(search="default", skip=10, limit=100)
-    assert len(organizations) == 0
+
+@pytest.mark.asyncio
+async def test_page_by(db: DatabaseTestUtils):
+    # given
+    await db.given(
+        [
+            default_user(),
+            default_organization(),
+            default_organization(name="ZZZZZ", slug="zzzzz"),
+            default_organization(name="aaaaa", slug="aaaaa"),
+        ]
+    )
+    organization_repository = OrganizationsRepository(db.get_session())
+
+    # when
+    first_page = await organization_repository.page_by(limit=2, sort={"name": "descending"})
+    last_page = await organization_repository.page_by(
+        limit=2, sort={"name": "descending"}, cursor=first_page.next_cursor
+    )
+
+    # then
+    assert [organization.name for organization in first_page.items] == ["ZZZZZ", "default organization"]
+    assert [organization.name for organization in last_page.items] == ["aaaaa"]
+    assert last_page.next_cursor is None
 
 
 @pytest.mark.asyncio
@@ -105,6 +128,58 @@ async def test_find_by_slug_not_found(db: DatabaseTestUtils):
         await organization_repository.find_by_slug("non-existent-slug")
 
 
+@pytest.mark.asyncio
+async def test_find_id_by_slug(db: DatabaseTestUtils, mocker: MockerFixture):
+    # given
+    await db.given([default_user(), default_organization()])
+    slug_cache = mocker.patch("amt.repositories.organizations.organization_slug_cache", OrganizationSlugCache())
+    organization_repository = OrganizationsRepository(db.get_session())
+
+    # when
+    organization_id = await organization_repository.find_id_by_slug("default-organization")
+
+    # then
+    assert organization_id == 1
+    assert slug_cache.get("default-organization") == 1
+    with pytest.raises(AMTRepositoryError):
+        await organization_repository.find_id_by_slug("non-existent-slug")
+
+    # when
+    organization = await organization_repository.find_by_id(1)
+    organization.slug = "renamed-organization"
+    await organization_repository.save(organization)
+
+    # then
+    assert slug_cache.get("default-organization") is None
+    assert await organization_repository.find_id_by_slug("renamed-organization") == 1
+    with pytest.raises(AMTRepositoryError):
+        await organization_repository.find_id_by_slug("default-organization")
+
+
+def test_organization_slug_cache(mocker: MockerFixture):
+    # given
+    monotonic = mocker.patch("amt.repositories.organizations.time.monotonic", return_value=100.0)
+    slug_cache = OrganizationSlugCache(ttl_seconds=10, max_size=2)
+    slug_cache.set("a", 1)
+    slug_cache.set("b", 2)
+    slug_cache.get("a")
+
+    # when
+    slug_cache.set("c", 3)
+
+    # then
+    assert slug_cache.get("a") == 1
+    assert slug_cache.get("b") is None
+
+    # when
+    slug_cache.invalidate(1)
+    monotonic.return_value = 111.0
+
+    # then
+    assert slug_cache.get("a") is None
+    assert slug_cache.get("c") is None
+
+
 @pytest.mark.asyncio
 async def test_find_by_id(db: DatabaseTestUtils):
     await db.given([default_user(), default_organization()])
@@ -0,0 +1,46 @@
+from datetime import UTC, datetime
+from uuid import UUID
+
+import pytest
+from amt.core.exceptions import AMTValueError
+from amt.repositories.pagination import decode_cursor, encode_cursor, scoped_sort_name
+
+
+def test_cursor_round_trip():
+    # given
+    values = ["name", 3, datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=UTC), UUID(int=42), None]
+
+    # when
+    cursor = encode_cursor("name:ascending", values)
+
+    # then
+    assert "=" not in cursor
+    assert decode_cursor(cursor, "name:ascending", len(values)) == values
+
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", encode_cursor("name:ascending", [1])])
+def test_decode_invalid_cursor(cursor: str):
+    with pytest.raises(AMTValueError):
+        decode_cursor(cursor, "name:ascending", 2)
+
+
+def test_decode_cursor_of_other_sort():
+    cursor = encode_cursor("name:ascending", ["name", 1])
+
+    with pytest.raises(AMTValueError):
+        decode_cursor(cursor, "name:descending", 2)
+
+
+def test_decode_cursor_of_other_scope():
+    # given
+    sort_name = scoped_sort_name("name:ascending", "search", {"lifecycle": "DESIGN", "organization-id": "1"})
+    cursor = encode_cursor(sort_name, ["name", 1])
+
+    # when
+    same_scope = scoped_sort_name("name:ascending", "search", {"organization-id": "1", "lifecycle": "DESIGN"})
+    other_scope = scoped_sort_name("name:ascending", "search", {"organization-id": "2", "lifecycle": "DESIGN"})
+
+    # then
+    assert decode_cursor(cursor, same_scope, 2) == ["name", 1]
+    with pytest.raises(AMTValueError):
+        decode_cursor(cursor, other_scope, 2)
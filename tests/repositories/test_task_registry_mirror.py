@@ -0,0 +1,133 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+from amt.clients.clients import TaskRegistryAPIClient, TaskType
+from amt.core.exceptions import AMTNotFound
+from amt.repositories.task_registry import TaskRegistryRepository
+from amt.repositories.task_registry_mirror import TaskRegistryMirror
+from amt.schema.github import RepositoryContent
+
+
+class StandInTaskRegistryAPIClient(TaskRegistryAPIClient):
+    """A local stand-in for the Task Registry, serving tasks from memory."""
+
+    def __init__(self, tasks: dict[TaskType, list[dict[str, Any]]]) -> None:
+        super().__init__()
+        self.tasks = tasks
+        self.calls = 0
+
+    async def get_list_of_task(self, task: TaskType = TaskType.INSTRUMENTS) -> RepositoryContent:
+        self.calls += 1
+        return RepositoryContent.model_validate(
+            [
+                {
+                    "name": item["urn"],
+                    "urn": item["urn"],
+                    "path": item["urn"],
+                    "size": 1,
+                    "download_url": "https://task-registry.rijksapp.nl/" + item["urn"],
+                    "type": "file",
+                }
+                for item in self.tasks.get(task, [])
+            ]
+        )
+
+    async def get_task_by_urn(self, task_type: TaskType, urn: str, version: str = "latest") -> dict[str, Any]:
+        self.calls += 1
+        for item in self.tasks.get(task_type, []):
+            if item["urn"] == urn:
+                return item
+        raise AMTNotFound()
+
+
+def stand_in_tasks() -> dict[TaskType, list[dict[str, Any]]]:
+    return {
+        TaskType.INSTRUMENTS: [{"urn": "urn:instrument:1"}],
+        TaskType.REQUIREMENTS: [{"urn": "urn:requirement:1"}, {"urn": "urn:requirement:2"}],
+        TaskType.MEASURES: [{"urn": "urn:measure:1"}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_sync_fills_mirror_and_persists_snapshot(tmp_path: Path):
+    # given
+    snapshot_file = tmp_path / "mirror.json"
+    mirror = TaskRegistryMirror(StandInTaskRegistryAPIClient(stand_in_tasks()), snapshot_file)
+
+    # when
+    changed = await mirror.sync()
+
+    # then
+    assert changed is True
+    assert mirror.is_loaded
+    assert mirror.get(TaskType.REQUIREMENTS, "urn:requirement:2") == {"urn": "urn:requirement:2"}
+    assert len(mirror.get_all(TaskType.REQUIREMENTS)) == 2
+    assert mirror.get(TaskType.MEASURES, "urn:measure:1", version="1.0") is None
+    assert snapshot_file.is_file()
+
+
+@pytest.mark.asyncio
+async def test_sync_without_changes_keeps_version(tmp_path: Path):
+    # given
+    mirror = TaskRegistryMirror(StandInTaskRegistryAPIClient(stand_in_tasks()), tmp_path / "mirror.json")
+    versions: list[str] = []
+    mirror.add_listener(versions.append)
+    await mirror.sync()
+    version = mirror.version
+
+    # when
+    changed = await mirror.sync()
+
+    # then
+    assert changed is False
+    assert mirror.version == version
+    assert versions == [version]
+
+
+@pytest.mark.asyncio
+async def test_load_restores_snapshot_from_disk(tmp_path: Path):
+    # given
+    snapshot_file = tmp_path / "mirror.json"
+    await TaskRegistryMirror(StandInTaskRegistryAPIClient(stand_in_tasks()), snapshot_file).sync()
+    client = StandInTaskRegistryAPIClient({})
+    mirror = TaskRegistryMirror(client, snapshot_file)
+
+    # when
+    loaded = mirror.load()
+
+    # then
+    assert loaded is True
+    assert mirror.get(TaskType.INSTRUMENTS, "urn:instrument:1") == {"urn": "urn:instrument:1"}
+    assert client.calls == 0
+
+
+def test_load_without_snapshot(tmp_path: Path):
+    # given
+    mirror = TaskRegistryMirror(StandInTaskRegistryAPIClient({}), tmp_path / "missing.json")
+
+    # when
+    loaded = mirror.load()
+
+    # then
+    assert loaded is False
+    assert not mirror.is_loaded
+
+
+@pytest.mark.asyncio
+async def test_repository_serves_tasks_from_mirror(tmp_path: Path):
+    # given
+    client = StandInTaskRegistryAPIClient(stand_in_tasks())
+    mirror = TaskRegistryMirror(client, tmp_path / "mirror.json")
+    await mirror.sync()
+    calls_after_sync = client.calls
+    repository = TaskRegistryRepository(client, mirror)
+
+    # when
+    all_requirements = await repository.fetch_tasks(TaskType.REQUIREMENTS)
+    requirements = await repository.fetch_tasks(TaskType.REQUIREMENTS, ["urn:requirement:2", "urn:requirement:1"])
+
+    # then
+    assert len(all_requirements) == 2
+    assert [requirement["urn"] for requirement in requirements] == ["urn:requirement:2", "urn:requirement:1"]
+    assert client.calls == calls_after_sync
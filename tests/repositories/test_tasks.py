@@ -136,6 +136,40 @@ async def test_find_by_id_when_not_found(db: DatabaseTestUtils):
         await tasks_repository.find_by_id(999)
 
 
+@pytest.mark.asyncio
+async def test_find_by_ids(db: DatabaseTestUtils):
+    # given
+    await db.given([default_task(), default_task(), default_task()])
+    tasks_repository: TasksRepository = TasksRepository(db.get_session())
+
+    # when
+    results = await tasks_repository.find_by_ids([1, 3])
+
+    # then
+    assert sorted(results) == [1, 3]
+    assert results[3].id == 3
+
+    # when/then
+    with pytest.raises(AMTRepositoryError):
+        await tasks_repository.find_by_ids([1, 999])
+
+
+@pytest.mark.asyncio
+async def test_update_sort_orders(db: DatabaseTestUtils):
+    # given
+    await db.given([default_task(sort_order=10), default_task(sort_order=10 + 1e-9), default_task(sort_order=30)])
+    tasks_repository: TasksRepository = TasksRepository(db.get_session())
+    task = await tasks_repository.find_by_id(2)
+
+    # when
+    await tasks_repository.update_sort_orders({1: 10, 2: 20})
+
+    # then
+    assert task.sort_order == 20
+    results = await tasks_repository.find_all()
+    assert sorted((result.id, result.sort_order) for result in results) == [(1, 10), (2, 20), (3, 30)]
+
+
 @pytest.mark.asyncio
 async def test_find_by_status_id(db: DatabaseTestUtils):
     task = default_task(status_id=Status.TODO)
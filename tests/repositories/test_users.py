@@ -6,6 +6,7 @@ import pytest
 from amt.core.exceptions import AMTRepositoryError
 from amt.repositories.users import UsersRepository
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from tests.constants import default_organization, default_user
 from tests.database_test_utils import DatabaseTestUtils
 
@@ -63,6 +64,54 @@ async def test_find_by_id_cached(db: DatabaseTestUtils):
     assert id(result1) == id(result2)  # Same object reference if cached
 
 
+@pytest.mark.asyncio
+async def test_find_by_ids(db: DatabaseTestUtils):
+    # given
+    user1 = default_user(name="Alice Smith")
+    user2 = default_user(id=uuid4(), name="Bob Jones")
+    await db.given([user1, user2, default_organization()])
+    await db.init_authorizations_and_roles()
+    session = db.get_session()
+    users_repository = UsersRepository(session)
+    cached_user = await users_repository.find_by_id(user1.id)
+    execute = spy_on_execute(session)
+
+    # when
+    result = await users_repository.find_by_ids([str(user1.id), user2.id, user2.id, uuid4()])
+
+    # then
+    assert set(result) == {user1.id, user2.id}
+    assert result[user1.id] is cached_user
+    assert result[user2.id].name == "Bob Jones"
+    assert execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_find_by_ids_cached(db: DatabaseTestUtils):
+    # given
+    await db.given([default_user(), default_organization()])
+    await db.init_authorizations_and_roles()
+    session = db.get_session()
+    users_repository = UsersRepository(session)
+    await users_repository.find_by_ids([default_user().id])
+    execute = spy_on_execute(session)
+
+    # when
+    result = await users_repository.find_by_ids([default_user().id])
+    empty_result = await users_repository.find_by_ids([])
+
+    # then
+    assert list(result) == [default_user().id]
+    assert empty_result == {}
+    assert execute.await_count == 0
+
+
+def spy_on_execute(session: AsyncSession) -> AsyncMock:
+    execute = AsyncMock(side_effect=session.execute)
+    session.execute = execute
+    return execute
+
+
 @pytest.mark.asyncio
 async def test_upsert_new(db: DatabaseTestUtils):
     new_user = default_user()
@@ -169,7 +218,7 @@ async def test_find_all_with_sort_descending(db: DatabaseTestUtils):
 
 
 @pytest.mark.asyncio
-async def test_find_all_with_skip_and_limit(db: DatabaseTestUtils):
+async def test_find_all_with_limit(db: DatabaseTestUtils):
     # given
     user1 = default_user(name="A User")
     user2 = default_user(id=uuid4(), name="B User")
@@ -179,8 +228,8 @@ async def test_find_all_with_skip_and_limit(db: DatabaseTestUtils):
     users_repository = UsersRepository(db.get_session())
 
     # when - using deprecated method intentionally for testing
-    results = await users_repository.find_all(sort={"name": "ascending"}, skip=1, limit=1)
+    results = await users_repository.find_all(sort={"name": "ascending"}, limit=1)
 
     # then
     assert len(results) == 1
-    assert results[0].name == "B User"
+    assert results[0].name == "A User"
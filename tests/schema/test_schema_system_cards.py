@@ -1,4 +1,6 @@
 import pytest
+from amt.schema.measure import MeasureTask
+from amt.schema.requirement import RequirementTask
 from amt.schema.system_card import SystemCard
 from tests.constants import default_systemcard_dic
 
@@ -20,3 +22,44 @@ def test_system_card_update(setup: SystemCard) -> None:
     expected["name"] = "IAMA 1.1"
     system_card.name = "IAMA 1.1"
     assert system_card.model_dump(exclude_none=False) == expected
+
+
+def test_find_measure(setup: SystemCard) -> None:
+    # given
+    system_card = setup
+    first = MeasureTask(urn="urn:a", version="1.0", value="first")
+    system_card.measures = [first, MeasureTask(urn="urn:b", version="1.0"), MeasureTask(urn="urn:a", version="1.0")]
+
+    # when / then
+    assert system_card.find_measure("urn:a") is first
+    assert system_card.find_measure("urn:c") is None
+
+    # when the list is changed the index is built again
+    system_card.measures.append(MeasureTask(urn="urn:c", version="1.0"))
+    assert system_card.find_measure("urn:c") is not None
+    system_card.measures = []
+    assert system_card.find_measure("urn:a") is None
+
+
+def test_find_requirement(setup: SystemCard) -> None:
+    # given
+    system_card = setup
+    requirement = RequirementTask(urn="urn:r", version="1.0")
+    system_card.requirements = [requirement]
+
+    # when / then
+    assert system_card.find_requirement("urn:r") is requirement
+    assert system_card.find_requirement("urn:a") is None
+
+
+def test_find_does_not_change_equality(setup: SystemCard) -> None:
+    # given
+    system_card = setup
+    system_card.measures = [MeasureTask(urn="urn:a", version="1.0")]
+    other = system_card.model_copy(deep=True)
+
+    # when
+    system_card.find_measure("urn:a")
+
+    # then
+    assert system_card == other
@@ -0,0 +1,179 @@
+import pytest
+from amt.schema.measure import Measure, MeasureTask
+from amt.schema.requirement import Requirement, RequirementAiActProfile, RequirementTask
+from amt.schema.system_card import SystemCard
+from amt.services.requirement_states import (
+    RequirementGraph,
+    RequirementGraphCache,
+    RequirementStates,
+    get_requirement_graph,
+)
+from pytest_mock import MockerFixture
+
+
+def _measure(urn: str, links: list[str]) -> Measure:
+    return Measure(name=urn, urn=urn, description="", url="", schema_version="1.1.0", links=links)
+
+
+def _requirement(urn: str, links: list[str]) -> Requirement:
+    return Requirement(
+        name=urn,
+        urn=urn,
+        description="description",
+        schema_version="1.1.0",
+        links=links,
+        always_applicable=1,
+        ai_act_profile=[
+            RequirementAiActProfile(
+                type=[],
+                open_source=[],
+                risk_group=[],
+                systemic_risk=[],
+                transparency_obligations=[],
+                conformity_assessment_body=[],
+                role=[],
+            )
+        ],
+    )
+
+
+def _graph() -> RequirementGraph:
+    graph = RequirementGraph()
+    graph.add(
+        ["urn:measure:1", "urn:measure:2", "urn:measure:3"],
+        [
+            _measure("urn:measure:1", ["urn:requirement:1", "urn:requirement:2", "urn:requirement:unknown"]),
+            _measure("urn:measure:2", ["urn:requirement:1"]),
+            _measure("urn:measure:3", ["urn:requirement:2"]),
+        ],
+        [
+            _requirement("urn:requirement:1", ["urn:measure:1", "urn:measure:2"]),
+            _requirement("urn:requirement:2", ["urn:measure:1", "urn:measure:3"]),
+        ],
+    )
+    return graph
+
+
+def _system_card() -> SystemCard:
+    return SystemCard(
+        requirements=[
+            RequirementTask(urn="urn:requirement:1", version="1.0"),
+            RequirementTask(urn="urn:requirement:2", version="1.0"),
+        ],
+        measures=[
+            MeasureTask(urn="urn:measure:1", version="1.0", state="to do"),
+            MeasureTask(urn="urn:measure:2", version="1.0", state="to do"),
+            MeasureTask(urn="urn:measure:3", version="1.0", state="done"),
+        ],
+    )
+
+
+def test_requirement_graph():
+    # given
+    graph = _graph()
+
+    # then
+    assert graph.requirements_of("urn:measure:1") == ("urn:requirement:1", "urn:requirement:2")
+    assert graph.measures_of("urn:requirement:2") == frozenset({"urn:measure:1", "urn:measure:3"})
+    assert graph.requirements_of("urn:measure:unknown") == ()
+    assert not graph.has_requirement("urn:requirement:unknown")
+
+
+def test_requirement_states_measure_changed():
+    # given
+    system_card = _system_card()
+    requirement_states = RequirementStates(_graph(), system_card)
+
+    # when
+    requirement_tasks = requirement_states.measure_changed("urn:measure:1")
+
+    # then
+    assert [requirement_task.urn for requirement_task in requirement_tasks] == [
+        "urn:requirement:1",
+        "urn:requirement:2",
+    ]
+    assert system_card.requirements[0].state == "to do"
+    assert system_card.requirements[1].state == "in progress"
+
+    # when
+    system_card.measures[0].state = "done"
+    requirement_states.measure_changed("urn:measure:1")
+
+    # then
+    assert system_card.requirements[0].state == "in progress"
+    assert system_card.requirements[1].state == "done"
+
+    # when
+    system_card.measures[1].state = "done"
+    requirement_states.measure_changed("urn:measure:2")
+
+    # then
+    assert system_card.requirements[0].state == "done"
+    assert system_card.requirements[1].state == "done"
+
+
+def test_requirement_states_counts_each_requirement_once(mocker: MockerFixture):
+    # given
+    system_card = _system_card()
+    requirement_states = RequirementStates(_graph(), system_card)
+    count_spy = mocker.spy(requirement_states, "_count")
+
+    # when
+    for state in ("in progress", "in review", "done"):
+        system_card.measures[0].state = state
+        requirement_states.measure_changed("urn:measure:1")
+
+    # then
+    assert count_spy.call_count == 2
+    assert system_card.requirements[1].state == "done"
+
+
+@pytest.mark.asyncio
+async def test_get_requirement_graph_is_reused_per_registry_version(mocker: MockerFixture):
+    # given
+    mock_requirements_service = mocker.AsyncMock()
+    mock_measures_service = mocker.AsyncMock()
+    mocker.patch("amt.services.requirement_states.requirements_service", new=mock_requirements_service)
+    mocker.patch("amt.services.requirement_states.measures_service", new=mock_measures_service)
+    mocker.patch("amt.services.requirement_states._graph_cache", new=RequirementGraphCache())
+    mock_requirements_service.registry_version = "version-1"
+    mock_measures_service.fetch_measures.return_value = [_measure("urn:measure:1", ["urn:requirement:1"])]
+    mock_requirements_service.fetch_requirements.return_value = [_requirement("urn:requirement:1", ["urn:measure:1"])]
+
+    # when
+    first = await get_requirement_graph(["urn:measure:1"])
+    second = await get_requirement_graph(["urn:measure:1"])
+
+    # then
+    assert first is second
+    assert first.requirements_of("urn:measure:1") == ("urn:requirement:1",)
+    mock_measures_service.fetch_measures.assert_awaited_once_with(["urn:measure:1"])
+    mock_requirements_service.fetch_requirements.assert_awaited_once_with(["urn:requirement:1"])
+
+    # when
+    mock_requirements_service.registry_version = "version-2"
+    third = await get_requirement_graph(["urn:measure:1"])
+
+    # then
+    assert third is not first
+    assert mock_measures_service.fetch_measures.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_requirement_graph_without_registry_version(mocker: MockerFixture):
+    # given
+    mock_requirements_service = mocker.AsyncMock()
+    mock_measures_service = mocker.AsyncMock()
+    mocker.patch("amt.services.requirement_states.requirements_service", new=mock_requirements_service)
+    mocker.patch("amt.services.requirement_states.measures_service", new=mock_measures_service)
+    mock_requirements_service.registry_version = None
+    mock_measures_service.fetch_measures.return_value = []
+
+    # when
+    first = await get_requirement_graph(["urn:measure:unknown"])
+    second = await get_requirement_graph(["urn:measure:unknown"])
+
+    # then
+    assert first is not second
+    assert first.has_measure("urn:measure:unknown")
+    mock_requirements_service.fetch_requirements.assert_not_awaited()
@@ -1,3 +1,5 @@
+from typing import Any
+
 import pytest
 from amt.schema.ai_act_profile import AiActProfile
 from amt.schema.measure import Measure
@@ -12,7 +14,14 @@ from amt.schema.requirement import (
     TransparencyObligationEnum,
     TypeEnum,
 )
-from amt.services.task_registry import get_requirements_and_measures, is_requirement_applicable
+from amt.services.task_registry import (
+    ApplicabilityCache,
+    RequirementApplicabilityIndex,
+    get_applicability_index,
+    get_requirements_and_measures,
+    is_requirement_applicable,
+    precompute_requirements_and_measures,
+)
 from pytest_mock import MockerFixture
 
 
@@ -245,7 +254,7 @@ async def test_get_requirements_and_measures_no_applicable_requirements(mocker:
 
     mocker.patch("amt.services.task_registry.requirements_service", new=mock_requirements_service)
     mocker.patch("amt.services.task_registry.measures_service", new=mock_measures_service)
-    mocker.patch("amt.services.task_registry.is_requirement_applicable", return_value=False)
+    mock_requirements_service.registry_version = None
 
     mock_requirements_service.fetch_requirements.return_value = [
         Requirement(
@@ -253,11 +262,11 @@ async def test_get_requirements_and_measures_no_applicable_requirements(mocker:
             urn="urn:requirement:1",
             description="description",
             schema_version="1.1.0",
-            links=[],
+            links=["urn:measure:1"],
             always_applicable=0,
             ai_act_profile=[
                 RequirementAiActProfile(
-                    type=[],
+                    type=[TypeEnum.AI_systeem],
                     risk_group=[],
                     role=[],
                     open_source=[],
@@ -286,7 +295,7 @@ async def test_get_requirements_and_measures_single_requirement_with_measures(mo
 
     mocker.patch("amt.services.task_registry.requirements_service", new=mock_requirements_service)
     mocker.patch("amt.services.task_registry.measures_service", new=mock_measures_service)
-    mocker.patch("amt.services.task_registry.is_requirement_applicable", return_value=True)
+    mock_requirements_service.registry_version = None
 
     mock_requirements_service.fetch_requirements.return_value = [
         Requirement(
@@ -310,9 +319,9 @@ async def test_get_requirements_and_measures_single_requirement_with_measures(mo
         ),
     ]
 
-    mock_measures_service.fetch_measures.side_effect = [
-        [Measure(name="name 1", urn="measure:urn:1", description="", url="", schema_version="1.1.0")],
-        [Measure(name="name 2", urn="measure:urn:2", description="", url="", schema_version="1.1.0")],
+    mock_measures_service.fetch_measures.return_value = [
+        Measure(name="name 1", urn="urn:measure:1", description="", url="", schema_version="1.1.0"),
+        Measure(name="name 2", urn="urn:measure:2", description="", url="", schema_version="1.1.0"),
     ]
 
     ai_act_profile = AiActProfile()
@@ -333,7 +342,7 @@ async def test_get_requirements_and_measures_duplicate_measure_urns(mocker: Mock
 
     mocker.patch("amt.services.task_registry.requirements_service", new=mock_requirements_service)
     mocker.patch("amt.services.task_registry.measures_service", new=mock_measures_service)
-    mocker.patch("amt.services.task_registry.is_requirement_applicable", return_value=True)
+    mock_requirements_service.registry_version = None
 
     mock_requirements_service.fetch_requirements.return_value = [
         Requirement(
@@ -376,10 +385,10 @@ async def test_get_requirements_and_measures_duplicate_measure_urns(mocker: Mock
         ),
     ]
 
-    mock_measures_service.fetch_measures.side_effect = [
-        [Measure(name="name 1", urn="measure:urn:1", description="", url="", schema_version="1.1.0")],
-        [Measure(name="name 2", urn="measure:urn:2", description="", url="", schema_version="1.1.0")],
-        [Measure(name="name 3", urn="measure:urn:3", description="", url="", schema_version="1.1.0")],
+    mock_measures_service.fetch_measures.return_value = [
+        Measure(name="name 1", urn="urn:measure:1", description="", url="", schema_version="1.1.0"),
+        Measure(name="name 2", urn="urn:measure:2", description="", url="", schema_version="1.1.0"),
+        Measure(name="name 3", urn="urn:measure:3", description="", url="", schema_version="1.1.0"),
     ]
 
     ai_act_profile = AiActProfile()
@@ -391,3 +400,135 @@ async def test_get_requirements_and_measures_duplicate_measure_urns(mocker: Mock
 
     assert len(measures) == 3
     assert {measure.urn for measure in measures} == {"urn:measure:1", "urn:measure:2", "urn:measure:3"}
+    mock_measures_service.fetch_measures.assert_awaited_once_with(["urn:measure:1", "urn:measure:2", "urn:measure:3"])
+
+
+def _requirement(urn: str, always_applicable: int = 0, **restrictions: list[Any]) -> Requirement:
+    profile: dict[str, Any] = {
+        "type": [],
+        "risk_group": [],
+        "role": [],
+        "open_source": [],
+        "systemic_risk": [],
+        "transparency_obligations": [],
+        "conformity_assessment_body": [],
+    }
+    profile.update(restrictions)
+    return Requirement(
+        name=urn,
+        urn=urn,
+        description="description",
+        schema_version="1.1.0",
+        links=[],
+        always_applicable=always_applicable,
+        ai_act_profile=[RequirementAiActProfile(**profile)],
+    )
+
+
+def test_applicability_index_matches_is_requirement_applicable():
+    # given
+    requirements = [
+        _requirement("urn:requirement:1"),
+        _requirement("urn:requirement:2", always_applicable=1, type=[TypeEnum.AI_systeem]),
+        _requirement("urn:requirement:3", type=[TypeEnum.AI_systeem], risk_group=[RiskGroupEnum.hoog_risico_AI]),
+        _requirement("urn:requirement:4", role=[RoleEnum.aanbieder, RoleEnum.importeur]),
+        _requirement("urn:requirement:5", open_source=[OpenSourceEnum.geen_open_source]),
+        _requirement("urn:requirement:6", type=[TypeEnum.impactvol_algoritme], role=[RoleEnum.aanbieder]),
+    ]
+    index = RequirementApplicabilityIndex(requirements)
+    profiles = [
+        AiActProfile(),
+        AiActProfile(type="AI-systeem", risk_group="hoog-risico AI", role=["aanbieder", "gebruiksverantwoordelijke"]),
+        AiActProfile(type="AI-systeem", risk_group="geen hoog-risico AI", open_source="geen open-source"),
+        AiActProfile(type="impactvol algoritme", role="aanbieder"),
+    ]
+
+    for profile in profiles:
+        # when
+        result = index.applicable_requirements(profile)
+
+        # then
+        expected = [requirement for requirement in requirements if is_requirement_applicable(requirement, profile)]
+        assert result == expected
+
+
+@pytest.mark.asyncio
+async def test_applicability_index_is_reused_per_registry_version(mocker: MockerFixture):
+    # given
+    mock_requirements_service = mocker.AsyncMock()
+    mocker.patch("amt.services.task_registry.requirements_service", new=mock_requirements_service)
+    mocker.patch("amt.services.task_registry._applicability_cache", new=ApplicabilityCache())
+    mock_requirements_service.fetch_requirements.return_value = [_requirement("urn:requirement:1")]
+    mock_requirements_service.registry_version = "version-1"
+
+    # when
+    first = await get_applicability_index()
+    second = await get_applicability_index()
+    mock_requirements_service.registry_version = "version-2"
+    third = await get_applicability_index()
+
+    # then
+    assert first is second
+    assert third is not first
+    assert mock_requirements_service.fetch_requirements.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_requirements_and_measures_is_cached_per_profile(mocker: MockerFixture):
+    # given
+    mock_requirements_service = mocker.AsyncMock()
+    mock_measures_service = mocker.AsyncMock()
+    cache = ApplicabilityCache()
+    mocker.patch("amt.services.task_registry.requirements_service", new=mock_requirements_service)
+    mocker.patch("amt.services.task_registry.measures_service", new=mock_measures_service)
+    mocker.patch("amt.services.task_registry._applicability_cache", new=cache)
+    requirement = _requirement("urn:requirement:1", type=[TypeEnum.AI_systeem])
+    requirement.links = ["urn:measure:1"]
+    mock_requirements_service.fetch_requirements.return_value = [requirement]
+    mock_requirements_service.registry_version = "version-1"
+    mock_measures_service.fetch_measures.return_value = [
+        Measure(name="name 1", urn="urn:measure:1", description="", url="", schema_version="1.1.0")
+    ]
+
+    # when
+    _, first_measures = await get_requirements_and_measures(AiActProfile(type="AI-systeem"))
+    first_measures[0].state = "done"
+    requirements, measures = await get_requirements_and_measures(AiActProfile(type="AI-systeem"))
+
+    # then
+    assert [requirement.urn for requirement in requirements] == ["urn:requirement:1"]
+    assert measures[0].state == "to do"
+    mock_requirements_service.fetch_requirements.assert_awaited_once()
+    mock_measures_service.fetch_measures.assert_awaited_once()
+
+    # when
+    cache.invalidate()
+
+    # then
+    assert cache.index is None
+    assert cache.resolutions == {}
+
+
+@pytest.mark.asyncio
+async def test_precompute_requirements_and_measures(mocker: MockerFixture):
+    # given
+    mock_requirements_service = mocker.AsyncMock()
+    mock_measures_service = mocker.AsyncMock()
+    mocker.patch("amt.services.task_registry.requirements_service", new=mock_requirements_service)
+    mocker.patch("amt.services.task_registry.measures_service", new=mock_measures_service)
+    mocker.patch("amt.services.task_registry._applicability_cache", new=ApplicabilityCache())
+    mock_requirements_service.fetch_requirements.return_value = [
+        _requirement("urn:requirement:1"),
+        _requirement("urn:requirement:2", type=[TypeEnum.AI_systeem]),
+        _requirement("urn:requirement:3", role=[RoleEnum.aanbieder]),
+    ]
+    mock_requirements_service.registry_version = "version-1"
+
+    # when
+    resolutions = await precompute_requirements_and_measures()
+    requirements, _ = await get_requirements_and_measures(AiActProfile(type="AI-systeem", role="aanbieder"))
+
+    # then
+    assert resolutions == 4
+    assert len(requirements) == 3
+    mock_requirements_service.fetch_requirements.assert_awaited_once()
@@ -1,11 +1,13 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from unittest.mock import patch
 
 import pytest
+from amt.core.exceptions import AMTNotFound
 from amt.models import Task, User
 from amt.models.algorithm import Algorithm
 from amt.repositories.tasks import TasksRepository
 from amt.schema.instrument import InstrumentTask
+from amt.schema.task import MovedTask
 from amt.services.tasks import TasksService
 
 
@@ -42,17 +44,29 @@ class MockTasksRepository:
         return list(filter(lambda x: x.status_id == status_id, self._tasks))
 
     async def find_by_algorithm_id_and_status_id(self, algorithm_id: int, status_id: int) -> Sequence[Task]:
-        return list(filter(lambda x: x.status_id == status_id and x.algorithm_id == algorithm_id, self._tasks))
+        return sorted(
+            filter(lambda x: x.status_id == status_id and x.algorithm_id == algorithm_id, self._tasks),
+            key=lambda x: x.sort_order,
+        )
 
     async def find_by_id(self, task_id: int) -> Task:
         return next(filter(lambda x: x.id == task_id, self._tasks))
 
+    async def find_by_ids(self, task_ids: Iterable[int]) -> dict[int, Task]:
+        return {task.id: task for task in self._tasks if task.id in task_ids}
+
+    async def update_sort_orders(self, sort_orders: Mapping[int, float]) -> None:
+        for task in self._tasks:
+            if task.id in sort_orders:
+                task.sort_order = sort_orders[task.id]
+
     async def save(self, task: Task) -> Task:
         return task
 
     async def save_all(self, tasks: Sequence[Task]) -> None:
         for task in tasks:
-            self._tasks.append(task)
+            if task not in self._tasks:
+                self._tasks.append(task)
         return None
 
 
@@ -161,3 +175,72 @@ async def test_move_task(tasks_service_with_mock: TasksService, mock_tasks_repos
     await tasks_service_with_mock.move_task(2, 1, None, 1)
     task = await mock_tasks_repository.find_by_id(2)
     assert task.sort_order == 5
+
+
+@pytest.mark.asyncio
+async def test_move_task_renumbers_column_without_room(
+    tasks_service_with_mock: TasksService, mock_tasks_repository: MockTasksRepository
+):
+    # given
+    mock_tasks_repository.reset()
+    task_2 = await mock_tasks_repository.find_by_id(2)
+    task_2.sort_order = 10 + 1e-7
+
+    # when
+    await tasks_service_with_mock.move_task(4, 1, 1, 2)
+
+    # then
+    tasks = await mock_tasks_repository.find_by_algorithm_id_and_status_id(1, 1)
+    assert sorted((task.sort_order, task.id) for task in tasks) == [(10, 1), (20, 4), (30, 2)]
+
+    # when
+    await tasks_service_with_mock.move_task(2, 1, None, 1)
+
+    # then
+    assert (await mock_tasks_repository.find_by_id(2)).sort_order == 5
+
+    # given
+    (await mock_tasks_repository.find_by_id(2)).sort_order = 0
+
+    # when
+    await tasks_service_with_mock.move_task(4, 1, None, 2)
+
+    # then
+    tasks = await mock_tasks_repository.find_by_algorithm_id_and_status_id(1, 1)
+    assert sorted((task.sort_order, task.id) for task in tasks) == [(10, 4), (20, 2), (30, 1)]
+
+
+@pytest.mark.asyncio
+async def test_move_tasks(tasks_service_with_mock: TasksService, mock_tasks_repository: MockTasksRepository):
+    # given
+    mock_tasks_repository.reset()
+    find_by_ids_spy = patch.object(mock_tasks_repository, "find_by_ids", wraps=mock_tasks_repository.find_by_ids)
+
+    # when
+    with find_by_ids_spy as find_by_ids:
+        tasks = await tasks_service_with_mock.move_tasks(
+            [
+                MovedTask(taskId=1, statusId=2, previousSiblingId=4),
+                MovedTask(taskId=2, statusId=2, previousSiblingId=4, nextSiblingId=1),
+            ]
+        )
+
+    # then
+    find_by_ids.assert_called_once()
+    assert [(task.id, task.status_id, task.sort_order) for task in tasks] == [(1, 2, 20), (2, 2, 15)]
+
+
+@pytest.mark.asyncio
+async def test_move_tasks_of_other_algorithm(
+    tasks_service_with_mock: TasksService, mock_tasks_repository: MockTasksRepository
+):
+    # given
+    mock_tasks_repository.reset()
+
+    # when/then
+    with pytest.raises(AMTNotFound):
+        await tasks_service_with_mock.move_tasks([MovedTask(taskId=3, statusId=2)], algorithm_id=1)
+    with pytest.raises(AMTNotFound):
+        await tasks_service_with_mock.move_task(1, 1, 3, None, algorithm_id=1)
+    assert (await mock_tasks_repository.find_by_id(3)).status_id == 1
+    assert (await mock_tasks_repository.find_by_id(1)).sort_order == 10
@@ -44,3 +44,20 @@ async def test_create_or_update(mocker: MockFixture):
     assert retreived_user.id == user.id
     assert retreived_user.name == user.name
     users_service.repository.upsert.assert_awaited_once_with(user)  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_find_by_ids(mocker: MockFixture):
+    # Given
+    user = default_user()
+    users_service = UsersService(
+        repository=mocker.AsyncMock(spec=UsersRepository),
+    )
+    users_service.repository.find_by_ids.return_value = {user.id: user}  # type: ignore
+
+    # When
+    users = await users_service.find_by_ids([user.id])
+
+    # Then
+    assert users == {user.id: user}
+    users_service.repository.find_by_ids.assert_awaited_once_with([user.id])  # type: ignore